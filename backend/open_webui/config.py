@@ -848,6 +848,20 @@ AZURE_STORAGE_ENDPOINT = os.environ.get("AZURE_STORAGE_ENDPOINT", None)
 AZURE_STORAGE_CONTAINER_NAME = os.environ.get("AZURE_STORAGE_CONTAINER_NAME", None)
 AZURE_STORAGE_KEY = os.environ.get("AZURE_STORAGE_KEY", None)
 
+# Local copies of S3/GCS/Azure files kept in UPLOAD_DIR (0 disables the size bound)
+STORAGE_LOCAL_CACHE_MAX_SIZE_MB = int(
+    os.environ.get("STORAGE_LOCAL_CACHE_MAX_SIZE_MB", "10240")
+)
+# Seconds a local copy is trusted before it is validated against the remote ETag/size
+STORAGE_LOCAL_CACHE_VALIDATION_TTL = int(
+    os.environ.get("STORAGE_LOCAL_CACHE_VALIDATION_TTL", "300")
+)
+# Size of the parts streamed to S3 multipart, GCS resumable and Azure block uploads
+# (S3 requires at least 5 MB per part)
+STORAGE_UPLOAD_PART_SIZE_MB = max(
+    int(os.environ.get("STORAGE_UPLOAD_PART_SIZE_MB", "8")), 5
+)
+
 ####################################
 # File Upload DIR
 ####################################
@@ -1580,6 +1594,20 @@ JSON format: { "follow_ups": ["Question 1?", "Question 2?", "Question 3?"] }
 {{MESSAGES:END:6}}
 </chat_history>"""
 
+DEFAULT_CHAT_TASKS_GENERATION_PROMPT_TEMPLATE = """### Task:
+Analyze the chat history and generate all of the following in a single response:
+{{TASKS}}
+### Guidelines:
+- Use the chat's primary language; default to English if multilingual.
+- Prioritize accuracy over excessive creativity; keep it clear and simple.
+- Your entire response must consist solely of a single raw JSON object, without any markdown code fences, introductory or concluding text.
+### Output:
+JSON format: {{OUTPUT_FORMAT}}
+### Chat History:
+<chat_history>
+{{MESSAGES:END:6}}
+</chat_history>"""
+
 ENABLE_FOLLOW_UP_GENERATION = PersistentConfig(
     "ENABLE_FOLLOW_UP_GENERATION",
     "task.follow_up.enable",
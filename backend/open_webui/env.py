@@ -489,6 +489,50 @@ else:
     except Exception:
         MODELS_CACHE_TTL = 1
 
+# Coalesce concurrent OpenAI/Ollama model list fetches across processes through a Redis lock
+ENABLE_SINGLEFLIGHT_REDIS_LOCK = (
+    os.environ.get("ENABLE_SINGLEFLIGHT_REDIS_LOCK", "False").lower() == "true"
+)
+
+SINGLEFLIGHT_REDIS_LOCK_TIMEOUT = os.environ.get(
+    "SINGLEFLIGHT_REDIS_LOCK_TIMEOUT", "30"
+)
+if SINGLEFLIGHT_REDIS_LOCK_TIMEOUT == "":
+    SINGLEFLIGHT_REDIS_LOCK_TIMEOUT = 30
+else:
+    try:
+        SINGLEFLIGHT_REDIS_LOCK_TIMEOUT = int(SINGLEFLIGHT_REDIS_LOCK_TIMEOUT)
+    except Exception:
+        SINGLEFLIGHT_REDIS_LOCK_TIMEOUT = 30
+
+
+####################################
+# TASKS
+####################################
+
+# Cache task model results (titles, tags, queries, autocompletion, ...) for identical prompts
+ENABLE_TASK_RESULT_CACHE = (
+    os.environ.get("ENABLE_TASK_RESULT_CACHE", "True").lower() == "true"
+)
+
+TASK_RESULT_CACHE_TTL = os.environ.get("TASK_RESULT_CACHE_TTL", "600")
+if TASK_RESULT_CACHE_TTL == "":
+    TASK_RESULT_CACHE_TTL = 600
+else:
+    try:
+        TASK_RESULT_CACHE_TTL = int(TASK_RESULT_CACHE_TTL)
+    except Exception:
+        TASK_RESULT_CACHE_TTL = 600
+
+TASK_RESULT_CACHE_MAX_SIZE = os.environ.get("TASK_RESULT_CACHE_MAX_SIZE", "1000")
+if TASK_RESULT_CACHE_MAX_SIZE == "":
+    TASK_RESULT_CACHE_MAX_SIZE = 1000
+else:
+    try:
+        TASK_RESULT_CACHE_MAX_SIZE = int(TASK_RESULT_CACHE_MAX_SIZE)
+    except Exception:
+        TASK_RESULT_CACHE_MAX_SIZE = 1000
+
 
 ####################################
 # CHAT
@@ -509,6 +553,65 @@ else:
         CHAT_RESPONSE_STREAM_DELTA_CHUNK_SIZE = 1
 
 
+# Send append-only content deltas to socket clients that negotiate support for them
+ENABLE_CHAT_RESPONSE_DELTA_EVENTS = (
+    os.environ.get("ENABLE_CHAT_RESPONSE_DELTA_EVENTS", "True").lower() == "true"
+)
+
+# Number of delta events between full content snapshots
+CHAT_RESPONSE_DELTA_SNAPSHOT_INTERVAL = os.environ.get(
+    "CHAT_RESPONSE_DELTA_SNAPSHOT_INTERVAL", "100"
+)
+
+if CHAT_RESPONSE_DELTA_SNAPSHOT_INTERVAL == "":
+    CHAT_RESPONSE_DELTA_SNAPSHOT_INTERVAL = 100
+else:
+    try:
+        CHAT_RESPONSE_DELTA_SNAPSHOT_INTERVAL = int(
+            CHAT_RESPONSE_DELTA_SNAPSHOT_INTERVAL
+        )
+    except Exception:
+        CHAT_RESPONSE_DELTA_SNAPSHOT_INTERVAL = 100
+
+
+# Timeouts in seconds for the pre-completion stages (memory, queries, web_search,
+# image_generation, tools, files), e.g. {"default": 60, "queries": 10}
+CHAT_PAYLOAD_STAGE_TIMEOUTS = os.environ.get("CHAT_PAYLOAD_STAGE_TIMEOUTS", "")
+
+if CHAT_PAYLOAD_STAGE_TIMEOUTS == "":
+    CHAT_PAYLOAD_STAGE_TIMEOUTS = {}
+else:
+    try:
+        CHAT_PAYLOAD_STAGE_TIMEOUTS = {
+            str(k): float(v) for k, v in json.loads(CHAT_PAYLOAD_STAGE_TIMEOUTS).items()
+        }
+    except Exception:
+        CHAT_PAYLOAD_STAGE_TIMEOUTS = {}
+
+
+# Shared deadline in seconds for the title, tags and follow-up tasks that run after a response
+CHAT_BACKGROUND_TASKS_TIMEOUT = os.environ.get("CHAT_BACKGROUND_TASKS_TIMEOUT", "120")
+
+if CHAT_BACKGROUND_TASKS_TIMEOUT == "":
+    CHAT_BACKGROUND_TASKS_TIMEOUT = None
+else:
+    try:
+        CHAT_BACKGROUND_TASKS_TIMEOUT = float(CHAT_BACKGROUND_TASKS_TIMEOUT)
+        if CHAT_BACKGROUND_TASKS_TIMEOUT <= 0:
+            CHAT_BACKGROUND_TASKS_TIMEOUT = None
+    except Exception:
+        CHAT_BACKGROUND_TASKS_TIMEOUT = 120.0
+
+# Generate the title, tags and follow-ups with one structured task call instead of three
+ENABLE_COMBINED_CHAT_TASKS_GENERATION = (
+    os.environ.get("ENABLE_COMBINED_CHAT_TASKS_GENERATION", "False").lower() == "true"
+)
+
+
+# Use orjson (when installed) for stream chunk parsing and socket payloads
+ENABLE_ORJSON = os.environ.get("ENABLE_ORJSON", "True").lower() == "true"
+
+
 ####################################
 # WEBSOCKET SUPPORT
 ####################################
@@ -584,6 +687,195 @@ AIOHTTP_CLIENT_SESSION_TOOL_SERVER_SSL = (
     os.environ.get("AIOHTTP_CLIENT_SESSION_TOOL_SERVER_SSL", "True").lower() == "true"
 )
 
+AIOHTTP_CLIENT_TIMEOUT_TOOL_SERVER = os.environ.get(
+    "AIOHTTP_CLIENT_TIMEOUT_TOOL_SERVER", "300"
+)
+
+if AIOHTTP_CLIENT_TIMEOUT_TOOL_SERVER == "":
+    AIOHTTP_CLIENT_TIMEOUT_TOOL_SERVER = None
+else:
+    try:
+        AIOHTTP_CLIENT_TIMEOUT_TOOL_SERVER = int(AIOHTTP_CLIENT_TIMEOUT_TOOL_SERVER)
+    except Exception:
+        AIOHTTP_CLIENT_TIMEOUT_TOOL_SERVER = 300
+
+# Maximum number of concurrent requests to a single tool server
+TOOL_SERVER_MAX_CONCURRENCY = os.environ.get("TOOL_SERVER_MAX_CONCURRENCY", "10")
+
+try:
+    TOOL_SERVER_MAX_CONCURRENCY = max(int(TOOL_SERVER_MAX_CONCURRENCY), 1)
+except Exception:
+    TOOL_SERVER_MAX_CONCURRENCY = 10
+
+# Execute the tool calls of a single model turn concurrently
+ENABLE_CONCURRENT_TOOL_CALLS = (
+    os.environ.get("ENABLE_CONCURRENT_TOOL_CALLS", "True").lower() == "true"
+)
+
+# Seconds a fetched tool server OpenAPI spec is used before it is revalidated in the background
+TOOL_SERVER_SPEC_CACHE_TTL = os.environ.get("TOOL_SERVER_SPEC_CACHE_TTL", "300")
+
+if TOOL_SERVER_SPEC_CACHE_TTL == "":
+    TOOL_SERVER_SPEC_CACHE_TTL = 0
+else:
+    try:
+        TOOL_SERVER_SPEC_CACHE_TTL = int(TOOL_SERVER_SPEC_CACHE_TTL)
+    except Exception:
+        TOOL_SERVER_SPEC_CACHE_TTL = 300
+
+
+####################################
+# RETRIEVAL EXECUTOR
+####################################
+
+# Threads shared by all retrieval requests (defaults to the ThreadPoolExecutor sizing)
+RAG_RETRIEVAL_THREAD_POOL_SIZE = os.environ.get("RAG_RETRIEVAL_THREAD_POOL_SIZE", "")
+
+if RAG_RETRIEVAL_THREAD_POOL_SIZE == "":
+    RAG_RETRIEVAL_THREAD_POOL_SIZE = min(32, (os.cpu_count() or 1) + 4)
+else:
+    try:
+        RAG_RETRIEVAL_THREAD_POOL_SIZE = max(1, int(RAG_RETRIEVAL_THREAD_POOL_SIZE))
+    except Exception:
+        RAG_RETRIEVAL_THREAD_POOL_SIZE = min(32, (os.cpu_count() or 1) + 4)
+
+# Worker processes for CPU-bound retrieval stages (BM25), 0 runs them in threads
+RAG_RETRIEVAL_PROCESS_POOL_SIZE = os.environ.get("RAG_RETRIEVAL_PROCESS_POOL_SIZE", "0")
+
+if RAG_RETRIEVAL_PROCESS_POOL_SIZE == "":
+    RAG_RETRIEVAL_PROCESS_POOL_SIZE = 0
+else:
+    try:
+        RAG_RETRIEVAL_PROCESS_POOL_SIZE = int(RAG_RETRIEVAL_PROCESS_POOL_SIZE)
+    except Exception:
+        RAG_RETRIEVAL_PROCESS_POOL_SIZE = 0
+
+# Retrieval requests allowed to wait or run at once before new ones are rejected
+RAG_RETRIEVAL_MAX_QUEUE_SIZE = os.environ.get("RAG_RETRIEVAL_MAX_QUEUE_SIZE", "256")
+
+if RAG_RETRIEVAL_MAX_QUEUE_SIZE == "":
+    RAG_RETRIEVAL_MAX_QUEUE_SIZE = 256
+else:
+    try:
+        RAG_RETRIEVAL_MAX_QUEUE_SIZE = int(RAG_RETRIEVAL_MAX_QUEUE_SIZE)
+    except Exception:
+        RAG_RETRIEVAL_MAX_QUEUE_SIZE = 256
+
+# Retrieval requests a single user may run at once, the rest wait in their own queue
+RAG_RETRIEVAL_MAX_CONCURRENCY_PER_USER = os.environ.get(
+    "RAG_RETRIEVAL_MAX_CONCURRENCY_PER_USER", "2"
+)
+
+if RAG_RETRIEVAL_MAX_CONCURRENCY_PER_USER == "":
+    RAG_RETRIEVAL_MAX_CONCURRENCY_PER_USER = 2
+else:
+    try:
+        RAG_RETRIEVAL_MAX_CONCURRENCY_PER_USER = max(
+            1, int(RAG_RETRIEVAL_MAX_CONCURRENCY_PER_USER)
+        )
+    except Exception:
+        RAG_RETRIEVAL_MAX_CONCURRENCY_PER_USER = 2
+
+
+# Start vector retrieval on the raw user message while retrieval queries are generated
+ENABLE_SPECULATIVE_RETRIEVAL = (
+    os.environ.get("ENABLE_SPECULATIVE_RETRIEVAL", "False").lower() == "true"
+)
+
+# Seconds to wait for generated queries before using the speculative results alone
+SPECULATIVE_RETRIEVAL_QUERY_BUDGET = os.environ.get(
+    "SPECULATIVE_RETRIEVAL_QUERY_BUDGET", "2"
+)
+
+if SPECULATIVE_RETRIEVAL_QUERY_BUDGET == "":
+    SPECULATIVE_RETRIEVAL_QUERY_BUDGET = 2.0
+else:
+    try:
+        SPECULATIVE_RETRIEVAL_QUERY_BUDGET = float(SPECULATIVE_RETRIEVAL_QUERY_BUDGET)
+    except Exception:
+        SPECULATIVE_RETRIEVAL_QUERY_BUDGET = 2.0
+
+
+####################################
+# AUDIO
+####################################
+
+# Worker processes that each load their own faster-whisper model, 0 transcribes in-process
+WHISPER_WORKER_POOL_SIZE = os.environ.get("WHISPER_WORKER_POOL_SIZE", "0")
+
+if WHISPER_WORKER_POOL_SIZE == "":
+    WHISPER_WORKER_POOL_SIZE = 0
+else:
+    try:
+        WHISPER_WORKER_POOL_SIZE = int(WHISPER_WORKER_POOL_SIZE)
+    except Exception:
+        WHISPER_WORKER_POOL_SIZE = 0
+
+# CPU threads per whisper worker, 0 splits the available cores between the workers
+WHISPER_WORKER_CPU_THREADS = os.environ.get("WHISPER_WORKER_CPU_THREADS", "0")
+
+if WHISPER_WORKER_CPU_THREADS == "":
+    WHISPER_WORKER_CPU_THREADS = 0
+else:
+    try:
+        WHISPER_WORKER_CPU_THREADS = max(0, int(WHISPER_WORKER_CPU_THREADS))
+    except Exception:
+        WHISPER_WORKER_CPU_THREADS = 0
+
+# Transcription jobs allowed to wait for a whisper worker before new ones are rejected
+WHISPER_MAX_QUEUE_SIZE = os.environ.get("WHISPER_MAX_QUEUE_SIZE", "64")
+
+if WHISPER_MAX_QUEUE_SIZE == "":
+    WHISPER_MAX_QUEUE_SIZE = 64
+else:
+    try:
+        WHISPER_MAX_QUEUE_SIZE = int(WHISPER_MAX_QUEUE_SIZE)
+    except Exception:
+        WHISPER_MAX_QUEUE_SIZE = 64
+
+# Move the cuts between transcription chunks of long recordings into nearby silences
+AUDIO_SPLIT_ON_SILENCE = (
+    os.environ.get("AUDIO_SPLIT_ON_SILENCE", "False").lower() == "true"
+)
+
+# Size bound of the sentence-level text-to-speech cache, 0 keeps every file
+TTS_CACHE_MAX_SIZE_MB = os.environ.get("TTS_CACHE_MAX_SIZE_MB", "1024")
+
+if TTS_CACHE_MAX_SIZE_MB == "":
+    TTS_CACHE_MAX_SIZE_MB = 1024
+else:
+    try:
+        TTS_CACHE_MAX_SIZE_MB = max(0, int(TTS_CACHE_MAX_SIZE_MB))
+    except Exception:
+        TTS_CACHE_MAX_SIZE_MB = 1024
+
+# Sentences of one speech request synthesized at the same time
+TTS_MAX_CONCURRENT_SYNTHESIS = os.environ.get("TTS_MAX_CONCURRENT_SYNTHESIS", "4")
+
+if TTS_MAX_CONCURRENT_SYNTHESIS == "":
+    TTS_MAX_CONCURRENT_SYNTHESIS = 4
+else:
+    try:
+        TTS_MAX_CONCURRENT_SYNTHESIS = max(1, int(TTS_MAX_CONCURRENT_SYNTHESIS))
+    except Exception:
+        TTS_MAX_CONCURRENT_SYNTHESIS = 4
+
+
+####################################
+# IMAGES
+####################################
+
+# Generated images downloaded at the same time over the shared client session
+IMAGE_DOWNLOAD_MAX_CONCURRENCY = os.environ.get("IMAGE_DOWNLOAD_MAX_CONCURRENCY", "8")
+
+if IMAGE_DOWNLOAD_MAX_CONCURRENCY == "":
+    IMAGE_DOWNLOAD_MAX_CONCURRENCY = 8
+else:
+    try:
+        IMAGE_DOWNLOAD_MAX_CONCURRENCY = max(1, int(IMAGE_DOWNLOAD_MAX_CONCURRENCY))
+    except Exception:
+        IMAGE_DOWNLOAD_MAX_CONCURRENCY = 8
+
 
 ####################################
 # SENTENCE TRANSFORMERS
@@ -746,6 +1038,27 @@ OTEL_LOGS_OTLP_SPAN_EXPORTER = os.environ.get(
 PIP_OPTIONS = os.getenv("PIP_OPTIONS", "").split()
 PIP_PACKAGE_INDEX_OPTIONS = os.getenv("PIP_PACKAGE_INDEX_OPTIONS", "").split()
 
+# Seconds between checks of the in-process function snapshot against the
+# function table (0 disables caching). Rows are only reloaded when they changed.
+FUNCTIONS_CACHE_TTL = os.environ.get("FUNCTIONS_CACHE_TTL", "1")
+if FUNCTIONS_CACHE_TTL == "":
+    FUNCTIONS_CACHE_TTL = 0
+else:
+    try:
+        FUNCTIONS_CACHE_TTL = int(FUNCTIONS_CACHE_TTL)
+    except Exception:
+        FUNCTIONS_CACHE_TTL = 1
+
+# Number of validated user valves objects kept in process memory
+USER_VALVES_CACHE_MAX_SIZE = os.environ.get("USER_VALVES_CACHE_MAX_SIZE", "1000")
+if USER_VALVES_CACHE_MAX_SIZE == "":
+    USER_VALVES_CACHE_MAX_SIZE = 1000
+else:
+    try:
+        USER_VALVES_CACHE_MAX_SIZE = int(USER_VALVES_CACHE_MAX_SIZE)
+    except Exception:
+        USER_VALVES_CACHE_MAX_SIZE = 1000
+
 
 ####################################
 # PROGRESSIVE WEB APP OPTIONS
@@ -32,6 +32,8 @@ from open_webui.models.models import Models
 from open_webui.utils.plugin import (
     load_function_module_by_id,
     get_function_module_from_cache,
+    apply_function_valves,
+    get_user_valves_from_cache,
 )
 from open_webui.utils.tools import get_tools
 from open_webui.utils.access_control import has_access
@@ -58,11 +60,7 @@ log.setLevel(SRC_LOG_LEVELS["MAIN"])
 
 def get_function_module_by_id(request: Request, pipe_id: str):
     function_module, _, _ = get_function_module_from_cache(request, pipe_id)
-
-    if hasattr(function_module, "valves") and hasattr(function_module, "Valves"):
-        valves = Functions.get_function_valves_by_id(pipe_id)
-        function_module.valves = function_module.Valves(**(valves if valves else {}))
-    return function_module
+    return apply_function_valves(request, pipe_id, function_module)
 
 
 async def get_function_models(request):
@@ -187,9 +185,10 @@ async def generate_function_chat_completion(
         }
 
         if "__user__" in params and hasattr(function_module, "UserValves"):
-            user_valves = Functions.get_user_valves_by_id_and_user_id(pipe_id, user.id)
             try:
-                params["__user__"]["valves"] = function_module.UserValves(**user_valves)
+                params["__user__"]["valves"] = get_user_valves_from_cache(
+                    request, "functions", pipe_id, function_module, params["__user__"]
+                )
             except Exception as e:
                 log.exception(e)
                 params["__user__"]["valves"] = function_module.UserValves()
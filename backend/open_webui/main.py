@@ -8,6 +8,7 @@ import shutil
 import sys
 import time
 import random
+from collections import OrderedDict
 from uuid import uuid4
 
 
@@ -433,6 +434,9 @@ from open_webui.env import (
     ENABLE_OTEL,
     EXTERNAL_PWA_MANIFEST_URL,
     AIOHTTP_CLIENT_SESSION_SSL,
+    ENABLE_TASK_RESULT_CACHE,
+    TASK_RESULT_CACHE_TTL,
+    TASK_RESULT_CACHE_MAX_SIZE,
 )
 
 
@@ -447,6 +451,7 @@ from open_webui.utils.chat import (
     chat_action as chat_action_handler,
 )
 from open_webui.utils.embeddings import generate_embeddings
+from open_webui.utils.task_cache import TaskResultCache
 from open_webui.utils.middleware import process_chat_payload, process_chat_response
 from open_webui.utils.access_control import has_access
 
@@ -469,6 +474,8 @@ from open_webui.tasks import (
     list_tasks,
 )  # Import from tasks.py
 
+from open_webui.retrieval.executor import RETRIEVAL_EXECUTOR
+from open_webui.utils.tools import TOOL_SERVER_CLIENT_POOL
 from open_webui.utils.redis import get_sentinels_from_env
 
 
@@ -578,6 +585,13 @@ async def lifespan(app: FastAPI):
     if hasattr(app.state, "redis_task_command_listener"):
         app.state.redis_task_command_listener.cancel()
 
+    RETRIEVAL_EXECUTOR.shutdown()
+    await TOOL_SERVER_CLIENT_POOL.close()
+    await images.close_image_download_session()
+
+    if app.state.WHISPER_WORKER_POOL is not None:
+        app.state.WHISPER_WORKER_POOL.shutdown()
+
 
 app = FastAPI(
     title="Open WebUI",
@@ -760,9 +774,14 @@ app.state.USER_COUNT = None
 
 app.state.TOOLS = {}
 app.state.TOOL_CONTENTS = {}
+app.state.TOOL_VALVES = {}
 
 app.state.FUNCTIONS = {}
 app.state.FUNCTION_CONTENTS = {}
+app.state.FUNCTION_VALVES = {}
+app.state.FUNCTION_ROWS = None
+
+app.state.USER_VALVES = OrderedDict()
 
 ########################################
 #
@@ -1067,6 +1086,7 @@ app.state.config.TTS_AZURE_SPEECH_OUTPUT_FORMAT = AUDIO_TTS_AZURE_SPEECH_OUTPUT_
 
 
 app.state.faster_whisper_model = None
+app.state.WHISPER_WORKER_POOL = None
 app.state.speech_synthesiser = None
 app.state.speech_speaker_embeddings_dataset = None
 
@@ -1110,6 +1130,12 @@ app.state.config.AUTOCOMPLETE_GENERATION_INPUT_MAX_LENGTH = (
     AUTOCOMPLETE_GENERATION_INPUT_MAX_LENGTH
 )
 
+app.state.TASK_RESULT_CACHE = (
+    TaskResultCache(ttl=TASK_RESULT_CACHE_TTL, max_size=TASK_RESULT_CACHE_MAX_SIZE)
+    if ENABLE_TASK_RESULT_CACHE
+    else None
+)
+
 
 ########################################
 #
@@ -1,8 +1,9 @@
+import copy
 import logging
 import json
 import time
 import uuid
-from typing import Optional
+from typing import Iterator, Optional
 
 from open_webui.internal.db import Base, get_db
 from open_webui.models.tags import TagModel, Tag, Tags
@@ -11,7 +12,7 @@ from open_webui.env import SRC_LOG_LEVELS
 
 from pydantic import BaseModel, ConfigDict
 from sqlalchemy import BigInteger, Boolean, Column, String, Text, JSON
-from sqlalchemy import or_, func, select, and_, text
+from sqlalchemy import or_, func, select, and_, text, cast, insert
 from sqlalchemy.sql import exists
 from sqlalchemy.sql.expression import bindparam
 
@@ -185,6 +186,41 @@ class ChatTable:
         except Exception:
             return None
 
+    def update_chat_data_by_id(self, id: str, chat: dict) -> bool:
+        # Rewrites the stored chat without touching its title or updated_at
+        try:
+            with get_db() as db:
+                db.query(Chat).filter_by(id=id).update({"chat": chat})
+                db.commit()
+                return True
+        except Exception:
+            return False
+
+    def has_shared_chat(self, chat_ids: list[str], user_id: str) -> bool:
+        # Whether any of the given chats of `user_id` currently has a share link
+        if not chat_ids:
+            return False
+        with get_db() as db:
+            return (
+                db.query(Chat.id)
+                .filter(
+                    Chat.id.in_(chat_ids),
+                    Chat.user_id == user_id,
+                    Chat.share_id.isnot(None),
+                )
+                .first()
+                is not None
+            )
+
+    def get_chat_ids_with_inline_images(self) -> list[str]:
+        with get_db() as db:
+            return [
+                id
+                for (id,) in db.query(Chat.id).filter(
+                    cast(Chat.chat, Text).like("%data:image%")
+                )
+            ]
+
     def update_chat_title_by_id(self, id: str, title: str) -> Optional[ChatModel]:
         chat = self.get_chat_by_id(id)
         if chat is None:
@@ -215,6 +251,73 @@ class ChatTable:
             self.add_chat_tag_by_id_and_user_id_and_tag_name(id, user.id, tag_name)
         return self.get_chat_by_id(id)
 
+    def update_chat_task_results_by_id(
+        self,
+        id: str,
+        user,
+        title: Optional[str] = None,
+        tags: Optional[list[str]] = None,
+        message_id: Optional[str] = None,
+        message: Optional[dict] = None,
+    ) -> Optional[ChatModel]:
+        # Applies the title, tags and message fields generated by the background
+        # tasks of a response with a single write to the chat row
+        try:
+            tag_ids = None
+            if tags is not None:
+                tag_ids = []
+                for tag_name in tags:
+                    if not isinstance(tag_name, str) or tag_name.lower() == "none":
+                        continue
+
+                    tag = Tags.get_tag_by_name_and_user_id(tag_name, user.id)
+                    if tag is None:
+                        tag = Tags.insert_new_tag(tag_name, user.id)
+                    if tag and tag.id not in tag_ids:
+                        tag_ids.append(tag.id)
+
+            with get_db() as db:
+                chat_item = db.get(Chat, id)
+                if chat_item is None:
+                    return None
+
+                # A deep copy, so the loaded value stays unchanged and the
+                # new JSON is detected as modified
+                chat = copy.deepcopy(chat_item.chat)
+                if message_id and message:
+                    history = chat.get("history", {})
+                    messages = history.get("messages", {})
+                    messages[message_id] = {**messages.get(message_id, {}), **message}
+                    chat["history"] = {**history, "messages": messages}
+
+                if title is not None:
+                    chat["title"] = title
+                    chat_item.title = title
+
+                previous_tag_ids = chat_item.meta.get("tags", [])
+                if tag_ids is not None:
+                    chat_item.meta = {**chat_item.meta, "tags": tag_ids}
+
+                chat_item.chat = chat
+                chat_item.updated_at = int(time.time())
+                db.commit()
+                db.refresh(chat_item)
+
+                chat_model = ChatModel.model_validate(chat_item)
+
+            if tag_ids is not None:
+                for tag in previous_tag_ids:
+                    if (
+                        tag not in tag_ids
+                        and self.count_chats_by_tag_name_and_user_id(tag, user.id) == 0
+                    ):
+                        Tags.delete_tag_by_name_and_user_id(tag, user.id)
+
+            return chat_model
+        except Exception as e:
+            log.exception(e)
+            return None
+
     def get_chat_title_by_id(self, id: str) -> Optional[str]:
         chat = self.get_chat_by_id(id)
         if chat is None:
@@ -564,6 +667,37 @@ class ChatTable:
             )
             return [ChatModel.model_validate(chat) for chat in all_chats]
 
+    def iter_chats(
+        self, user_id: Optional[str] = None, batch_size: int = 100
+    ) -> Iterator[ChatModel]:
+        """
+        Yields chats oldest first, fetching `batch_size` rows at a time so
+        exports don't hold every chat in memory.
+        """
+        with get_db() as db:
+            query = db.query(Chat)
+            if user_id:
+                query = query.filter_by(user_id=user_id)
+
+            for chat in query.order_by(Chat.created_at, Chat.id).yield_per(batch_size):
+                yield ChatModel.model_validate(chat)
+                db.expunge(chat)
+
+    def get_existing_chat_ids(self, ids: list[str]) -> set[str]:
+        if not ids:
+            return set()
+        with get_db() as db:
+            return {id for (id,) in db.query(Chat.id).filter(Chat.id.in_(ids))}
+
+    def insert_chats(self, chats: list[ChatModel]) -> int:
+        """Inserts chats in a single executemany statement."""
+        if not chats:
+            return 0
+        with get_db() as db:
+            db.execute(insert(Chat), [chat.model_dump() for chat in chats])
+            db.commit()
+            return len(chats)
+
     def get_chats_by_user_id(self, user_id: str) -> list[ChatModel]:
         with get_db() as db:
             all_chats = (
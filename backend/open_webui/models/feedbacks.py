@@ -1,14 +1,15 @@
+import base64
 import logging
 import time
 import uuid
-from typing import Optional
+from typing import Iterator, Optional
 
 from open_webui.internal.db import Base, get_db
 from open_webui.models.chats import Chats
 
 from open_webui.env import SRC_LOG_LEVELS
 from pydantic import BaseModel, ConfigDict
-from sqlalchemy import BigInteger, Column, Text, JSON, Boolean
+from sqlalchemy import BigInteger, Column, Text, JSON, Boolean, and_, func, or_
 
 log = logging.getLogger(__name__)
 log.setLevel(SRC_LOG_LEVELS["MODELS"])
@@ -92,6 +93,46 @@ class FeedbackForm(BaseModel):
     model_config = ConfigDict(extra="allow")
 
 
+FEEDBACK_FIELDS = (
+    "id",
+    "user_id",
+    "version",
+    "type",
+    "data",
+    "meta",
+    "snapshot",
+    "created_at",
+    "updated_at",
+)
+
+# Chat snapshots are by far the largest part of a feedback, only load them on request
+DEFAULT_FEEDBACK_FIELDS = tuple(
+    field for field in FEEDBACK_FIELDS if field != "snapshot"
+)
+
+
+def get_feedback_columns(fields: Optional[list[str]] = None) -> list[str]:
+    fields = [field for field in (fields or DEFAULT_FEEDBACK_FIELDS) if field]
+    unknown = set(fields) - set(FEEDBACK_FIELDS)
+    if unknown:
+        raise ValueError(f"Unknown feedback fields: {', '.join(sorted(unknown))}")
+    return ["id", *dict.fromkeys(field for field in fields if field != "id")]
+
+
+def encode_feedback_cursor(updated_at: int, id: str) -> str:
+    return base64.urlsafe_b64encode(f"{updated_at}:{id}".encode()).decode()
+
+
+def decode_feedback_cursor(cursor: str) -> tuple[int, str]:
+    try:
+        updated_at, id = (
+            base64.urlsafe_b64decode(cursor.encode()).decode().split(":", 1)
+        )
+        return int(updated_at), id
+    except Exception:
+        raise ValueError("Invalid cursor")
+
+
 class FeedbackTable:
     def insert_new_feedback(
         self, user_id: str, form_data: FeedbackForm
@@ -143,15 +184,95 @@ class FeedbackTable:
         except Exception:
             return None
 
-    def get_all_feedbacks(self) -> list[FeedbackModel]:
+    def get_all_feedbacks(self, include_snapshot: bool = True) -> list[FeedbackModel]:
+        columns = get_feedback_columns(
+            FEEDBACK_FIELDS if include_snapshot else DEFAULT_FEEDBACK_FIELDS
+        )
         with get_db() as db:
             return [
-                FeedbackModel.model_validate(feedback)
-                for feedback in db.query(Feedback)
+                FeedbackModel(**dict(zip(columns, row)))
+                for row in db.query(*[getattr(Feedback, column) for column in columns])
                 .order_by(Feedback.updated_at.desc())
                 .all()
             ]
 
+    def get_feedback_signature(self) -> tuple[int, Optional[int]]:
+        # Changes whenever a feedback is inserted, updated or deleted
+        with get_db() as db:
+            count, last_updated_at = db.query(
+                func.count(Feedback.id), func.max(Feedback.updated_at)
+            ).one()
+            return count, last_updated_at
+
+    def get_rating_feedback_fields(self) -> list[tuple]:
+        # Only the columns the leaderboard needs, without the chat snapshots
+        with get_db() as db:
+            return [
+                tuple(row)
+                for row in db.query(
+                    Feedback.id, Feedback.data, Feedback.meta, Feedback.created_at
+                ).filter_by(type="rating")
+            ]
+
+    def get_feedbacks_page(
+        self,
+        limit: int = 50,
+        cursor: Optional[str] = None,
+        fields: Optional[list[str]] = None,
+        user_id: Optional[str] = None,
+    ) -> tuple[list[dict], Optional[str]]:
+        """
+        Returns up to `limit` feedbacks, most recently updated first, with only
+        the requested columns, and the cursor of the next page (None on the
+        last page). Pages are keyed on (updated_at, id), so they stay stable
+        while feedback is being added.
+        """
+        columns = get_feedback_columns(fields)
+        query_columns = dict.fromkeys([*columns, "updated_at"])
+
+        with get_db() as db:
+            query = db.query(*[getattr(Feedback, column) for column in query_columns])
+            if user_id:
+                query = query.filter(Feedback.user_id == user_id)
+            if cursor:
+                updated_at, id = decode_feedback_cursor(cursor)
+                query = query.filter(
+                    or_(
+                        Feedback.updated_at < updated_at,
+                        and_(Feedback.updated_at == updated_at, Feedback.id < id),
+                    )
+                )
+
+            rows = (
+                query.order_by(Feedback.updated_at.desc(), Feedback.id.desc())
+                .limit(limit + 1)
+                .all()
+            )
+
+        next_cursor = None
+        if len(rows) > limit:
+            rows = rows[:limit]
+            last = dict(zip(query_columns, rows[-1]))
+            next_cursor = encode_feedback_cursor(last["updated_at"], last["id"])
+
+        items = []
+        for row in rows:
+            item = dict(zip(query_columns, row))
+            items.append({column: item[column] for column in columns})
+        return items, next_cursor
+
+    def iter_feedbacks(
+        self, fields: Optional[list[str]] = None, batch_size: int = 100
+    ) -> Iterator[dict]:
+        """Yields feedbacks oldest first, reading `batch_size` rows at a time."""
+        columns = get_feedback_columns(fields)
+        with get_db() as db:
+            query = db.query(*[getattr(Feedback, column) for column in columns])
+            for row in query.order_by(Feedback.created_at, Feedback.id).yield_per(
+                batch_size
+            ):
+                yield dict(zip(columns, row))
+
     def get_feedbacks_by_type(self, type: str) -> list[FeedbackModel]:
         with get_db() as db:
             return [
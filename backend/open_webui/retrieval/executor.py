@@ -0,0 +1,216 @@
+import asyncio
+import functools
+import logging
+import multiprocessing
+import threading
+import time
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from typing import Any, Callable, Optional
+
+from open_webui.env import (
+    SRC_LOG_LEVELS,
+    RAG_RETRIEVAL_THREAD_POOL_SIZE,
+    RAG_RETRIEVAL_PROCESS_POOL_SIZE,
+    RAG_RETRIEVAL_MAX_QUEUE_SIZE,
+    RAG_RETRIEVAL_MAX_CONCURRENCY_PER_USER,
+)
+
+log = logging.getLogger(__name__)
+log.setLevel(SRC_LOG_LEVELS["RAG"])
+
+
+class RetrievalExecutorBusyError(Exception):
+    pass
+
+
+def bm25_search(texts: list[str], query: str, k: int) -> list[int]:
+    # Runs in a process worker, so only plain data crosses the process boundary
+    from langchain_community.retrievers import BM25Retriever
+
+    retriever = BM25Retriever.from_texts(
+        texts=texts, metadatas=[{"index": idx} for idx in range(len(texts))]
+    )
+    retriever.k = k
+    return [doc.metadata["index"] for doc in retriever.invoke(query)]
+
+
+class RetrievalExecutor:
+    """
+    Application-wide execution service for retrieval work.
+
+    - `run` executes a whole retrieval request (e.g. `get_sources_from_items`)
+      on a shared thread pool. Each user may only run a few requests at once
+      and the total number of waiting and running requests is bounded; once
+      the bound is reached new requests are rejected instead of queued.
+    - `map` fans out short I/O-bound calls (vector DB queries, hybrid search
+      per collection) over a second pool, so requests never wait on
+      themselves for a free thread.
+    - `run_cpu_bound` offloads picklable CPU-heavy stages to a process pool
+      when one is configured and runs them inline otherwise.
+    """
+
+    def __init__(
+        self,
+        thread_pool_size: int,
+        process_pool_size: int = 0,
+        max_queue_size: int = 256,
+        max_concurrency_per_user: int = 2,
+    ):
+        self.thread_pool_size = thread_pool_size
+        self.process_pool_size = process_pool_size
+        self.max_queue_size = max_queue_size
+        self.max_concurrency_per_user = max_concurrency_per_user
+
+        self._lock = threading.Lock()
+        self._request_pool: Optional[ThreadPoolExecutor] = None
+        self._query_pool: Optional[ThreadPoolExecutor] = None
+        self._process_pool: Optional[ProcessPoolExecutor] = None
+
+        # user_id -> [semaphore, number of requests holding or waiting on it]
+        self._user_slots: dict[str, list] = {}
+
+        self.pending = 0
+        self.running = 0
+        self.completed = 0
+        self.rejected = 0
+        self.wait_time_total = 0.0
+
+    @property
+    def request_pool(self) -> ThreadPoolExecutor:
+        with self._lock:
+            if self._request_pool is None:
+                self._request_pool = ThreadPoolExecutor(
+                    max_workers=self.thread_pool_size,
+                    thread_name_prefix="retrieval-request",
+                )
+            return self._request_pool
+
+    @property
+    def query_pool(self) -> ThreadPoolExecutor:
+        with self._lock:
+            if self._query_pool is None:
+                self._query_pool = ThreadPoolExecutor(
+                    max_workers=self.thread_pool_size * 2,
+                    thread_name_prefix="retrieval-query",
+                )
+            return self._query_pool
+
+    @property
+    def process_pool(self) -> Optional[ProcessPoolExecutor]:
+        if self.process_pool_size <= 0:
+            return None
+
+        with self._lock:
+            if self._process_pool is None:
+                self._process_pool = ProcessPoolExecutor(
+                    max_workers=self.process_pool_size,
+                    mp_context=multiprocessing.get_context("spawn"),
+                )
+            return self._process_pool
+
+    def _acquire_user_slot(self, user_id: str) -> asyncio.Semaphore:
+        slot = self._user_slots.get(user_id)
+        if slot is None:
+            slot = [asyncio.Semaphore(self.max_concurrency_per_user), 0]
+            self._user_slots[user_id] = slot
+        slot[1] += 1
+        return slot[0]
+
+    def _release_user_slot(self, user_id: str):
+        slot = self._user_slots.get(user_id)
+        if slot is not None:
+            slot[1] -= 1
+            if slot[1] <= 0:
+                del self._user_slots[user_id]
+
+    async def run(self, user_id: str, fn: Callable, *args, **kwargs) -> Any:
+        if self.pending + self.running >= self.max_queue_size:
+            self.rejected += 1
+            raise RetrievalExecutorBusyError(
+                "Retrieval is at capacity, please try again shortly."
+            )
+
+        loop = asyncio.get_running_loop()
+        queued_at = time.perf_counter()
+        started = False
+
+        self.pending += 1
+        semaphore = self._acquire_user_slot(user_id)
+        try:
+            async with semaphore:
+                self.pending -= 1
+                self.running += 1
+                started = True
+                self.wait_time_total += time.perf_counter() - queued_at
+
+                try:
+                    return await loop.run_in_executor(
+                        self.request_pool, functools.partial(fn, *args, **kwargs)
+                    )
+                finally:
+                    self.running -= 1
+                    self.completed += 1
+        finally:
+            if not started:
+                self.pending -= 1
+            self._release_user_slot(user_id)
+
+    def map(self, fn: Callable, *iterables) -> list:
+        # Nested fan-out from a query worker runs inline to avoid waiting on our own pool
+        if threading.current_thread().name.startswith("retrieval-query"):
+            return list(map(fn, *iterables))
+        return list(self.query_pool.map(fn, *iterables))
+
+    def run_cpu_bound(self, fn: Callable, *args) -> Any:
+        pool = self.process_pool
+        if pool is None:
+            return fn(*args)
+
+        try:
+            return pool.submit(fn, *args).result()
+        except BrokenProcessPool as e:
+            log.warning(f"Retrieval process pool is broken, restarting it: {e}")
+            with self._lock:
+                # Only the first caller to see the broken pool drops it
+                if self._process_pool is pool:
+                    self._process_pool = None
+                else:
+                    pool = None
+            if pool is not None:
+                # Reap the worker processes and the management thread
+                pool.shutdown(wait=False, cancel_futures=True)
+            return fn(*args)
+
+    def stats(self) -> dict:
+        return {
+            "pending": self.pending,
+            "running": self.running,
+            "completed": self.completed,
+            "rejected": self.rejected,
+            "users": len(self._user_slots),
+            "avg_wait_ms": (
+                round(self.wait_time_total * 1000 / self.completed, 2)
+                if self.completed
+                else 0.0
+            ),
+            "thread_pool_size": self.thread_pool_size,
+            "process_pool_size": self.process_pool_size,
+            "max_queue_size": self.max_queue_size,
+            "max_concurrency_per_user": self.max_concurrency_per_user,
+        }
+
+    def shutdown(self):
+        with self._lock:
+            for pool in (self._request_pool, self._query_pool, self._process_pool):
+                if pool is not None:
+                    pool.shutdown(wait=False, cancel_futures=True)
+            self._request_pool = self._query_pool = self._process_pool = None
+
+
+RETRIEVAL_EXECUTOR = RetrievalExecutor(
+    thread_pool_size=RAG_RETRIEVAL_THREAD_POOL_SIZE,
+    process_pool_size=RAG_RETRIEVAL_PROCESS_POOL_SIZE,
+    max_queue_size=RAG_RETRIEVAL_MAX_QUEUE_SIZE,
+    max_concurrency_per_user=RAG_RETRIEVAL_MAX_CONCURRENCY_PER_USER,
+)
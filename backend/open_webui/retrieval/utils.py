@@ -1,10 +1,11 @@
+import json
 import logging
 import os
+import threading
 from typing import Optional, Union
 
 import requests
 import hashlib
-from concurrent.futures import ThreadPoolExecutor
 import time
 
 from urllib.parse import quote
@@ -22,6 +23,7 @@ from open_webui.models.knowledge import Knowledges
 from open_webui.models.notes import Notes
 
 from open_webui.retrieval.vector.main import GetResult
+from open_webui.retrieval.executor import RETRIEVAL_EXECUTOR, bm25_search
 from open_webui.utils.access_control import has_access
 
 
@@ -78,6 +80,19 @@ class VectorSearchRetriever(BaseRetriever):
         return results
 
 
+class StaticRetriever(BaseRetriever):
+    # Serves results ranked elsewhere (e.g. BM25 computed in a process worker)
+    documents: list[Document]
+
+    def _get_relevant_documents(
+        self,
+        query: str,
+        *,
+        run_manager: CallbackManagerForRetrieverRun,
+    ) -> list[Document]:
+        return self.documents
+
+
 def query_doc(
     collection_name: str, query_embedding: list[float], k: int, user: UserModel = None
 ):
@@ -125,11 +140,26 @@ def query_doc_with_hybrid_search(
 ) -> dict:
     try:
         log.debug(f"query_doc_with_hybrid_search:doc {collection_name}")
-        bm25_retriever = BM25Retriever.from_texts(
-            texts=collection_result.documents[0],
-            metadatas=collection_result.metadatas[0],
-        )
-        bm25_retriever.k = k
+        bm25_retriever = None
+        if hybrid_bm25_weight > 0:
+            texts = collection_result.documents[0]
+            metadatas = collection_result.metadatas[0]
+
+            if RETRIEVAL_EXECUTOR.process_pool is not None:
+                bm25_retriever = StaticRetriever(
+                    documents=[
+                        Document(page_content=texts[idx], metadata=metadatas[idx])
+                        for idx in RETRIEVAL_EXECUTOR.run_cpu_bound(
+                            bm25_search, texts, query, k
+                        )
+                    ]
+                )
+            else:
+                bm25_retriever = BM25Retriever.from_texts(
+                    texts=texts,
+                    metadatas=metadatas,
+                )
+                bm25_retriever.k = k
 
         vector_search_retriever = VectorSearchRetriever(
             collection_name=collection_name,
@@ -253,6 +283,44 @@ def merge_and_sort_query_results(query_results: list[dict], k: int) -> dict:
     }
 
 
+def merge_sources(sources: list[dict], k: int) -> list[dict]:
+    """
+    Merge sources returned by separate `get_sources_from_items` runs over the
+    same items (e.g. with different queries). Vector search results of the
+    same item are combined with `merge_and_sort_query_results`, everything
+    else keeps its first occurrence.
+    """
+    merged = {}
+
+    for source in sources:
+        key = json.dumps(source.get("source", {}), sort_keys=True, default=str)
+        if key not in merged:
+            merged[key] = source
+            continue
+
+        existing = merged[key]
+        if "distances" in existing and "distances" in source:
+            result = merge_and_sort_query_results(
+                [
+                    {
+                        "distances": [item["distances"]],
+                        "documents": [item["document"]],
+                        "metadatas": [item["metadata"]],
+                    }
+                    for item in (existing, source)
+                ],
+                k=k,
+            )
+            merged[key] = {
+                **existing,
+                "document": result["documents"][0],
+                "metadata": result["metadatas"][0],
+                "distances": result["distances"][0],
+            }
+
+    return list(merged.values())
+
+
 def get_all_items_from_collections(collection_names: list[str]) -> dict:
     results = []
 
@@ -279,42 +347,47 @@ def query_collection(
     results = []
     error = False
 
-    def process_query_collection(collection_name, query_embedding):
-        try:
-            if collection_name:
-                result = query_doc(
-                    collection_name=collection_name,
-                    k=k,
-                    query_embedding=query_embedding,
-                )
-                if result is not None:
-                    return result.model_dump(), None
-            return None, None
-        except Exception as e:
-            log.exception(f"Error when querying the collection: {e}")
-            return None, e
-
     # Generate all query embeddings (in one call)
     query_embeddings = embedding_function(queries, prefix=RAG_EMBEDDING_QUERY_PREFIX)
+    collection_names = [name for name in collection_names if name]
     log.debug(
         f"query_collection: processing {len(queries)} queries across {len(collection_names)} collections"
     )
 
-    with ThreadPoolExecutor() as executor:
-        future_results = []
-        for query_embedding in query_embeddings:
-            for collection_name in collection_names:
-                result = executor.submit(
-                    process_query_collection, collection_name, query_embedding
-                )
-                future_results.append(result)
-        task_results = [future.result() for future in future_results]
-
-    for result, err in task_results:
-        if err is not None:
+    # Every query against every collection, in as few vector DB requests as the backend allows
+    try:
+        collection_results = VECTOR_DB_CLIENT.search_batch(
+            collection_names=collection_names,
+            vectors=query_embeddings,
+            limit=k,
+        )
+    except Exception as e:
+        log.exception(f"Error when querying the collections: {e}")
+        collection_results = {}
+        error = True
+
+    for collection_name, result in collection_results.items():
+        if isinstance(result, Exception):
+            log.error(
+                f"Error when querying the collection {collection_name}: {result}",
+                exc_info=result,
+            )
             error = True
-        elif result is not None:
-            results.append(result)
+            continue
+        if result is None:
+            continue
+
+        log.info(f"query_collection:result {collection_name} {result.ids}")
+        for distances, documents, metadatas in zip(
+            result.distances, result.documents, result.metadatas
+        ):
+            results.append(
+                {
+                    "distances": [distances],
+                    "documents": [documents],
+                    "metadatas": [metadatas],
+                }
+            )
 
     if error and not results:
         log.warning("All collection queries failed. No results returned.")
@@ -380,9 +453,7 @@ def query_collection_with_hybrid_search(
         for q in queries
     ]
 
-    with ThreadPoolExecutor() as executor:
-        future_results = [executor.submit(process_query, cn, q) for cn, q in tasks]
-        task_results = [future.result() for future in future_results]
+    task_results = RETRIEVAL_EXECUTOR.map(lambda task: process_query(*task), tasks)
 
     for result, err in task_results:
         if err is not None:
@@ -445,6 +516,98 @@ def get_embedding_function(
         raise ValueError(f"Unknown embedding engine: {embedding_engine}")
 
 
+class EmbeddingMemo:
+    """
+    Request-scoped memo around an embedding function.
+
+    All retrieval stages of one chat turn (memory, knowledge, web search and
+    reranking) embed the same few queries, so each distinct (text, prefix)
+    pair is embedded once and reused. Safe to share between the event loop
+    and retrieval executor threads: a pair that is already being embedded by
+    another stage is waited for instead of embedded again.
+    """
+
+    def __init__(self, embedding_function, user=None):
+        self.embedding_function = embedding_function
+        self.user = user
+
+        self._lock = threading.Lock()
+        self._vectors: dict[tuple, list[float]] = {}
+        self._inflight: dict[tuple, threading.Event] = {}
+
+        self.requested = 0
+        self.embedded = 0
+        self.calls = 0
+
+    def __call__(self, query, prefix=None, user=None):
+        if isinstance(query, list):
+            return self._embed(query, prefix)
+        return self._embed([query], prefix)[0]
+
+    def _embed(self, texts: list[str], prefix) -> list[list[float]]:
+        keys = [(text, prefix) for text in texts]
+
+        with self._lock:
+            self.requested += len(keys)
+            owned, waiting = [], []
+            for key in dict.fromkeys(keys):
+                if key in self._vectors:
+                    continue
+                if key in self._inflight:
+                    waiting.append(self._inflight[key])
+                else:
+                    self._inflight[key] = threading.Event()
+                    owned.append(key)
+
+        if owned:
+            try:
+                vectors = self.embedding_function(
+                    [text for text, _ in owned], prefix=prefix, user=self.user
+                )
+                with self._lock:
+                    self.calls += 1
+                    self.embedded += len(owned)
+                    self._vectors.update(zip(owned, vectors))
+            finally:
+                with self._lock:
+                    for key in owned:
+                        self._inflight.pop(key).set()
+
+        for event in waiting:
+            event.wait()
+
+        missing = [key for key in keys if key not in self._vectors]
+        if missing:
+            # The stage embedding these failed, retry them here
+            return [
+                self._vectors.get(key)
+                or self.embedding_function(key[0], prefix=prefix, user=self.user)
+                for key in keys
+            ]
+        return [self._vectors[key] for key in keys]
+
+    def stats(self) -> dict:
+        return {
+            "requested": self.requested,
+            "embedded": self.embedded,
+            "calls": self.calls,
+            "saved": self.requested - self.embedded,
+        }
+
+
+def get_request_embedding_function(request, user=None):
+    """
+    Returns the embedding memo of the current chat turn when there is one,
+    otherwise the app's embedding function bound to `user`.
+    """
+    memo = getattr(request.state, "embedding_memo", None)
+    if memo is not None:
+        return memo
+    return lambda query, prefix=None: request.app.state.EMBEDDING_FUNCTION(
+        query, prefix=prefix, user=user
+    )
+
+
 def get_reranking_function(reranking_engine, reranking_model, reranking_function):
     if reranking_function is None:
         return None
@@ -663,8 +826,8 @@ def get_sources_from_items(
             extracted_collections.extend(collection_names)
 
         if query_result:
-            if "data" in item:
-                del item["data"]
+            # pop instead of del: concurrent runs may share the same items
+            item.pop("data", None)
             query_results.append({**query_result, "file": item})
 
     sources = []
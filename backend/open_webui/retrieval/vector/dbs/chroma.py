@@ -3,7 +3,7 @@ import logging
 from chromadb import Settings
 from chromadb.utils.batch_utils import create_batches
 
-from typing import Optional
+from typing import Optional, Union
 
 from open_webui.retrieval.vector.main import (
     VectorDBBase,
@@ -70,36 +70,67 @@ class ChromaClient(VectorDBBase):
         # Delete the collection based on the collection name.
         return self.client.delete_collection(name=collection_name)
 
+    def _query_collection(
+        self,
+        collection_name: str,
+        vectors: list[list[float | int]],
+        limit: int,
+        filter: Optional[dict] = None,
+    ) -> Optional[SearchResult]:
+        collection = self.client.get_collection(name=collection_name)
+        if not collection:
+            return None
+
+        where = None
+        if filter:
+            conditions = [{key: value} for key, value in filter.items()]
+            where = conditions[0] if len(conditions) == 1 else {"$and": conditions}
+
+        result = collection.query(
+            query_embeddings=vectors,
+            n_results=limit,
+            where=where,
+        )
+
+        # chromadb has cosine distance, 2 (worst) -> 0 (best). Re-odering to 0 -> 1
+        # https://docs.trychroma.com/docs/collections/configure cosine equation
+        distances = [[(2 - dist) / 2 for dist in row] for row in result["distances"]]
+
+        return SearchResult(
+            **{
+                "ids": result["ids"],
+                "distances": distances,
+                "documents": result["documents"],
+                "metadatas": result["metadatas"],
+            }
+        )
+
     def search(
         self, collection_name: str, vectors: list[list[float | int]], limit: int
     ) -> Optional[SearchResult]:
         # Search for the nearest neighbor items based on the vectors and return 'limit' number of results.
         try:
-            collection = self.client.get_collection(name=collection_name)
-            if collection:
-                result = collection.query(
-                    query_embeddings=vectors,
-                    n_results=limit,
-                )
-
-                # chromadb has cosine distance, 2 (worst) -> 0 (best). Re-odering to 0 -> 1
-                # https://docs.trychroma.com/docs/collections/configure cosine equation
-                distances: list = result["distances"][0]
-                distances = [2 - dist for dist in distances]
-                distances = [[dist / 2 for dist in distances]]
-
-                return SearchResult(
-                    **{
-                        "ids": result["ids"],
-                        "distances": distances,
-                        "documents": result["documents"],
-                        "metadatas": result["metadatas"],
-                    }
-                )
-            return None
+            return self._query_collection(collection_name, vectors, limit)
         except Exception as e:
             return None
 
+    def search_batch(
+        self,
+        collection_names: list[str],
+        vectors: list[list[float | int]],
+        limit: int,
+        filter: Optional[dict] = None,
+    ) -> dict[str, Union[SearchResult, Exception, None]]:
+        def search_collection(collection_name):
+            try:
+                return self._query_collection(collection_name, vectors, limit, filter)
+            except Exception as e:
+                # Like `search`, missing collections aren't an error
+                log.debug(f"Error searching collection {collection_name}: {e}")
+                return None
+
+        return self._map_collections(collection_names, search_collection)
+
     def query(
         self, collection_name: str, filter: dict, limit: Optional[int] = None
     ) -> Optional[GetResult]:
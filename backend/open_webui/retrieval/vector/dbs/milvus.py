@@ -2,7 +2,7 @@ from pymilvus import MilvusClient as Client
 from pymilvus import FieldSchema, DataType
 import json
 import logging
-from typing import Optional
+from typing import Optional, Union
 
 from open_webui.retrieval.vector.utils import stringify_metadata
 from open_webui.retrieval.vector.main import (
@@ -170,10 +170,27 @@ class MilvusClient(VectorDBBase):
             collection_name=f"{self.collection_prefix}_{collection_name}"
         )
 
+    def _get_filter_string(self, filter: dict) -> str:
+        return " && ".join(
+            [
+                f'metadata["{key}"] == {json.dumps(value)}'
+                for key, value in filter.items()
+            ]
+        )
+
     def search(
         self, collection_name: str, vectors: list[list[float | int]], limit: int
     ) -> Optional[SearchResult]:
         # Search for the nearest neighbor items based on the vectors and return 'limit' number of results.
+        return self._search(collection_name, vectors, limit)
+
+    def _search(
+        self,
+        collection_name: str,
+        vectors: list[list[float | int]],
+        limit: int,
+        filter: Optional[dict] = None,
+    ) -> SearchResult:
         collection_name = collection_name.replace("-", "_")
         # For some index types like IVF_FLAT, search params like nprobe can be set.
         # Example: search_params = {"nprobe": 10} if using IVF_FLAT
@@ -182,11 +199,27 @@ class MilvusClient(VectorDBBase):
             collection_name=f"{self.collection_prefix}_{collection_name}",
             data=vectors,
             limit=limit,
+            filter=self._get_filter_string(filter) if filter else "",
             output_fields=["data", "metadata"],
             # search_params=search_params # Potentially add later if needed
         )
         return self._result_to_search_result(result)
 
+    def search_batch(
+        self,
+        collection_names: list[str],
+        vectors: list[list[float | int]],
+        limit: int,
+        filter: Optional[dict] = None,
+    ) -> dict[str, Union[SearchResult, Exception, None]]:
+        # Milvus searches all vectors of a collection in one request
+        return self._map_collections(
+            collection_names,
+            lambda collection_name: self._search(
+                collection_name, vectors, limit, filter
+            ),
+        )
+
     def query(self, collection_name: str, filter: dict, limit: Optional[int] = None):
         # Construct the filter string for querying
         collection_name = collection_name.replace("-", "_")
@@ -195,12 +228,7 @@ class MilvusClient(VectorDBBase):
                 f"Query attempted on non-existent collection: {self.collection_prefix}_{collection_name}"
             )
             return None
-        filter_string = " && ".join(
-            [
-                f'metadata["{key}"] == {json.dumps(value)}'
-                for key, value in filter.items()
-            ]
-        )
+        filter_string = self._get_filter_string(filter)
         max_limit = 16383  # The maximum number of records per request
         all_results = []
         if limit is None:
@@ -1,6 +1,7 @@
+import logging
 from opensearchpy import OpenSearch
 from opensearchpy.helpers import bulk
-from typing import Optional
+from typing import Optional, Union
 
 from open_webui.retrieval.vector.utils import stringify_metadata
 from open_webui.retrieval.vector.main import (
@@ -16,6 +17,10 @@ from open_webui.config import (
     OPENSEARCH_USERNAME,
     OPENSEARCH_PASSWORD,
 )
+from open_webui.env import SRC_LOG_LEVELS
+
+log = logging.getLogger(__name__)
+log.setLevel(SRC_LOG_LEVELS["RAG"])
 
 
 class OpenSearchClient(VectorDBBase):
@@ -112,6 +117,40 @@ class OpenSearchClient(VectorDBBase):
         # We are simply adapting to the norms of the other DBs.
         self.client.indices.delete(index=self._get_index_name(collection_name))
 
+    def _get_search_body(
+        self,
+        vector: list[float | int],
+        limit: int,
+        filter: Optional[dict] = None,
+    ) -> dict:
+        query = {"match_all": {}}
+        if filter:
+            query = {
+                "bool": {
+                    "filter": [
+                        {"term": {"metadata." + str(field) + ".keyword": value}}
+                        for field, value in filter.items()
+                    ]
+                }
+            }
+
+        return {
+            "size": limit,
+            "_source": ["text", "metadata"],
+            "query": {
+                "script_score": {
+                    "query": query,
+                    "script": {
+                        "source": "(cosineSimilarity(params.query_value, doc[params.field]) + 1.0) / 2.0",
+                        "params": {
+                            "field": "vector",
+                            "query_value": vector,
+                        },
+                    },
+                }
+            },
+        }
+
     def search(
         self, collection_name: str, vectors: list[list[float | int]], limit: int
     ) -> Optional[SearchResult]:
@@ -119,22 +158,8 @@ class OpenSearchClient(VectorDBBase):
             if not self.has_collection(collection_name):
                 return None
 
-            query = {
-                "size": limit,
-                "_source": ["text", "metadata"],
-                "query": {
-                    "script_score": {
-                        "query": {"match_all": {}},
-                        "script": {
-                            "source": "(cosineSimilarity(params.query_value, doc[params.field]) + 1.0) / 2.0",
-                            "params": {
-                                "field": "vector",
-                                "query_value": vectors[0],
-                            },  # Assuming single query vector
-                        },
-                    }
-                },
-            }
+            # Assuming single query vector
+            query = self._get_search_body(vectors[0], limit)
 
             result = self.client.search(
                 index=self._get_index_name(collection_name), body=query
@@ -145,6 +170,52 @@ class OpenSearchClient(VectorDBBase):
         except Exception as e:
             return None
 
+    def search_batch(
+        self,
+        collection_names: list[str],
+        vectors: list[list[float | int]],
+        limit: int,
+        filter: Optional[dict] = None,
+    ) -> dict[str, Union[SearchResult, Exception, None]]:
+        # Every (index, vector) pair goes into a single multi-search request
+        collection_names = list(dict.fromkeys(collection_names))
+        body = []
+        for collection_name in collection_names:
+            for vector in vectors:
+                body.append({"index": self._get_index_name(collection_name)})
+                body.append(self._get_search_body(vector, limit, filter))
+
+        try:
+            responses = iter(self.client.msearch(body=body)["responses"])
+        except Exception as e:
+            return {collection_name: e for collection_name in collection_names}
+
+        results = {}
+        for collection_name in collection_names:
+            result = SearchResult(ids=[], documents=[], metadatas=[], distances=[])
+            for _ in vectors:
+                response = next(responses)
+                if "error" in response:
+                    error = response["error"]
+                    # A missing index just has no results
+                    if (
+                        isinstance(error, dict)
+                        and error.get("type") == "index_not_found_exception"
+                    ):
+                        result = None
+                    elif result is not None:
+                        result = Exception(error)
+                if not isinstance(result, SearchResult):
+                    continue
+
+                row = self._result_to_search_result(response)
+                result.ids.append(row.ids[0] if row else [])
+                result.documents.append(row.documents[0] if row else [])
+                result.metadatas.append(row.metadatas[0] if row else [])
+                result.distances.append(row.distances[0] if row else [])
+            results[collection_name] = result
+        return results
+
     def query(
         self, collection_name: str, filter: dict, limit: Optional[int] = None
     ) -> Optional[GetResult]:
@@ -1,4 +1,4 @@
-from typing import Optional, List, Dict, Any
+from typing import Optional, List, Dict, Any, Union
 import logging
 import json
 from sqlalchemy import (
@@ -325,9 +325,26 @@ class PgvectorClient(VectorDBBase):
         vectors: List[List[float]],
         limit: Optional[int] = None,
     ) -> Optional[SearchResult]:
+        if not vectors:
+            return None
+        result = self.search_batch([collection_name], vectors, limit).get(
+            collection_name
+        )
+        # Errors were already logged by search_batch
+        return None if isinstance(result, Exception) else result
+
+    def search_batch(
+        self,
+        collection_names: List[str],
+        vectors: List[List[float]],
+        limit: Optional[int] = None,
+        filter: Optional[Dict[str, Any]] = None,
+    ) -> Dict[str, Union[SearchResult, Exception, None]]:
+        # Searches every collection with every vector in a single statement
+        collection_names = list(dict.fromkeys(collection_names))
         try:
-            if not vectors:
-                return None
+            if not vectors or not collection_names:
+                return {collection_name: None for collection_name in collection_names}
 
             # Adjust query vectors to VECTOR_LENGTH
             vectors = [self.adjust_vector_length(vector) for vector in vectors]
@@ -336,7 +353,7 @@ class PgvectorClient(VectorDBBase):
             def vector_expr(vector):
                 return cast(array(vector), Vector(VECTOR_LENGTH))
 
-            # Create the values for query vectors
+            # Create the values for query vectors and collections
             qid_col = column("qid", Integer)
             q_vector_col = column("q_vector", Vector(VECTOR_LENGTH))
             query_vectors = (
@@ -346,22 +363,34 @@ class PgvectorClient(VectorDBBase):
                 )
                 .alias("query_vectors")
             )
+            cid_col = column("cid", Integer)
+            c_name_col = column("c_name", Text)
+            query_collections = (
+                values(cid_col, c_name_col)
+                .data(
+                    [
+                        (idx, collection_name)
+                        for idx, collection_name in enumerate(collection_names)
+                    ]
+                )
+                .alias("query_collections")
+            )
 
             result_fields = [
                 DocumentChunk.id,
             ]
             if PGVECTOR_PGCRYPTO:
+                vmetadata = pgcrypto_decrypt(
+                    DocumentChunk.vmetadata, PGVECTOR_PGCRYPTO_KEY, JSONB
+                )
                 result_fields.append(
                     pgcrypto_decrypt(
                         DocumentChunk.text, PGVECTOR_PGCRYPTO_KEY, Text
                     ).label("text")
                 )
-                result_fields.append(
-                    pgcrypto_decrypt(
-                        DocumentChunk.vmetadata, PGVECTOR_PGCRYPTO_KEY, JSONB
-                    ).label("vmetadata")
-                )
+                result_fields.append(vmetadata.label("vmetadata"))
             else:
+                vmetadata = DocumentChunk.vmetadata
                 result_fields.append(DocumentChunk.text)
                 result_fields.append(DocumentChunk.vmetadata)
             result_fields.append(
@@ -370,10 +399,16 @@ class PgvectorClient(VectorDBBase):
                 )
             )
 
-            # Build the lateral subquery for each query vector
+            where_clauses = [
+                DocumentChunk.collection_name == query_collections.c.c_name
+            ]
+            for key, value in (filter or {}).items():
+                where_clauses.append(vmetadata[key].astext == str(value))
+
+            # Build the lateral subquery for each (collection, query vector) pair
             subq = (
                 select(*result_fields)
-                .where(DocumentChunk.collection_name == collection_name)
+                .where(*where_clauses)
                 .order_by(
                     (DocumentChunk.vector.cosine_distance(query_vectors.c.q_vector))
                 )
@@ -382,53 +417,51 @@ class PgvectorClient(VectorDBBase):
                 subq = subq.limit(limit)
             subq = subq.lateral("result")
 
-            # Build the main query by joining query_vectors and the lateral subquery
+            # Build the main query by joining the pairs and the lateral subquery
             stmt = (
                 select(
+                    query_collections.c.cid,
                     query_vectors.c.qid,
                     subq.c.id,
                     subq.c.text,
                     subq.c.vmetadata,
                     subq.c.distance,
                 )
-                .select_from(query_vectors)
+                .select_from(query_collections)
+                .join(query_vectors, true())
                 .join(subq, true())
-                .order_by(query_vectors.c.qid, subq.c.distance)
+                .order_by(query_collections.c.cid, query_vectors.c.qid, subq.c.distance)
             )
 
             result_proxy = self.session.execute(stmt)
             results = result_proxy.all()
 
-            ids = [[] for _ in range(num_queries)]
-            distances = [[] for _ in range(num_queries)]
-            documents = [[] for _ in range(num_queries)]
-            metadatas = [[] for _ in range(num_queries)]
-
-            if not results:
-                return SearchResult(
-                    ids=ids,
-                    distances=distances,
-                    documents=documents,
-                    metadatas=metadatas,
+            search_results = {
+                collection_name: SearchResult(
+                    ids=[[] for _ in range(num_queries)],
+                    distances=[[] for _ in range(num_queries)],
+                    documents=[[] for _ in range(num_queries)],
+                    metadatas=[[] for _ in range(num_queries)],
                 )
+                for collection_name in collection_names
+            }
 
             for row in results:
+                result = search_results[collection_names[int(row.cid)]]
                 qid = int(row.qid)
-                ids[qid].append(row.id)
+                result.ids[qid].append(row.id)
                 # normalize and re-orders pgvec distance from [2, 0] to [0, 1] score range
                 # https://github.com/pgvector/pgvector?tab=readme-ov-file#querying
-                distances[qid].append((2.0 - row.distance) / 2.0)
-                documents[qid].append(row.text)
-                metadatas[qid].append(row.vmetadata)
+                result.distances[qid].append((2.0 - row.distance) / 2.0)
+                result.documents[qid].append(row.text)
+                result.metadatas[qid].append(row.vmetadata)
 
             self.session.rollback()  # read-only transaction
-            return SearchResult(
-                ids=ids, distances=distances, documents=documents, metadatas=metadatas
-            )
+            return search_results
         except Exception as e:
             self.session.rollback()
             log.exception(f"Error during search: {e}")
-            return None
+            return {collection_name: e for collection_name in collection_names}
 
     def query(
         self, collection_name: str, filter: Dict[str, Any], limit: Optional[int] = None
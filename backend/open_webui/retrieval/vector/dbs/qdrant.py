@@ -1,4 +1,4 @@
-from typing import Optional
+from typing import Optional, Union
 import logging
 from urllib.parse import urlparse
 
@@ -146,25 +146,68 @@ class QdrantClient(VectorDBBase):
             collection_name=f"{self.collection_prefix}_{collection_name}"
         )
 
-    def search(
-        self, collection_name: str, vectors: list[list[float | int]], limit: int
-    ) -> Optional[SearchResult]:
-        # Search for the nearest neighbor items based on the vectors and return 'limit' number of results.
+    def _search_points(
+        self,
+        collection_name: str,
+        vectors: list[list[float | int]],
+        limit: int,
+        filter: Optional[dict] = None,
+    ) -> SearchResult:
+        # One request for all query vectors, one row of results per vector
         if limit is None:
             limit = NO_LIMIT  # otherwise qdrant would set limit to 10!
 
-        query_response = self.client.query_points(
+        query_filter = None
+        if filter:
+            query_filter = models.Filter(
+                must=[
+                    models.FieldCondition(
+                        key=f"metadata.{key}", match=models.MatchValue(value=value)
+                    )
+                    for key, value in filter.items()
+                ]
+            )
+
+        responses = self.client.query_batch_points(
             collection_name=f"{self.collection_prefix}_{collection_name}",
-            query=vectors[0],
-            limit=limit,
+            requests=[
+                models.QueryRequest(
+                    query=vector, limit=limit, filter=query_filter, with_payload=True
+                )
+                for vector in vectors
+            ],
         )
-        get_result = self._result_to_get_result(query_response.points)
-        return SearchResult(
-            ids=get_result.ids,
-            documents=get_result.documents,
-            metadatas=get_result.metadatas,
+
+        result = SearchResult(ids=[], documents=[], metadatas=[], distances=[])
+        for response in responses:
+            get_result = self._result_to_get_result(response.points)
+            result.ids.append(get_result.ids[0])
+            result.documents.append(get_result.documents[0])
+            result.metadatas.append(get_result.metadatas[0])
             # qdrant distance is [-1, 1], normalize to [0, 1]
-            distances=[[(point.score + 1.0) / 2.0 for point in query_response.points]],
+            result.distances.append(
+                [(point.score + 1.0) / 2.0 for point in response.points]
+            )
+        return result
+
+    def search(
+        self, collection_name: str, vectors: list[list[float | int]], limit: int
+    ) -> Optional[SearchResult]:
+        # Search for the nearest neighbor items based on the vectors and return 'limit' number of results.
+        return self._search_points(collection_name, vectors, limit)
+
+    def search_batch(
+        self,
+        collection_names: list[str],
+        vectors: list[list[float | int]],
+        limit: int,
+        filter: Optional[dict] = None,
+    ) -> dict[str, Union[SearchResult, Exception, None]]:
+        return self._map_collections(
+            collection_names,
+            lambda collection_name: self._search_points(
+                collection_name, vectors, limit, filter
+            ),
         )
 
     def query(self, collection_name: str, filter: dict, limit: Optional[int] = None):
@@ -1,5 +1,5 @@
 import logging
-from typing import Optional, Tuple, List, Dict, Any
+from typing import Optional, Tuple, List, Dict, Any, Union
 from urllib.parse import urlparse
 
 import grpc
@@ -248,6 +248,57 @@ class QdrantClient(VectorDBBase):
             ),
         )
 
+    def _search_tenants(
+        self,
+        mt_collection: str,
+        tenant_ids: List[str],
+        vectors: List[List[float | int]],
+        limit: int,
+        filter: Optional[Dict[str, Any]] = None,
+    ) -> List[SearchResult]:
+        """
+        Searches every tenant of a multi-tenant collection with every vector in
+        a single batch request. Returns one result per tenant, with a row per vector.
+        """
+        if limit is None:
+            limit = NO_LIMIT  # otherwise qdrant would set limit to 10!
+
+        metadata_conditions = [
+            _metadata_filter(k, v) for k, v in (filter or {}).items()
+        ]
+        responses = iter(
+            self.client.query_batch_points(
+                collection_name=mt_collection,
+                requests=[
+                    models.QueryRequest(
+                        query=vector,
+                        limit=limit,
+                        filter=models.Filter(
+                            must=[_tenant_filter(tenant_id), *metadata_conditions]
+                        ),
+                        with_payload=True,
+                    )
+                    for tenant_id in tenant_ids
+                    for vector in vectors
+                ],
+            )
+        )
+
+        results = []
+        for _ in tenant_ids:
+            result = SearchResult(ids=[], documents=[], metadatas=[], distances=[])
+            for _ in vectors:
+                response = next(responses)
+                get_result = self._result_to_get_result(response.points)
+                result.ids.append(get_result.ids[0])
+                result.documents.append(get_result.documents[0])
+                result.metadatas.append(get_result.metadatas[0])
+                result.distances.append(
+                    [(point.score + 1.0) / 2.0 for point in response.points]
+                )
+            results.append(result)
+        return results
+
     def search(
         self, collection_name: str, vectors: List[List[float | int]], limit: int
     ) -> Optional[SearchResult]:
@@ -261,20 +312,51 @@ class QdrantClient(VectorDBBase):
             log.debug(f"Collection {mt_collection} doesn't exist, search returns None")
             return None
 
-        tenant_filter = _tenant_filter(tenant_id)
-        query_response = self.client.query_points(
-            collection_name=mt_collection,
-            query=vectors[0],
-            limit=limit,
-            query_filter=models.Filter(must=[tenant_filter]),
-        )
-        get_result = self._result_to_get_result(query_response.points)
-        return SearchResult(
-            ids=get_result.ids,
-            documents=get_result.documents,
-            metadatas=get_result.metadatas,
-            distances=[[(point.score + 1.0) / 2.0 for point in query_response.points]],
-        )
+        return self._search_tenants(mt_collection, [tenant_id], vectors, limit)[0]
+
+    def search_batch(
+        self,
+        collection_names: List[str],
+        vectors: List[List[float | int]],
+        limit: int,
+        filter: Optional[Dict[str, Any]] = None,
+    ) -> Dict[str, Union[SearchResult, Exception, None]]:
+        """
+        Search several logical collections at once. Collections that share a
+        multi-tenant collection are searched in the same batch request.
+        """
+        collection_names = list(dict.fromkeys(collection_names))
+        results = {collection_name: None for collection_name in collection_names}
+        if not self.client or not vectors:
+            return results
+
+        tenants = {}
+        for collection_name in collection_names:
+            mt_collection, tenant_id = self._get_collection_and_tenant_id(
+                collection_name
+            )
+            tenants.setdefault(mt_collection, []).append((collection_name, tenant_id))
+
+        for mt_collection, members in tenants.items():
+            try:
+                if not self.client.collection_exists(collection_name=mt_collection):
+                    log.debug(
+                        f"Collection {mt_collection} doesn't exist, search returns None"
+                    )
+                    continue
+                tenant_results = self._search_tenants(
+                    mt_collection,
+                    [tenant_id for _, tenant_id in members],
+                    vectors,
+                    limit,
+                    filter,
+                )
+                for (collection_name, _), result in zip(members, tenant_results):
+                    results[collection_name] = result
+            except Exception as e:
+                for collection_name, _ in members:
+                    results[collection_name] = e
+        return results
 
     def query(
         self, collection_name: str, filter: Dict[str, Any], limit: Optional[int] = None
@@ -1,6 +1,13 @@
+import logging
 from pydantic import BaseModel
 from abc import ABC, abstractmethod
-from typing import Any, Dict, List, Optional, Union
+from typing import Any, Callable, Dict, List, Optional, Union
+
+from open_webui.env import SRC_LOG_LEVELS
+from open_webui.retrieval.executor import RETRIEVAL_EXECUTOR
+
+log = logging.getLogger(__name__)
+log.setLevel(SRC_LOG_LEVELS["RAG"])
 
 
 class VectorItem(BaseModel):
@@ -20,6 +27,41 @@ class SearchResult(GetResult):
     distances: Optional[List[List[float | int]]]
 
 
+def stack_search_results(
+    results: List[Optional[SearchResult]], filter: Optional[Dict] = None
+) -> Optional[SearchResult]:
+    """
+    Combines the first row of each result into one result with a row per
+    input, keeping only items whose metadata matches `filter`.
+    """
+    if all(result is None for result in results):
+        return None
+
+    stacked = SearchResult(ids=[], documents=[], metadatas=[], distances=[])
+    for result in results:
+        rows = [[], [], [], []]
+        if result is not None and result.ids:
+            for item in zip(
+                result.ids[0],
+                result.documents[0],
+                result.metadatas[0],
+                result.distances[0],
+            ):
+                metadata = item[2] or {}
+                if filter and any(
+                    metadata.get(key) != value for key, value in filter.items()
+                ):
+                    continue
+                for row, value in zip(rows, item):
+                    row.append(value)
+
+        stacked.ids.append(rows[0])
+        stacked.documents.append(rows[1])
+        stacked.metadatas.append(rows[2])
+        stacked.distances.append(rows[3])
+    return stacked
+
+
 class VectorDBBase(ABC):
     """
     Abstract base class for all vector database backends.
@@ -58,6 +100,72 @@ class VectorDBBase(ABC):
         """Search for similar vectors in a collection."""
         pass
 
+    def search_batch(
+        self,
+        collection_names: List[str],
+        vectors: List[List[Union[float, int]]],
+        limit: int,
+        filter: Optional[Dict] = None,
+    ) -> Dict[str, Union[SearchResult, Exception, None]]:
+        """
+        Search several collections with several query vectors.
+
+        Returns a result per collection name with one row of ids, documents,
+        metadatas and distances per query vector, in the order of `vectors`.
+        A collection without results (e.g. one that doesn't exist) gets None,
+        one whose search failed gets the exception. `filter` only keeps items
+        whose metadata has the given values.
+
+        This fallback runs one `search` per (collection, vector) pair in
+        parallel and filters their results. Backends override it to send the
+        batch in as few round trips as they can.
+        """
+        collection_names = list(dict.fromkeys(collection_names))
+        pairs = [
+            (collection_name, vector)
+            for collection_name in collection_names
+            for vector in vectors
+        ]
+
+        def search_pair(pair):
+            collection_name, vector = pair
+            try:
+                return self.search(collection_name, [vector], limit)
+            except Exception as e:
+                return e
+
+        results = iter(RETRIEVAL_EXECUTOR.map(search_pair, pairs))
+        collection_results = {}
+        for collection_name in collection_names:
+            rows = [next(results) for _ in vectors]
+            errors = [row for row in rows if isinstance(row, Exception)]
+            collection_results[collection_name] = (
+                errors[0] if errors else stack_search_results(rows, filter)
+            )
+        return collection_results
+
+    def _map_collections(
+        self,
+        collection_names: List[str],
+        fn: Callable[[str], Optional[SearchResult]],
+    ) -> Dict[str, Union[SearchResult, Exception, None]]:
+        """
+        Runs `fn` for each distinct collection in parallel, for backends that
+        search all vectors of a collection in one request. A collection that
+        fails to be searched gets the exception.
+        """
+        collection_names = list(dict.fromkeys(collection_names))
+
+        def run(collection_name):
+            try:
+                return fn(collection_name)
+            except Exception as e:
+                return e
+
+        return dict(
+            zip(collection_names, RETRIEVAL_EXECUTOR.map(run, collection_names))
+        )
+
     @abstractmethod
     def query(
         self, collection_name: str, filter: Dict, limit: Optional[int] = None
@@ -1,14 +1,19 @@
-import hashlib
+import asyncio
+import io
 import json
 import logging
+import glob
 import os
+import queue
+import re
+import subprocess
+import threading
 import uuid
 from functools import lru_cache
 from pathlib import Path
 from pydub import AudioSegment
-from pydub.silence import split_on_silence
 from concurrent.futures import ThreadPoolExecutor
-from typing import Optional
+from typing import Iterator, Optional
 
 from fnmatch import fnmatch
 import aiohttp
@@ -29,7 +34,7 @@ from fastapi import (
     APIRouter,
 )
 from fastapi.middleware.cors import CORSMiddleware
-from fastapi.responses import FileResponse
+from fastapi.responses import FileResponse, StreamingResponse
 from pydantic import BaseModel
 
 
@@ -49,6 +54,24 @@ from open_webui.env import (
     SRC_LOG_LEVELS,
     DEVICE_TYPE,
     ENABLE_FORWARD_USER_INFO_HEADERS,
+    WHISPER_WORKER_POOL_SIZE,
+    WHISPER_WORKER_CPU_THREADS,
+    WHISPER_MAX_QUEUE_SIZE,
+    AUDIO_SPLIT_ON_SILENCE,
+    TTS_CACHE_MAX_SIZE_MB,
+    TTS_MAX_CONCURRENT_SYNTHESIS,
+)
+from open_webui.utils.whisper import (
+    WhisperWorkerPool,
+    WhisperWorkerPoolBusyError,
+    get_segment_data,
+    get_transcription_info_data,
+    load_whisper_model,
+)
+from open_webui.utils.speech_cache import (
+    SpeechCache,
+    get_speech_cache_key,
+    split_speech_text,
 )
 
 
@@ -65,6 +88,9 @@ log.setLevel(SRC_LOG_LEVELS["AUDIO"])
 
 SPEECH_CACHE_DIR = CACHE_DIR / "audio" / "speech"
 SPEECH_CACHE_DIR.mkdir(parents=True, exist_ok=True)
+SPEECH_CACHE = SpeechCache(
+    SPEECH_CACHE_DIR, max_size=TTS_CACHE_MAX_SIZE_MB * 1024 * 1024
+)
 
 
 ##########################################
@@ -107,41 +133,52 @@ def is_audio_conversion_required(file_path):
         return False
 
 
-def convert_audio_to_mp3(file_path):
-    """Convert audio file to mp3 format."""
-    try:
-        output_path = os.path.splitext(file_path)[0] + ".mp3"
-        audio = AudioSegment.from_file(file_path)
-        audio.export(output_path, format="mp3")
-        log.info(f"Converted {file_path} to {output_path}")
-        return output_path
-    except Exception as e:
-        log.error(f"Error converting audio file: {e}")
-        return None
+def get_faster_whisper_kwargs(model: str, auto_update: bool = False) -> dict:
+    return {
+        "model_size_or_path": model,
+        "device": DEVICE_TYPE if DEVICE_TYPE and DEVICE_TYPE == "cuda" else "cpu",
+        "compute_type": "int8",
+        "download_root": WHISPER_MODEL_DIR,
+        "local_files_only": not auto_update,
+    }
 
 
 def set_faster_whisper_model(model: str, auto_update: bool = False):
     whisper_model = None
     if model:
-        from faster_whisper import WhisperModel
-
-        faster_whisper_kwargs = {
-            "model_size_or_path": model,
-            "device": DEVICE_TYPE if DEVICE_TYPE and DEVICE_TYPE == "cuda" else "cpu",
-            "compute_type": "int8",
-            "download_root": WHISPER_MODEL_DIR,
-            "local_files_only": not auto_update,
-        }
+        whisper_model = load_whisper_model(
+            get_faster_whisper_kwargs(model, auto_update)
+        )
+    return whisper_model
 
-        try:
-            whisper_model = WhisperModel(**faster_whisper_kwargs)
-        except Exception:
-            log.warning(
-                "WhisperModel initialization failed, attempting download with local_files_only=False"
+
+WHISPER_WORKER_POOL_LOCK = threading.Lock()
+
+
+def get_whisper_worker_pool(request) -> Optional[WhisperWorkerPool]:
+    """
+    Returns the whisper worker process pool for the configured model, or None
+    when transcription runs on the in-process model.
+    """
+    if WHISPER_WORKER_POOL_SIZE <= 0 or not request.app.state.config.WHISPER_MODEL:
+        return None
+
+    with WHISPER_WORKER_POOL_LOCK:
+        pool = request.app.state.WHISPER_WORKER_POOL
+        if pool is None or pool.model != request.app.state.config.WHISPER_MODEL:
+            if pool is not None:
+                pool.shutdown()
+
+            pool = WhisperWorkerPool(
+                get_faster_whisper_kwargs(
+                    request.app.state.config.WHISPER_MODEL, WHISPER_MODEL_AUTO_UPDATE
+                ),
+                size=WHISPER_WORKER_POOL_SIZE,
+                cpu_threads=WHISPER_WORKER_CPU_THREADS,
+                max_queue_size=WHISPER_MAX_QUEUE_SIZE,
             )
-            faster_whisper_kwargs["local_files_only"] = False
-            whisper_model = WhisperModel(**faster_whisper_kwargs)
-    return whisper_model
+            request.app.state.WHISPER_WORKER_POOL = pool
+        return pool
 
 
 ##########################################
@@ -254,11 +291,19 @@ async def update_audio_config(
     )
 
     if request.app.state.config.STT_ENGINE == "":
-        request.app.state.faster_whisper_model = set_faster_whisper_model(
-            form_data.stt.WHISPER_MODEL, WHISPER_MODEL_AUTO_UPDATE
-        )
+        if WHISPER_WORKER_POOL_SIZE > 0:
+            # The worker processes load the model, restart them with the new one
+            get_whisper_worker_pool(request)
+        else:
+            request.app.state.faster_whisper_model = set_faster_whisper_model(
+                form_data.stt.WHISPER_MODEL, WHISPER_MODEL_AUTO_UPDATE
+            )
     else:
         request.app.state.faster_whisper_model = None
+        with WHISPER_WORKER_POOL_LOCK:
+            if request.app.state.WHISPER_WORKER_POOL is not None:
+                request.app.state.WHISPER_WORKER_POOL.shutdown()
+                request.app.state.WHISPER_WORKER_POOL = None
 
     return {
         "tts": {
@@ -305,32 +350,32 @@ def load_speech_pipeline(request):
         )
 
 
-@router.post("/speech")
-async def speech(request: Request, user=Depends(get_verified_user)):
-    body = await request.body()
-    name = hashlib.sha256(
-        body
-        + str(request.app.state.config.TTS_ENGINE).encode("utf-8")
-        + str(request.app.state.config.TTS_MODEL).encode("utf-8")
-    ).hexdigest()
+def get_speech_voice(request, payload: dict) -> str:
+    engine = request.app.state.config.TTS_ENGINE
+    if engine == "azure":
+        return f"{request.app.state.config.TTS_VOICE}:{request.app.state.config.TTS_AZURE_SPEECH_OUTPUT_FORMAT}"
+    elif engine == "transformers":
+        return request.app.state.config.TTS_MODEL
+    return str(payload.get("voice", ""))
 
-    file_path = SPEECH_CACHE_DIR.joinpath(f"{name}.mp3")
-    file_body_path = SPEECH_CACHE_DIR.joinpath(f"{name}.json")
 
-    # Check if the file already exists in the cache
-    if file_path.is_file():
-        return FileResponse(file_path)
+def is_speech_concatenable(request, payload: dict) -> bool:
+    """Whether sentences synthesized separately can be streamed back to back."""
+    engine = request.app.state.config.TTS_ENGINE
+    if engine == "openai":
+        return payload.get("response_format", "mp3") == "mp3"
+    elif engine == "elevenlabs":
+        return True
+    elif engine == "azure":
+        return "mp3" in request.app.state.config.TTS_AZURE_SPEECH_OUTPUT_FORMAT
+    # The transformers pipeline runs locally and one call at a time
+    return False
 
-    payload = None
-    try:
-        payload = json.loads(body.decode("utf-8"))
-    except Exception as e:
-        log.exception(e)
-        raise HTTPException(status_code=400, detail="Invalid JSON payload")
 
+async def synthesize_speech(request, payload: dict, user) -> bytes:
     r = None
     if request.app.state.config.TTS_ENGINE == "openai":
-        payload["model"] = request.app.state.config.TTS_MODEL
+        payload = {**payload, "model": request.app.state.config.TTS_MODEL}
 
         try:
             timeout = aiohttp.ClientTimeout(total=AIOHTTP_CLIENT_TIMEOUT)
@@ -358,14 +403,7 @@ async def speech(request: Request, user=Depends(get_verified_user)):
                 )
 
                 r.raise_for_status()
-
-                async with aiofiles.open(file_path, "wb") as f:
-                    await f.write(await r.read())
-
-                async with aiofiles.open(file_body_path, "w") as f:
-                    await f.write(json.dumps(payload))
-
-            return FileResponse(file_path)
+                return await r.read()
 
         except Exception as e:
             log.exception(e)
@@ -392,12 +430,6 @@ async def speech(request: Request, user=Depends(get_verified_user)):
     elif request.app.state.config.TTS_ENGINE == "elevenlabs":
         voice_id = payload.get("voice", "")
 
-        if voice_id not in get_available_voices(request):
-            raise HTTPException(
-                status_code=400,
-                detail="Invalid voice id",
-            )
-
         try:
             timeout = aiohttp.ClientTimeout(total=AIOHTTP_CLIENT_TIMEOUT)
             async with aiohttp.ClientSession(
@@ -418,14 +450,7 @@ async def speech(request: Request, user=Depends(get_verified_user)):
                     ssl=AIOHTTP_CLIENT_SESSION_SSL,
                 ) as r:
                     r.raise_for_status()
-
-                    async with aiofiles.open(file_path, "wb") as f:
-                        await f.write(await r.read())
-
-                    async with aiofiles.open(file_body_path, "w") as f:
-                        await f.write(json.dumps(payload))
-
-            return FileResponse(file_path)
+                    return await r.read()
 
         except Exception as e:
             log.exception(e)
@@ -445,12 +470,6 @@ async def speech(request: Request, user=Depends(get_verified_user)):
             )
 
     elif request.app.state.config.TTS_ENGINE == "azure":
-        try:
-            payload = json.loads(body.decode("utf-8"))
-        except Exception as e:
-            log.exception(e)
-            raise HTTPException(status_code=400, detail="Invalid JSON payload")
-
         region = request.app.state.config.TTS_AZURE_SPEECH_REGION or "eastus"
         base_url = request.app.state.config.TTS_AZURE_SPEECH_BASE_URL
         language = request.app.state.config.TTS_VOICE
@@ -477,14 +496,7 @@ async def speech(request: Request, user=Depends(get_verified_user)):
                     ssl=AIOHTTP_CLIENT_SESSION_SSL,
                 ) as r:
                     r.raise_for_status()
-
-                    async with aiofiles.open(file_path, "wb") as f:
-                        await f.write(await r.read())
-
-                    async with aiofiles.open(file_body_path, "w") as f:
-                        await f.write(json.dumps(payload))
-
-                    return FileResponse(file_path)
+                    return await r.read()
 
         except Exception as e:
             log.exception(e)
@@ -504,46 +516,131 @@ async def speech(request: Request, user=Depends(get_verified_user)):
             )
 
     elif request.app.state.config.TTS_ENGINE == "transformers":
-        payload = None
-        try:
-            payload = json.loads(body.decode("utf-8"))
-        except Exception as e:
-            log.exception(e)
-            raise HTTPException(status_code=400, detail="Invalid JSON payload")
-
         import torch
         import soundfile as sf
 
-        load_speech_pipeline(request)
+        def synthesize() -> bytes:
+            load_speech_pipeline(request)
 
-        embeddings_dataset = request.app.state.speech_speaker_embeddings_dataset
+            embeddings_dataset = request.app.state.speech_speaker_embeddings_dataset
 
-        speaker_index = 6799
-        try:
-            speaker_index = embeddings_dataset["filename"].index(
-                request.app.state.config.TTS_MODEL
+            speaker_index = 6799
+            try:
+                speaker_index = embeddings_dataset["filename"].index(
+                    request.app.state.config.TTS_MODEL
+                )
+            except Exception:
+                pass
+
+            speaker_embedding = torch.tensor(
+                embeddings_dataset[speaker_index]["xvector"]
+            ).unsqueeze(0)
+
+            speech = request.app.state.speech_synthesiser(
+                payload["input"],
+                forward_params={"speaker_embeddings": speaker_embedding},
             )
-        except Exception:
-            pass
 
-        speaker_embedding = torch.tensor(
-            embeddings_dataset[speaker_index]["xvector"]
-        ).unsqueeze(0)
+            buffer = io.BytesIO()
+            sf.write(
+                buffer,
+                speech["audio"],
+                samplerate=speech["sampling_rate"],
+                format="MP3",
+            )
+            return buffer.getvalue()
 
-        speech = request.app.state.speech_synthesiser(
-            payload["input"],
-            forward_params={"speaker_embeddings": speaker_embedding},
+        return await asyncio.to_thread(synthesize)
+
+    raise HTTPException(
+        status_code=400,
+        detail=f"Unsupported TTS engine: {request.app.state.config.TTS_ENGINE}",
+    )
+
+
+@router.post("/speech")
+async def speech(request: Request, user=Depends(get_verified_user)):
+    try:
+        payload = json.loads((await request.body()).decode("utf-8"))
+        text = str(payload["input"])
+    except Exception as e:
+        log.exception(e)
+        raise HTTPException(status_code=400, detail="Invalid JSON payload")
+
+    engine = request.app.state.config.TTS_ENGINE
+    model = request.app.state.config.TTS_MODEL
+    voice = get_speech_voice(request, payload)
+    options = {k: v for k, v in payload.items() if k not in ("input", "model")}
+
+    if engine == "elevenlabs" and voice not in get_available_voices(request):
+        raise HTTPException(
+            status_code=400,
+            detail="Invalid voice id",
+        )
+
+    sentences = (
+        split_speech_text(text, request.app.state.config.TTS_SPLIT_ON)
+        if is_speech_concatenable(request, payload)
+        else []
+    ) or [text]
+
+    def get_sentence_audio(sentence: str):
+        return SPEECH_CACHE.get_or_synthesize(
+            get_speech_cache_key(engine, model, voice, sentence, options),
+            lambda: synthesize_speech(request, {**payload, "input": sentence}, user),
         )
 
-        sf.write(file_path, speech["audio"], samplerate=speech["sampling_rate"])
+    if len(sentences) == 1:
+        return FileResponse(await get_sentence_audio(sentences[0]))
+
+    # Uncached sentences are synthesized concurrently and streamed back in order
+    semaphore = asyncio.Semaphore(TTS_MAX_CONCURRENT_SYNTHESIS)
+
+    async def get_bounded_sentence_audio(sentence: str):
+        async with semaphore:
+            return await get_sentence_audio(sentence)
+
+    tasks = [
+        asyncio.create_task(get_bounded_sentence_audio(sentence))
+        for sentence in sentences
+    ]
+
+    try:
+        # Errors on the first sentence are still returned with their status code
+        first_path = await tasks[0]
+    except BaseException:
+        for task in tasks:
+            task.cancel()
+        raise
+
+    async def stream_speech():
+        index = 0
+        try:
+            for index, task in enumerate(tasks):
+                path = first_path if index == 0 else await task
+                async with aiofiles.open(path, "rb") as f:
+                    while chunk := await f.read(64 * 1024):
+                        yield chunk
+        except Exception as e:
+            # The 200 status is already sent: abort the response so the client
+            # gets an incomplete body instead of audio that just ends early
+            log.exception(
+                f"Speech synthesis failed at sentence {index + 1} of {len(tasks)}: {e}"
+            )
+            raise
+        finally:
+            for task in tasks:
+                task.cancel()
+
+    return StreamingResponse(stream_speech(), media_type="audio/mpeg")
 
-        async with aiofiles.open(file_body_path, "w") as f:
-            await f.write(json.dumps(payload))
 
-        return FileResponse(file_path)
+@router.get("/speech/cache/stats")
+async def get_speech_cache_stats(user=Depends(get_admin_user)):
+    return SPEECH_CACHE.stats()
 
 
-def transcription_handler(request, file_path, metadata):
+def transcription_handler(request, file_path, metadata, user=None, on_segment=None):
     filename = os.path.basename(file_path)
     file_dir = os.path.dirname(file_path)
     id = filename.split(".")[0]
@@ -551,28 +648,47 @@ def transcription_handler(request, file_path, metadata):
     metadata = metadata or {}
 
     if request.app.state.config.STT_ENGINE == "":
-        if request.app.state.faster_whisper_model is None:
-            request.app.state.faster_whisper_model = set_faster_whisper_model(
-                request.app.state.config.WHISPER_MODEL
-            )
-
-        model = request.app.state.faster_whisper_model
-        segments, info = model.transcribe(
-            file_path,
-            beam_size=5,
-            vad_filter=request.app.state.config.WHISPER_VAD_FILTER,
-            language=(
+        options = {
+            "beam_size": 5,
+            "vad_filter": request.app.state.config.WHISPER_VAD_FILTER,
+            "language": (
                 metadata.get("language", None)
                 if WHISPER_LANGUAGE == ""
                 else WHISPER_LANGUAGE
             ),
-        )
+        }
+
+        pool = get_whisper_worker_pool(request)
+        if pool is not None:
+            segments, info = pool.transcribe(
+                file_path,
+                options,
+                user_id=user.id if user else "",
+                on_segment=on_segment,
+            )
+        else:
+            if request.app.state.faster_whisper_model is None:
+                request.app.state.faster_whisper_model = set_faster_whisper_model(
+                    request.app.state.config.WHISPER_MODEL
+                )
+
+            model = request.app.state.faster_whisper_model
+            whisper_segments, whisper_info = model.transcribe(file_path, **options)
+            info = get_transcription_info_data(whisper_info)
+
+            segments = []
+            for segment in whisper_segments:
+                segment = get_segment_data(segment)
+                segments.append(segment)
+                if on_segment:
+                    on_segment(segment)
+
         log.info(
             "Detected language '%s' with probability %f"
-            % (info.language, info.language_probability)
+            % (info.get("language"), info.get("language_probability") or 0)
         )
 
-        transcript = "".join([segment.text for segment in list(segments)])
+        transcript = "".join([segment["text"] for segment in segments])
         data = {"text": transcript.strip()}
 
         # save the transcript to a json file
@@ -806,40 +922,74 @@ def transcription_handler(request, file_path, metadata):
             )
 
 
-def transcribe(request: Request, file_path: str, metadata: Optional[dict] = None):
+def transcribe(
+    request: Request,
+    file_path: str,
+    metadata: Optional[dict] = None,
+    user=None,
+    on_segment=None,
+):
+    """
+    Transcribes `file_path`, splitting it into chunks that are transcribed in
+    parallel when it is too large. `on_segment` receives every segment as soon
+    as it is decoded, tagged with the index of its chunk.
+    """
     log.info(f"transcribe: {file_path} {metadata}")
 
-    if is_audio_conversion_required(file_path):
-        file_path = convert_audio_to_mp3(file_path)
-
-    try:
-        file_path = compress_audio(file_path)
-    except Exception as e:
-        log.exception(e)
-
-    # Always produce a list of chunk paths (could be one entry if small)
-    try:
-        chunk_paths = split_audio(file_path, MAX_FILE_SIZE)
-        print(f"Chunk paths: {chunk_paths}")
-    except Exception as e:
-        log.exception(e)
-        raise HTTPException(
-            status_code=status.HTTP_400_BAD_REQUEST,
-            detail=ERROR_MESSAGES.DEFAULT(e),
+    if (
+        not is_audio_conversion_required(file_path)
+        and os.path.getsize(file_path) <= MAX_FILE_SIZE
+    ):
+        chunk_paths = iter([file_path])
+    else:
+        # A single ffmpeg pass converts, compresses and splits the audio
+        chunk_paths = segment_audio(
+            file_path, MAX_FILE_SIZE, cut_on_silence=AUDIO_SPLIT_ON_SILENCE
         )
 
     results = []
+    futures = []
     try:
         with ThreadPoolExecutor() as executor:
-            # Submit tasks for each chunk_path
-            futures = [
-                executor.submit(transcription_handler, request, chunk_path, metadata)
-                for chunk_path in chunk_paths
-            ]
-            # Gather results as they complete
+            # Chunks are transcribed while ffmpeg is still writing the next ones
+            try:
+                for chunk, chunk_path in enumerate(chunk_paths):
+                    futures.append(
+                        executor.submit(
+                            transcription_handler,
+                            request,
+                            chunk_path,
+                            metadata,
+                            user=user,
+                            on_segment=(
+                                (
+                                    lambda segment, chunk=chunk: on_segment(
+                                        {**segment, "chunk": chunk}
+                                    )
+                                )
+                                if on_segment
+                                else None
+                            ),
+                        )
+                    )
+            except Exception as e:
+                log.exception(e)
+                for future in futures:
+                    future.cancel()
+                raise HTTPException(
+                    status_code=status.HTTP_400_BAD_REQUEST,
+                    detail=ERROR_MESSAGES.DEFAULT(e),
+                )
+
+            # Gather results in chunk order
             for future in futures:
                 try:
                     results.append(future.result())
+                except WhisperWorkerPoolBusyError as e:
+                    raise HTTPException(
+                        status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+                        detail=str(e),
+                    )
                 except Exception as transcribe_exc:
                     raise HTTPException(
                         status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
@@ -847,78 +997,160 @@ def transcribe(request: Request, file_path: str, metadata: Optional[dict] = None
                     )
     finally:
         # Clean up only the temporary chunks, never the original file
-        for chunk_path in chunk_paths:
-            if chunk_path != file_path and os.path.isfile(chunk_path):
-                try:
-                    os.remove(chunk_path)
-                except Exception:
-                    pass
+        for chunk_path in glob.glob(get_chunk_path_pattern(file_path, "*")):
+            try:
+                os.remove(chunk_path)
+            except Exception:
+                pass
 
     return {
         "text": " ".join([result["text"] for result in results]),
     }
 
 
-def compress_audio(file_path):
-    if os.path.getsize(file_path) > MAX_FILE_SIZE:
-        id = os.path.splitext(os.path.basename(file_path))[
-            0
-        ]  # Handles names with multiple dots
-        file_dir = os.path.dirname(file_path)
+def get_chunk_path_pattern(file_path: str, index: str = "%03d") -> str:
+    base, _ = os.path.splitext(file_path)
+    return f"{glob.escape(base) if index == '*' else base}_chunk_{index}.mp3"
 
-        audio = AudioSegment.from_file(file_path)
-        audio = audio.set_frame_rate(16000).set_channels(1)  # Compress audio
 
-        compressed_path = os.path.join(file_dir, f"{id}_compressed.mp3")
-        audio.export(compressed_path, format="mp3", bitrate="32k")
-        # log.debug(f"Compressed audio to {compressed_path}")  # Uncomment if log is defined
+def get_silence_points(file_path: str, noise: str = "-35dB", duration: float = 0.5):
+    """Returns the midpoints (in seconds) of the silent stretches of the file."""
+    result = subprocess.run(
+        [
+            AudioSegment.converter,
+            "-hide_banner",
+            "-nostdin",
+            "-i",
+            file_path,
+            "-vn",
+            "-af",
+            f"silencedetect=noise={noise}:d={duration}",
+            "-f",
+            "null",
+            "-",
+        ],
+        capture_output=True,
+        text=True,
+        check=True,
+    )
 
-        return compressed_path
-    else:
-        return file_path
+    points = []
+    silence_start = None
+    for line in result.stderr.splitlines():
+        if match := re.search(r"silence_start: (-?[\d.]+)", line):
+            silence_start = max(float(match.group(1)), 0.0)
+        elif (match := re.search(r"silence_end: ([\d.]+)", line)) and (
+            silence_start is not None
+        ):
+            points.append((silence_start + float(match.group(1))) / 2)
+            silence_start = None
+    return points
 
 
-def split_audio(file_path, max_bytes, format="mp3", bitrate="32k"):
+def get_segment_times(
+    duration: float, chunk_seconds: float, silence_points: list[float]
+) -> list[float]:
     """
-    Splits audio into chunks not exceeding max_bytes.
-    Returns a list of chunk file paths. If audio fits, returns list with original path.
+    Cut points at most `chunk_seconds` apart, each moved back to the latest
+    silence within the last quarter of its chunk when there is one.
     """
-    file_size = os.path.getsize(file_path)
-    if file_size <= max_bytes:
-        return [file_path]  # Nothing to split
-
-    audio = AudioSegment.from_file(file_path)
-    duration_ms = len(audio)
-    orig_size = file_size
+    times = []
+    last = 0.0
+    while duration - last > chunk_seconds:
+        target = last + chunk_seconds
+        candidates = [
+            point
+            for point in silence_points
+            if target - chunk_seconds / 4 <= point <= target
+        ]
+        last = candidates[-1] if candidates else target
+        times.append(last)
+    return times
 
-    approx_chunk_ms = max(int(duration_ms * (max_bytes / orig_size)) - 1000, 1000)
-    chunks = []
-    start = 0
-    i = 0
 
-    base, _ = os.path.splitext(file_path)
-
-    while start < duration_ms:
-        end = min(start + approx_chunk_ms, duration_ms)
-        chunk = audio[start:end]
-        chunk_path = f"{base}_chunk_{i}.{format}"
-        chunk.export(chunk_path, format=format, bitrate=bitrate)
+def segment_audio(
+    file_path: str,
+    max_bytes: int,
+    bitrate: str = "32k",
+    cut_on_silence: bool = False,
+) -> Iterator[str]:
+    """
+    Re-encodes the audio to mono 16 kHz MP3 and splits it into chunks below
+    `max_bytes` in a single streaming ffmpeg pass, so the file is decoded once
+    and never held in memory. Yields each chunk path as soon as ffmpeg has
+    finished writing it.
+    """
+    # Constant bitrate output: the chunk length follows from the bitrate, with
+    # 10% headroom for frame and header overhead
+    bytes_per_second = int(bitrate.rstrip("k")) * 1000 / 8
+    chunk_seconds = max(int(max_bytes * 0.9 / bytes_per_second), 1)
+
+    command = [
+        AudioSegment.converter,
+        "-hide_banner",
+        "-loglevel",
+        "error",
+        "-nostdin",
+        "-y",
+        "-i",
+        file_path,
+        "-vn",
+        "-ac",
+        "1",
+        "-ar",
+        "16000",
+        "-c:a",
+        "libmp3lame",
+        "-b:a",
+        bitrate,
+        "-f",
+        "segment",
+        "-reset_timestamps",
+        "1",
+        # Report every finished chunk on stdout
+        "-segment_list",
+        "pipe:1",
+        "-segment_list_type",
+        "flat",
+    ]
+
+    segment_times = []
+    if cut_on_silence:
+        try:
+            duration = float(mediainfo(file_path).get("duration") or 0)
+            if duration > chunk_seconds:
+                segment_times = get_segment_times(
+                    duration, chunk_seconds, get_silence_points(file_path)
+                )
+        except Exception as e:
+            log.warning(f"Silence detection failed, splitting at fixed lengths: {e}")
 
-        # Reduce chunk duration if still too large
-        while os.path.getsize(chunk_path) > max_bytes and (end - start) > 5000:
-            end = start + ((end - start) // 2)
-            chunk = audio[start:end]
-            chunk.export(chunk_path, format=format, bitrate=bitrate)
+    if segment_times:
+        command += ["-segment_times", ",".join(f"{t:.3f}" for t in segment_times)]
+    else:
+        command += ["-segment_time", str(chunk_seconds)]
+    command.append(get_chunk_path_pattern(file_path))
 
-        if os.path.getsize(chunk_path) > max_bytes:
-            os.remove(chunk_path)
-            raise Exception("Audio chunk cannot be reduced below max file size.")
+    file_dir = os.path.dirname(file_path)
+    process = subprocess.Popen(
+        command, stdout=subprocess.PIPE, stderr=subprocess.PIPE, text=True
+    )
+    try:
+        for line in process.stdout:
+            if not line.strip():
+                continue
 
-        chunks.append(chunk_path)
-        start = end
-        i += 1
+            chunk_path = os.path.join(file_dir, os.path.basename(line.strip()))
+            if os.path.getsize(chunk_path) > max_bytes:
+                raise Exception("Audio chunk cannot be reduced below max file size.")
+            yield chunk_path
 
-    return chunks
+        if process.wait() != 0:
+            raise Exception(f"Error splitting audio: {process.stderr.read().strip()}")
+    finally:
+        if process.poll() is None:
+            process.kill()
+            process.wait()
 
 
 @router.post("/transcriptions")
@@ -926,6 +1158,7 @@ def transcription(
     request: Request,
     file: UploadFile = File(...),
     language: Optional[str] = Form(None),
+    stream: bool = Form(False),
     user=Depends(get_verified_user),
 ):
     log.info(f"file.content_type: {file.content_type}")
@@ -968,13 +1201,21 @@ def transcription(
             if language:
                 metadata = {"language": language}
 
-            result = transcribe(request, file_path, metadata)
+            if stream:
+                return StreamingResponse(
+                    stream_transcription(request, file_path, metadata, user),
+                    media_type="text/event-stream",
+                )
+
+            result = transcribe(request, file_path, metadata, user=user)
 
             return {
                 **result,
                 "filename": os.path.basename(file_path),
             }
 
+        except HTTPException as e:
+            raise e
         except Exception as e:
             log.exception(e)
 
@@ -983,6 +1224,8 @@ def transcription(
                 detail=ERROR_MESSAGES.DEFAULT(e),
             )
 
+    except HTTPException as e:
+        raise e
     except Exception as e:
         log.exception(e)
 
@@ -992,6 +1235,46 @@ def transcription(
         )
 
 
+def stream_transcription(request, file_path, metadata, user):
+    """
+    Server-sent events for a transcription: a `segment` event per decoded
+    segment followed by a final `done` (or `error`) event with the full text.
+    """
+    events = queue.Queue()
+
+    def run():
+        try:
+            result = transcribe(
+                request,
+                file_path,
+                metadata,
+                user=user,
+                on_segment=lambda segment: events.put(
+                    {"type": "segment", "segment": segment}
+                ),
+            )
+            events.put(
+                {"type": "done", **result, "filename": os.path.basename(file_path)}
+            )
+        except Exception as e:
+            log.exception(e)
+            events.put({"type": "error", "error": str(getattr(e, "detail", e))})
+
+    threading.Thread(target=run, daemon=True).start()
+
+    while True:
+        event = events.get()
+        yield f"data: {json.dumps(event)}\n\n"
+        if event["type"] != "segment":
+            break
+
+
+@router.get("/transcriptions/stats")
+async def get_transcription_stats(request: Request, user=Depends(get_admin_user)):
+    pool = request.app.state.WHISPER_WORKER_POOL
+    return pool.stats() if pool is not None else {"workers": 0}
+
+
 def get_available_models(request: Request) -> list[dict]:
     available_models = []
     if request.app.state.config.TTS_ENGINE == "openai":
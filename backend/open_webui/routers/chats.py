@@ -1,6 +1,11 @@
+import asyncio
 import json
 import logging
-from typing import Optional
+import os
+import time
+import uuid
+import zlib
+from typing import AsyncIterator, Iterator, Optional
 
 
 from open_webui.socket.main import get_event_emitter
@@ -9,20 +14,27 @@ from open_webui.models.chats import (
     ChatImportForm,
     ChatResponse,
     Chats,
+    ChatModel,
     ChatTitleIdResponse,
 )
 from open_webui.models.tags import TagModel, Tags
 from open_webui.models.folders import Folders
 
-from open_webui.config import ENABLE_ADMIN_CHAT_ACCESS, ENABLE_ADMIN_EXPORT
+from open_webui.config import CACHE_DIR, ENABLE_ADMIN_CHAT_ACCESS, ENABLE_ADMIN_EXPORT
 from open_webui.constants import ERROR_MESSAGES
 from open_webui.env import SRC_LOG_LEVELS
 from fastapi import APIRouter, Depends, HTTPException, Request, status
+from fastapi.responses import StreamingResponse
 from pydantic import BaseModel
 
 
 from open_webui.utils.auth import get_admin_user, get_verified_user
 from open_webui.utils.access_control import has_permission
+from open_webui.utils.files import (
+    copy_chat_images,
+    externalize_chat_images,
+    update_shared_chat_images,
+)
 
 log = logging.getLogger(__name__)
 log.setLevel(SRC_LOG_LEVELS["MODELS"])
@@ -123,6 +135,7 @@ async def get_user_chat_list_by_user_id(
 @router.post("/new", response_model=Optional[ChatResponse])
 async def create_new_chat(form_data: ChatForm, user=Depends(get_verified_user)):
     try:
+        await asyncio.to_thread(externalize_chat_images, form_data.chat, user.id)
         chat = Chats.insert_new_chat(user.id, form_data)
         return ChatResponse(**chat.model_dump())
     except Exception as e:
@@ -140,6 +153,7 @@ async def create_new_chat(form_data: ChatForm, user=Depends(get_verified_user)):
 @router.post("/import", response_model=Optional[ChatResponse])
 async def import_chat(form_data: ChatImportForm, user=Depends(get_verified_user)):
     try:
+        await asyncio.to_thread(externalize_chat_images, form_data.chat, user.id)
         chat = Chats.import_chat(user.id, form_data)
         if chat:
             tags = chat.meta.get("tags", [])
@@ -160,6 +174,364 @@ async def import_chat(form_data: ChatImportForm, user=Depends(get_verified_user)
         )
 
 
+############################
+# BulkImportChats
+############################
+
+CHAT_IMPORT_DIR = CACHE_DIR / "chats" / "imports"
+CHAT_IMPORT_BATCH_SIZE = 500
+CHAT_IMPORT_BATCH_BYTES = 16 * 1024 * 1024
+CHAT_IMPORT_MAX_ERRORS = 100
+
+# Namespace of the ids given to imported chats, derived from the job and line
+# so a resumed import recognizes the chats it already inserted
+CHAT_IMPORT_NAMESPACE = uuid.UUID("8f0f6c1e-2b7a-4f57-9d55-3f1b0c6e2a94")
+
+# Imports running in this process, by job id
+CHAT_IMPORT_JOBS: dict[str, dict] = {}
+
+
+def get_chat_import_path(job_id: str):
+    return CHAT_IMPORT_DIR / f"{job_id}.json"
+
+
+def load_chat_import_job(job_id: str) -> Optional[dict]:
+    try:
+        with open(get_chat_import_path(job_id)) as f:
+            return json.load(f)
+    except FileNotFoundError:
+        return None
+
+
+def save_chat_import_job(job: dict):
+    CHAT_IMPORT_DIR.mkdir(parents=True, exist_ok=True)
+    path = get_chat_import_path(job["id"])
+    tmp_path = path.with_name(f"{path.name}.{uuid.uuid4().hex}.part")
+    with open(tmp_path, "w") as f:
+        json.dump(job, f)
+    os.replace(tmp_path, path)
+
+
+async def iter_chat_import_lines(stream: AsyncIterator[bytes]) -> AsyncIterator[bytes]:
+    """Splits a request body into lines, decompressing it if it is gzipped."""
+    decompressor = None
+    head = b""
+    parts = []
+
+    def split(data: bytes) -> Iterator[bytes]:
+        nonlocal parts
+        start = 0
+        while (end := data.find(b"\n", start)) != -1:
+            parts.append(data[start:end])
+            yield b"".join(parts)
+            parts = []
+            start = end + 1
+        parts.append(data[start:])
+
+    async for chunk in stream:
+        if head is not None:
+            head += chunk
+            if len(head) < 2:
+                continue
+            if head.startswith(b"\x1f\x8b"):
+                decompressor = zlib.decompressobj(wbits=31)
+            chunk, head = head, None
+
+        if decompressor:
+            chunk = decompressor.decompress(chunk)
+        for line in split(chunk):
+            yield line
+
+    data = head or b""
+    if decompressor:
+        data += decompressor.flush()
+    for line in split(data):
+        yield line
+    if any(parts):
+        yield b"".join(parts)
+
+
+def get_chat_import_model(
+    record: dict, line_number: int, job: dict, user_id: str
+) -> ChatModel:
+    chat = record.get("chat")
+    if not isinstance(chat, dict):
+        raise ValueError("Missing chat")
+
+    now = int(time.time())
+    id = str(uuid.uuid5(CHAT_IMPORT_NAMESPACE, f"{job['id']}:{line_number}"))
+    if job["preserve_ids"]:
+        id = record.get("id") or id
+        user_id = record.get("user_id") or user_id
+
+    chat_model = ChatModel(
+        id=id,
+        user_id=user_id,
+        title=record.get("title") or chat.get("title") or "New Chat",
+        chat=chat,
+        created_at=record.get("created_at") or now,
+        updated_at=record.get("updated_at") or now,
+        share_id=record.get("share_id") if job["preserve_ids"] else None,
+        archived=record.get("archived") or False,
+        pinned=record.get("pinned") or False,
+        meta=record.get("meta") or {},
+        folder_id=record.get("folder_id") if job["preserve_ids"] else None,
+    )
+    externalize_chat_images(chat_model.chat, chat_model.user_id)
+    return chat_model
+
+
+def insert_chat_import_tags(chats: list[ChatModel]):
+    tags = set()
+    for chat in chats:
+        for tag_id in chat.meta.get("tags", []):
+            tag_id = tag_id.replace(" ", "_").lower()
+            if tag_id != "none":
+                tags.add((tag_id, chat.user_id))
+
+    for tag_id, user_id in tags:
+        tag_name = " ".join([word.capitalize() for word in tag_id.split("_")])
+        if Tags.get_tag_by_name_and_user_id(tag_name, user_id) is None:
+            Tags.insert_new_tag(tag_name, user_id)
+
+
+def import_chat_batch(lines: list[tuple[int, bytes]], job: dict, user_id: str):
+    chats = {}
+    failed = 0
+    for line_number, line in lines:
+        try:
+            chat = get_chat_import_model(json.loads(line), line_number, job, user_id)
+            chats[chat.id] = chat
+        except Exception as e:
+            failed += 1
+            if len(job["errors"]) < CHAT_IMPORT_MAX_ERRORS:
+                job["errors"].append({"line": line_number, "error": str(e)})
+
+    # Chats inserted before an interrupted import was resumed are skipped
+    existing_ids = Chats.get_existing_chat_ids(list(chats))
+    new_chats = [chat for id, chat in chats.items() if id not in existing_ids]
+    Chats.insert_chats(new_chats)
+    insert_chat_import_tags(new_chats)
+
+    job["imported"] += len(new_chats)
+    job["skipped"] += len(lines) - failed - len(new_chats)
+    job["failed"] += failed
+
+
+def get_chat_import_job(job_id: str) -> Optional[dict]:
+    try:
+        job_id = str(uuid.UUID(job_id))
+    except ValueError:
+        return None
+    return CHAT_IMPORT_JOBS.get(job_id) or load_chat_import_job(job_id)
+
+
+@router.post("/import/bulk")
+async def import_chats_bulk(
+    request: Request,
+    job_id: Optional[str] = None,
+    preserve_ids: bool = False,
+    user=Depends(get_verified_user),
+):
+    """
+    Imports chats from a request body of newline-delimited JSON, as written by
+    the export endpoints, optionally gzipped. Lines are inserted in batches
+    while the body is still being received.
+
+    Progress is checkpointed after every batch. Sending the same file again
+    with the `job_id` of an interrupted import resumes it after the last
+    checkpoint. With `preserve_ids` (admins only) chats keep their ids, owners
+    and folders, for moving a whole instance.
+    """
+    if job_id:
+        job = get_chat_import_job(job_id)
+        if job is None or job["user_id"] != user.id:
+            raise HTTPException(
+                status_code=status.HTTP_404_NOT_FOUND,
+                detail=ERROR_MESSAGES.NOT_FOUND,
+            )
+        if job["id"] in CHAT_IMPORT_JOBS:
+            raise HTTPException(
+                status_code=status.HTTP_409_CONFLICT,
+                detail="This import is already running",
+            )
+        if job["status"] == "completed":
+            return job
+    else:
+        job = {
+            "id": str(uuid.uuid4()),
+            "user_id": user.id,
+            "preserve_ids": preserve_ids,
+            "status": "running",
+            "checkpoint": 0,
+            "lines": 0,
+            "imported": 0,
+            "skipped": 0,
+            "failed": 0,
+            "errors": [],
+            "error": None,
+            "started_at": int(time.time()),
+            "updated_at": int(time.time()),
+            "finished_at": None,
+        }
+
+    if job["preserve_ids"] and user.role != "admin":
+        raise HTTPException(
+            status_code=status.HTTP_401_UNAUTHORIZED,
+            detail=ERROR_MESSAGES.ACCESS_PROHIBITED,
+        )
+
+    job.update({"status": "running", "lines": 0, "error": None})
+    CHAT_IMPORT_JOBS[job["id"]] = job
+    checkpoint = job["checkpoint"]
+    batch = []
+    batch_size = 0
+
+    async def flush():
+        nonlocal batch, batch_size
+        if batch:
+            await asyncio.to_thread(import_chat_batch, batch, job, user.id)
+            batch, batch_size = [], 0
+        job["checkpoint"] = max(job["lines"], checkpoint)
+        job["updated_at"] = int(time.time())
+        await asyncio.to_thread(save_chat_import_job, job)
+
+    try:
+        await asyncio.to_thread(save_chat_import_job, job)
+
+        async for line in iter_chat_import_lines(request.stream()):
+            job["lines"] += 1
+            if job["lines"] <= checkpoint or not line.strip():
+                continue
+
+            batch.append((job["lines"], line))
+            batch_size += len(line)
+            if (
+                len(batch) >= CHAT_IMPORT_BATCH_SIZE
+                or batch_size >= CHAT_IMPORT_BATCH_BYTES
+            ):
+                await flush()
+
+        job["status"] = "completed"
+        job["finished_at"] = int(time.time())
+        await flush()
+        return job
+    except asyncio.CancelledError:
+        # The client went away, the job can be resumed from its checkpoint
+        job.update({**(load_chat_import_job(job["id"]) or {}), "status": "interrupted"})
+        save_chat_import_job(job)
+        raise
+    except Exception as e:
+        log.exception(f"Error importing chats: {e}")
+        job.update(
+            {
+                **(load_chat_import_job(job["id"]) or {}),
+                "status": "failed",
+                "error": str(e),
+            }
+        )
+        save_chat_import_job(job)
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=ERROR_MESSAGES.DEFAULT(e),
+        )
+    finally:
+        CHAT_IMPORT_JOBS.pop(job["id"], None)
+
+
+@router.get("/import/bulk/{job_id}")
+async def get_chat_import_status(job_id: str, user=Depends(get_verified_user)):
+    job = get_chat_import_job(job_id)
+    if job is None or (job["user_id"] != user.id and user.role != "admin"):
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND, detail=ERROR_MESSAGES.NOT_FOUND
+        )
+    return job
+
+
+############################
+# ExternalizeChatImages
+############################
+
+# Progress of the admin job that moves inline images of existing chats to files
+CHAT_IMAGES_MIGRATION_STATUS = {
+    "running": False,
+    "chats": 0,
+    "processed_chats": 0,
+    "images": 0,
+    "failed_chats": [],
+    "started_at": None,
+    "finished_at": None,
+}
+CHAT_IMAGES_MIGRATION_TASK = None
+
+
+def externalize_stored_chat_images(id: str) -> int:
+    chat = Chats.get_chat_by_id(id)
+    if chat is None:
+        return 0
+
+    data = chat.chat
+    count = externalize_chat_images(data, chat.user_id)
+    if count and not Chats.update_chat_data_by_id(id, data):
+        raise Exception("Failed to update chat")
+    return count
+
+
+async def externalize_all_chat_images():
+    status = CHAT_IMAGES_MIGRATION_STATUS
+    try:
+        ids = await asyncio.to_thread(Chats.get_chat_ids_with_inline_images)
+        status["chats"] = len(ids)
+
+        for id in ids:
+            try:
+                status["images"] += await asyncio.to_thread(
+                    externalize_stored_chat_images, id
+                )
+            except Exception as e:
+                log.exception(f"Error moving images of chat {id}: {e}")
+                status["failed_chats"].append(id)
+            status["processed_chats"] += 1
+    finally:
+        status["running"] = False
+        status["finished_at"] = int(time.time())
+        log.info(
+            f"Moved {status['images']} inline images of "
+            f"{status['processed_chats']} chats to files ({len(status['failed_chats'])} failed)"
+        )
+
+
+@router.get("/images/externalize")
+async def get_externalize_chat_images_status(user=Depends(get_admin_user)):
+    return CHAT_IMAGES_MIGRATION_STATUS
+
+
+@router.post("/images/externalize")
+async def externalize_chat_images_of_all_chats(user=Depends(get_admin_user)):
+    if CHAT_IMAGES_MIGRATION_STATUS["running"]:
+        raise HTTPException(
+            status_code=status.HTTP_409_CONFLICT,
+            detail="Chat images are already being moved",
+        )
+
+    CHAT_IMAGES_MIGRATION_STATUS.update(
+        {
+            "running": True,
+            "chats": 0,
+            "processed_chats": 0,
+            "images": 0,
+            "failed_chats": [],
+            "started_at": int(time.time()),
+            "finished_at": None,
+        }
+    )
+    # Keep a reference so the task isn't garbage collected while it runs
+    global CHAT_IMAGES_MIGRATION_TASK
+    CHAT_IMAGES_MIGRATION_TASK = asyncio.create_task(externalize_all_chat_images())
+    return CHAT_IMAGES_MIGRATION_STATUS
+
+
 ############################
 # GetChats
 ############################
@@ -240,6 +612,76 @@ async def get_user_chats(user=Depends(get_verified_user)):
     ]
 
 
+############################
+# ExportChats
+############################
+
+# Bytes of NDJSON gathered before a chunk is sent (or compressed)
+CHAT_EXPORT_CHUNK_SIZE = 256 * 1024
+
+
+def stream_chats_ndjson(user_id: Optional[str], compress: bool) -> Iterator[bytes]:
+    """
+    Yields chats as newline-delimited JSON, oldest first, optionally as a gzip
+    stream. Chats are read from the database in batches, so memory use stays
+    flat whatever the number of chats.
+    """
+    compressor = zlib.compressobj(wbits=31) if compress else None
+    chunk = []
+    chunk_size = 0
+
+    def encode(data: bytes) -> bytes:
+        return compressor.compress(data) if compressor else data
+
+    for chat in Chats.iter_chats(user_id):
+        line = (json.dumps(chat.model_dump(), ensure_ascii=False) + "\n").encode()
+        chunk.append(line)
+        chunk_size += len(line)
+        if chunk_size >= CHAT_EXPORT_CHUNK_SIZE:
+            data = encode(b"".join(chunk))
+            chunk, chunk_size = [], 0
+            if data:
+                yield data
+
+    data = encode(b"".join(chunk))
+    if compressor:
+        data += compressor.flush()
+    if data:
+        yield data
+
+
+def get_chats_export_response(
+    user_id: Optional[str], filename: str, compress: bool
+) -> StreamingResponse:
+    if compress:
+        filename = f"{filename}.ndjson.gz"
+        media_type = "application/gzip"
+    else:
+        filename = f"{filename}.ndjson"
+        media_type = "application/x-ndjson"
+
+    return StreamingResponse(
+        stream_chats_ndjson(user_id, compress),
+        media_type=media_type,
+        headers={"Content-Disposition": f'attachment; filename="{filename}"'},
+    )
+
+
+@router.get("/all/export")
+async def export_user_chats(gzip: bool = False, user=Depends(get_verified_user)):
+    return get_chats_export_response(user.id, f"chat-export-{int(time.time())}", gzip)
+
+
+@router.get("/all/db/export")
+async def export_all_chats_in_db(gzip: bool = False, user=Depends(get_admin_user)):
+    if not ENABLE_ADMIN_EXPORT:
+        raise HTTPException(
+            status_code=status.HTTP_401_UNAUTHORIZED,
+            detail=ERROR_MESSAGES.ACCESS_PROHIBITED,
+        )
+    return get_chats_export_response(None, f"chats-db-{int(time.time())}", gzip)
+
+
 ############################
 # GetArchivedChats
 ############################
@@ -417,6 +859,7 @@ async def update_chat_by_id(
 ):
     chat = Chats.get_chat_by_id_and_user_id(id, user.id)
     if chat:
+        await asyncio.to_thread(externalize_chat_images, form_data.chat, user.id)
         updated_chat = {**chat.chat, **form_data.chat}
         chat = Chats.update_chat_by_id(id, updated_chat)
         return ChatResponse(**chat.model_dump())
@@ -656,6 +1099,8 @@ async def clone_shared_chat_by_id(id: str, user=Depends(get_verified_user)):
             "branchPointMessageId": chat.chat["history"]["currentId"],
             "title": f"Clone of {chat.title}",
         }
+        # The clone keeps working if the original chat is unshared or deleted
+        await asyncio.to_thread(copy_chat_images, updated_chat, user.id)
 
         chat = Chats.import_chat(
             user.id,
@@ -727,7 +1172,13 @@ async def share_chat_by_id(request: Request, id: str, user=Depends(get_verified_
 
     if chat:
         if chat.share_id:
+            previous_shared_chat = Chats.get_chat_by_id(chat.share_id)
             shared_chat = Chats.update_shared_chat_by_chat_id(chat.id)
+            update_shared_chat_images(
+                chat.id,
+                shared_chat.chat,
+                previous_shared_chat.chat if previous_shared_chat else None,
+            )
             return ChatResponse(**shared_chat.model_dump())
 
         shared_chat = Chats.insert_shared_chat_by_chat_id(chat.id)
@@ -736,6 +1187,7 @@ async def share_chat_by_id(request: Request, id: str, user=Depends(get_verified_
                 status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
                 detail=ERROR_MESSAGES.DEFAULT(),
             )
+        update_shared_chat_images(chat.id, shared_chat.chat)
         return ChatResponse(**shared_chat.model_dump())
 
     else:
@@ -757,8 +1209,11 @@ async def delete_shared_chat_by_id(id: str, user=Depends(get_verified_user)):
         if not chat.share_id:
             return False
 
+        shared_chat = Chats.get_chat_by_id(chat.share_id)
         result = Chats.delete_shared_chat_by_chat_id(id)
         update_result = Chats.update_chat_share_id_by_id(id, None)
+        if shared_chat:
+            update_shared_chat_images(id, None, shared_chat.chat)
 
         return result and update_result != None
     else:
@@ -116,7 +116,7 @@ async def set_tool_servers_config(
     ]
 
     request.app.state.TOOL_SERVERS = await get_tool_servers_data(
-        request.app.state.config.TOOL_SERVER_CONNECTIONS
+        request.app.state.config.TOOL_SERVER_CONNECTIONS, refresh=True
     )
 
     return {
@@ -140,7 +140,7 @@ async def verify_tool_servers_config(
             token = request.state.token.credentials
 
         url = get_tool_server_url(form_data.url, form_data.path)
-        return await get_tool_server_data(token, url)
+        return await get_tool_server_data(token, url, refresh=True)
     except Exception as e:
         raise HTTPException(
             status_code=400,
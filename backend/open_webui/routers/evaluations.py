@@ -1,5 +1,7 @@
+import json
 from typing import Optional
 from fastapi import APIRouter, Depends, HTTPException, status, Request
+from fastapi.responses import StreamingResponse
 from pydantic import BaseModel
 
 from open_webui.models.users import Users, UserModel
@@ -8,14 +10,41 @@ from open_webui.models.feedbacks import (
     FeedbackResponse,
     FeedbackForm,
     Feedbacks,
+    FEEDBACK_FIELDS,
 )
 
 from open_webui.constants import ERROR_MESSAGES
 from open_webui.utils.auth import get_admin_user, get_verified_user
+from open_webui.utils.leaderboard import (
+    LEADERBOARD_METHODS,
+    LeaderboardEngine,
+    get_feedback_comparison,
+)
 
 router = APIRouter()
 
 
+def load_leaderboard_comparisons():
+    for id, data, meta, created_at in Feedbacks.get_rating_feedback_fields():
+        comparison = get_feedback_comparison(id, data, meta, created_at)
+        if comparison is not None:
+            yield comparison
+
+
+LEADERBOARD = LeaderboardEngine(
+    load_comparisons=load_leaderboard_comparisons,
+    get_signature=Feedbacks.get_feedback_signature,
+)
+
+
+def get_comparison(feedback: FeedbackModel):
+    if feedback.type != "rating":
+        return None
+    return get_feedback_comparison(
+        feedback.id, feedback.data, feedback.meta, feedback.created_at
+    )
+
+
 ############################
 # GetConfig
 ############################
@@ -71,25 +100,142 @@ class FeedbackUserResponse(FeedbackResponse):
     user: Optional[UserResponse] = None
 
 
+############################
+# GetLeaderboard
+############################
+
+
+class LeaderboardEntry(BaseModel):
+    rank: int
+    model_id: str
+    rating: int
+    won: int
+    lost: int
+    count: int
+
+
+class LeaderboardResponse(BaseModel):
+    items: list[LeaderboardEntry]
+    total: int
+    page: int
+    limit: int
+
+
+@router.get("/leaderboard", response_model=LeaderboardResponse)
+async def get_leaderboard(
+    method: str = "elo",
+    tag: Optional[str] = None,
+    window: Optional[int] = None,
+    page: int = 1,
+    limit: int = 50,
+    user=Depends(get_admin_user),
+):
+    if method not in LEADERBOARD_METHODS:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=ERROR_MESSAGES.DEFAULT(f"Unknown rating method: {method}"),
+        )
+
+    page = max(page, 1)
+    limit = min(max(limit, 1), 500)
+
+    entries = LEADERBOARD.get_leaderboard(
+        method=method, tag=tag or None, window=window if window and window > 0 else None
+    )
+    return {
+        "items": entries[(page - 1) * limit : page * limit],
+        "total": len(entries),
+        "page": page,
+        "limit": limit,
+    }
+
+
+def get_feedback_users(user_ids) -> dict[str, UserResponse]:
+    return {
+        user.id: UserResponse(**user.model_dump())
+        for user in Users.get_users_by_user_ids(list(set(user_ids)))
+    }
+
+
+def parse_feedback_fields(fields: Optional[str]) -> Optional[list[str]]:
+    if not fields:
+        return None
+
+    fields = [field.strip() for field in fields.split(",") if field.strip()]
+    unknown = set(fields) - set(FEEDBACK_FIELDS)
+    if unknown:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=ERROR_MESSAGES.DEFAULT(
+                f"Unknown feedback fields: {', '.join(sorted(unknown))}"
+            ),
+        )
+    return fields
+
+
 @router.get("/feedbacks/all", response_model=list[FeedbackUserResponse])
 async def get_all_feedbacks(user=Depends(get_admin_user)):
-    feedbacks = Feedbacks.get_all_feedbacks()
+    # The response leaves out the chat snapshots, so don't load them either
+    feedbacks = Feedbacks.get_all_feedbacks(include_snapshot=False)
+    users = get_feedback_users(feedback.user_id for feedback in feedbacks)
+
+    return [
+        FeedbackUserResponse(
+            **feedback.model_dump(),
+            user=users.get(feedback.user_id),
+        )
+        for feedback in feedbacks
+    ]
+
+
+############################
+# GetFeedbackPage
+############################
+
+
+class FeedbackPageResponse(BaseModel):
+    items: list[dict]
+    next_cursor: Optional[str] = None
 
-    feedback_list = []
-    for feedback in feedbacks:
-        user = Users.get_user_by_id(feedback.user_id)
-        feedback_list.append(
-            FeedbackUserResponse(
-                **feedback.model_dump(),
-                user=UserResponse(**user.model_dump()) if user else None,
-            )
+
+@router.get("/feedbacks/list", response_model=FeedbackPageResponse)
+async def get_feedback_page(
+    cursor: Optional[str] = None,
+    limit: int = 50,
+    fields: Optional[str] = None,
+    user_id: Optional[str] = None,
+    user=Depends(get_admin_user),
+):
+    """
+    Feedbacks one page at a time, most recently updated first. `fields` is a
+    comma separated list of columns and leaves out `snapshot` by default.
+    """
+    try:
+        items, next_cursor = Feedbacks.get_feedbacks_page(
+            limit=min(max(limit, 1), 500),
+            cursor=cursor,
+            fields=parse_feedback_fields(fields),
+            user_id=user_id,
         )
-    return feedback_list
+    except ValueError as e:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=ERROR_MESSAGES.DEFAULT(str(e)),
+        )
+
+    if items and "user_id" in items[0]:
+        users = get_feedback_users(item["user_id"] for item in items)
+        for item in items:
+            user = users.get(item["user_id"])
+            item["user"] = user.model_dump() if user else None
+
+    return {"items": items, "next_cursor": next_cursor}
 
 
 @router.delete("/feedbacks/all")
 async def delete_all_feedbacks(user=Depends(get_admin_user)):
     success = Feedbacks.delete_all_feedbacks()
+    LEADERBOARD.reset()
     return success
 
 
@@ -99,6 +245,29 @@ async def get_all_feedbacks(user=Depends(get_admin_user)):
     return feedbacks
 
 
+@router.get("/feedbacks/export")
+async def export_feedbacks(
+    fields: Optional[str] = None,
+    user=Depends(get_admin_user),
+):
+    """
+    Streams every feedback as newline-delimited JSON, oldest first, reading
+    the table in batches. Includes the chat snapshots unless `fields` says
+    otherwise.
+    """
+    fields = parse_feedback_fields(fields) or list(FEEDBACK_FIELDS)
+
+    def stream_feedbacks():
+        for feedback in Feedbacks.iter_feedbacks(fields=fields):
+            yield json.dumps(feedback, ensure_ascii=False) + "\n"
+
+    return StreamingResponse(
+        stream_feedbacks(),
+        media_type="application/x-ndjson",
+        headers={"Content-Disposition": 'attachment; filename="feedbacks.ndjson"'},
+    )
+
+
 @router.get("/feedbacks/user", response_model=list[FeedbackUserResponse])
 async def get_feedbacks(user=Depends(get_verified_user)):
     feedbacks = Feedbacks.get_feedbacks_by_user_id(user.id)
@@ -108,6 +277,7 @@ async def get_feedbacks(user=Depends(get_verified_user)):
 @router.delete("/feedbacks", response_model=bool)
 async def delete_feedbacks(user=Depends(get_verified_user)):
     success = Feedbacks.delete_feedbacks_by_user_id(user.id)
+    LEADERBOARD.reset()
     return success
 
 
@@ -124,6 +294,7 @@ async def create_feedback(
             detail=ERROR_MESSAGES.DEFAULT(),
         )
 
+    LEADERBOARD.add(get_comparison(feedback), feedback.updated_at)
     return feedback
 
 
@@ -158,6 +329,7 @@ async def update_feedback_by_id(
             status_code=status.HTTP_404_NOT_FOUND, detail=ERROR_MESSAGES.NOT_FOUND
         )
 
+    LEADERBOARD.update(id, get_comparison(feedback), feedback.updated_at)
     return feedback
 
 
@@ -173,4 +345,5 @@ async def delete_feedback_by_id(id: str, user=Depends(get_verified_user)):
             status_code=status.HTTP_404_NOT_FOUND, detail=ERROR_MESSAGES.NOT_FOUND
         )
 
+    LEADERBOARD.remove(id)
     return success
@@ -1,5 +1,7 @@
 import logging
+import mimetypes
 import os
+import re
 import uuid
 import json
 from fnmatch import fnmatch
@@ -18,7 +20,7 @@ from fastapi import (
     status,
     Query,
 )
-from fastapi.responses import FileResponse, StreamingResponse
+from fastapi.responses import FileResponse, Response, StreamingResponse
 from open_webui.constants import ERROR_MESSAGES
 from open_webui.env import SRC_LOG_LEVELS
 from open_webui.retrieval.vector.factory import VECTOR_DB_CLIENT
@@ -37,6 +39,7 @@ from open_webui.routers.retrieval import ProcessFileForm, process_file
 from open_webui.routers.audio import transcribe
 from open_webui.storage.provider import Storage
 from open_webui.utils.auth import get_admin_user, get_verified_user
+from open_webui.utils.files import is_shared_chat_image
 from pydantic import BaseModel
 
 log = logging.getLogger(__name__)
@@ -135,7 +138,7 @@ def upload_file(
             "OpenWebUI-User-Name": user.name,
             "OpenWebUI-File-Id": id,
         }
-        contents, file_path = Storage.upload_file(file.file, filename, tags)
+        file_info, file_path = Storage.upload_file_stream(file.file, filename, tags)
 
         file_item = Files.insert_new_file(
             user.id,
@@ -147,7 +150,8 @@ def upload_file(
                     "meta": {
                         "name": name,
                         "content_type": file.content_type,
-                        "size": len(contents),
+                        "size": file_info["size"],
+                        "sha256": file_info["sha256"],
                         "data": file_metadata,
                     },
                 }
@@ -170,7 +174,9 @@ def upload_file(
                         )
                     ):
                         file_path = Storage.get_file(file_path)
-                        result = transcribe(request, file_path, file_metadata)
+                        result = transcribe(
+                            request, file_path, file_metadata, user=user
+                        )
 
                         process_file(
                             request,
@@ -409,9 +415,79 @@ async def update_file_data_content_by_id(
 ############################
 
 
+def get_byte_range(range_header: Optional[str], size: int) -> Optional[tuple]:
+    """
+    Parses a single-range `Range: bytes=...` header into an inclusive
+    (start, end) pair. Returns None when the whole file should be sent and
+    raises ValueError when the range is not satisfiable.
+    """
+    match = re.fullmatch(r"bytes=(\d*)-(\d*)", (range_header or "").strip())
+    if not match or match.groups() == ("", ""):
+        # Missing, malformed and multi-range headers get the full file
+        return None
+
+    start, end = match.groups()
+    if start == "":
+        # Suffix range: the last `end` bytes
+        if int(end) == 0:
+            raise ValueError("Empty suffix range")
+        return max(size - int(end), 0), size - 1
+
+    start = int(start)
+    end = min(int(end), size - 1) if end else size - 1
+    if start >= size or start > end:
+        raise ValueError("Range not satisfiable")
+    return start, end
+
+
+def get_file_content_response(
+    request: Request,
+    file_path: str,
+    filename: str,
+    headers: dict,
+    media_type: Optional[str] = None,
+):
+    media_type = media_type or mimetypes.guess_type(filename)[0]
+
+    local_file_path = Storage.get_local_file(file_path)
+    if local_file_path:
+        # FileResponse answers Range requests itself
+        return FileResponse(local_file_path, headers=headers, media_type=media_type)
+
+    # Stream straight from the storage backend instead of downloading a local copy
+    size = Storage.get_file_size(file_path)
+    headers = {**headers, "Accept-Ranges": "bytes"}
+    try:
+        byte_range = get_byte_range(request.headers.get("range"), size)
+    except ValueError:
+        return Response(
+            status_code=status.HTTP_416_REQUESTED_RANGE_NOT_SATISFIABLE,
+            headers={"Content-Range": f"bytes */{size}"},
+        )
+
+    if byte_range:
+        start, end = byte_range
+        headers["Content-Range"] = f"bytes {start}-{end}/{size}"
+        status_code = status.HTTP_206_PARTIAL_CONTENT
+    else:
+        start, end = 0, size - 1
+        status_code = status.HTTP_200_OK
+    headers["Content-Length"] = str(end - start + 1)
+
+    return StreamingResponse(
+        Storage.get_file_stream(file_path, start, end),
+        status_code=status_code,
+        media_type=media_type or "application/octet-stream",
+        headers=headers,
+    )
+
+
 @router.get("/{id}/content")
 async def get_file_content_by_id(
-    id: str, user=Depends(get_verified_user), attachment: bool = Query(False)
+    id: str,
+    request: Request,
+    user=Depends(get_verified_user),
+    attachment: bool = Query(False),
 ):
     file = Files.get_file_by_id(id)
 
@@ -425,46 +501,35 @@ async def get_file_content_by_id(
         file.user_id == user.id
         or user.role == "admin"
         or has_access_to_file(id, "read", user)
+        or is_shared_chat_image(file)
     ):
         try:
-            file_path = Storage.get_file(file.path)
-            file_path = Path(file_path)
-
-            # Check if the file already exists in the cache
-            if file_path.is_file():
-                # Handle Unicode filenames
-                filename = file.meta.get("name", file.filename)
-                encoded_filename = quote(filename)  # RFC5987 encoding
-
-                content_type = file.meta.get("content_type")
-                filename = file.meta.get("name", file.filename)
-                encoded_filename = quote(filename)
-                headers = {}
-
-                if attachment:
+            # Handle Unicode filenames
+            content_type = file.meta.get("content_type")
+            filename = file.meta.get("name", file.filename)
+            encoded_filename = quote(filename)  # RFC5987 encoding
+            headers = {}
+
+            if attachment:
+                headers["Content-Disposition"] = (
+                    f"attachment; filename*=UTF-8''{encoded_filename}"
+                )
+            else:
+                if content_type == "application/pdf" or filename.lower().endswith(
+                    ".pdf"
+                ):
+                    headers["Content-Disposition"] = (
+                        f"inline; filename*=UTF-8''{encoded_filename}"
+                    )
+                    content_type = "application/pdf"
+                elif content_type != "text/plain":
                     headers["Content-Disposition"] = (
                         f"attachment; filename*=UTF-8''{encoded_filename}"
                     )
-                else:
-                    if content_type == "application/pdf" or filename.lower().endswith(
-                        ".pdf"
-                    ):
-                        headers["Content-Disposition"] = (
-                            f"inline; filename*=UTF-8''{encoded_filename}"
-                        )
-                        content_type = "application/pdf"
-                    elif content_type != "text/plain":
-                        headers["Content-Disposition"] = (
-                            f"attachment; filename*=UTF-8''{encoded_filename}"
-                        )
-
-                return FileResponse(file_path, headers=headers, media_type=content_type)
 
-            else:
-                raise HTTPException(
-                    status_code=status.HTTP_404_NOT_FOUND,
-                    detail=ERROR_MESSAGES.NOT_FOUND,
-                )
+            return get_file_content_response(
+                request, file.path, filename, headers, media_type=content_type
+            )
         except Exception as e:
             log.exception(e)
             log.error("Error getting file content")
@@ -529,7 +594,9 @@ async def get_html_file_content_by_id(id: str, user=Depends(get_verified_user)):
 
 
 @router.get("/{id}/content/{file_name}")
-async def get_file_content_by_id(id: str, user=Depends(get_verified_user)):
+async def get_file_content_by_id(
+    id: str, request: Request, user=Depends(get_verified_user)
+):
     file = Files.get_file_by_id(id)
 
     if not file:
@@ -542,6 +609,7 @@ async def get_file_content_by_id(id: str, user=Depends(get_verified_user)):
         file.user_id == user.id
         or user.role == "admin"
         or has_access_to_file(id, "read", user)
+        or is_shared_chat_image(file)
     ):
         file_path = file.path
 
@@ -553,13 +621,9 @@ async def get_file_content_by_id(id: str, user=Depends(get_verified_user)):
         }
 
         if file_path:
-            file_path = Storage.get_file(file_path)
-            file_path = Path(file_path)
-
-            # Check if the file already exists in the cache
-            if file_path.is_file():
-                return FileResponse(file_path, headers=headers)
-            else:
+            try:
+                return get_file_content_response(request, file_path, filename, headers)
+            except (FileNotFoundError, RuntimeError):
                 raise HTTPException(
                     status_code=status.HTTP_404_NOT_FOUND,
                     detail=ERROR_MESSAGES.NOT_FOUND,
@@ -16,6 +16,8 @@ from open_webui.utils.plugin import (
     load_function_module_by_id,
     replace_imports,
     get_function_module_from_cache,
+    get_content_hash,
+    invalidate_function_cache,
 )
 from open_webui.config import CACHE_DIR
 from open_webui.constants import ERROR_MESSAGES
@@ -147,7 +149,9 @@ async def sync_functions(
                 content=function.content,
             )
 
-        return Functions.sync_functions(user.id, form_data.functions)
+        functions = Functions.sync_functions(user.id, form_data.functions)
+        invalidate_function_cache(request)
+        return functions
     except Exception as e:
         log.exception(f"Failed to load a function: {e}")
         raise HTTPException(
@@ -187,6 +191,12 @@ async def create_new_function(
             FUNCTIONS[form_data.id] = function_module
 
             function = Functions.insert_new_function(user.id, function_type, form_data)
+            if function:
+                request.app.state.FUNCTION_CONTENTS[form_data.id] = (
+                    function.updated_at,
+                    get_content_hash(function.content),
+                )
+            invalidate_function_cache(request, form_data.id)
 
             function_cache_dir = CACHE_DIR / "functions" / form_data.id
             function_cache_dir.mkdir(parents=True, exist_ok=True)
@@ -235,12 +245,15 @@ async def get_function_by_id(id: str, user=Depends(get_admin_user)):
 
 
 @router.post("/id/{id}/toggle", response_model=Optional[FunctionModel])
-async def toggle_function_by_id(id: str, user=Depends(get_admin_user)):
+async def toggle_function_by_id(
+    request: Request, id: str, user=Depends(get_admin_user)
+):
     function = Functions.get_function_by_id(id)
     if function:
         function = Functions.update_function_by_id(
             id, {"is_active": not function.is_active}
         )
+        invalidate_function_cache(request, id)
 
         if function:
             return function
@@ -262,12 +275,13 @@ async def toggle_function_by_id(id: str, user=Depends(get_admin_user)):
 
 
 @router.post("/id/{id}/toggle/global", response_model=Optional[FunctionModel])
-async def toggle_global_by_id(id: str, user=Depends(get_admin_user)):
+async def toggle_global_by_id(request: Request, id: str, user=Depends(get_admin_user)):
     function = Functions.get_function_by_id(id)
     if function:
         function = Functions.update_function_by_id(
             id, {"is_global": not function.is_global}
         )
+        invalidate_function_cache(request, id)
 
         if function:
             return function
@@ -306,6 +320,12 @@ async def update_function_by_id(
         log.debug(updated)
 
         function = Functions.update_function_by_id(id, updated)
+        if function:
+            request.app.state.FUNCTION_CONTENTS[id] = (
+                function.updated_at,
+                get_content_hash(function.content),
+            )
+        invalidate_function_cache(request, id)
 
         if function:
             return function
@@ -337,6 +357,8 @@ async def delete_function_by_id(
         FUNCTIONS = request.app.state.FUNCTIONS
         if id in FUNCTIONS:
             del FUNCTIONS[id]
+        request.app.state.FUNCTION_CONTENTS.pop(id, None)
+        invalidate_function_cache(request, id)
 
     return result
 
@@ -413,6 +435,7 @@ async def update_function_valves_by_id(
                 form_data = {k: v for k, v in form_data.items() if v is not None}
                 valves = Valves(**form_data)
                 Functions.update_function_valves_by_id(id, valves.model_dump())
+                invalidate_function_cache(request, id)
                 return valves.model_dump()
             except Exception as e:
                 log.exception(f"Error updating function values by id {id}: {e}")
@@ -5,15 +5,23 @@ import json
 import logging
 import mimetypes
 import re
+import tempfile
 from pathlib import Path
-from typing import Optional
+from typing import BinaryIO, Optional
 
 from urllib.parse import quote
+import aiohttp
 import requests
 from fastapi import APIRouter, Depends, HTTPException, Request, UploadFile
 from open_webui.config import CACHE_DIR
 from open_webui.constants import ERROR_MESSAGES
-from open_webui.env import ENABLE_FORWARD_USER_INFO_HEADERS, SRC_LOG_LEVELS
+from open_webui.env import (
+    AIOHTTP_CLIENT_SESSION_SSL,
+    AIOHTTP_CLIENT_TIMEOUT,
+    ENABLE_FORWARD_USER_INFO_HEADERS,
+    IMAGE_DOWNLOAD_MAX_CONCURRENCY,
+    SRC_LOG_LEVELS,
+)
 from open_webui.routers.files import upload_file
 from open_webui.utils.auth import get_admin_user, get_verified_user
 from open_webui.utils.images.comfyui import (
@@ -440,30 +448,95 @@ def load_b64_image_data(b64_str):
         return None, None
 
 
-def load_url_image_data(url, headers=None):
+# Decoded images larger than this are spooled to disk instead of kept in memory
+IMAGE_SPOOL_MAX_SIZE = 1024 * 1024
+# A multiple of 4 so every chunk decodes on its own
+B64_DECODE_CHUNK_SIZE = 4 * 256 * 1024
+
+
+def load_b64_image_file(b64_str: str) -> tuple[BinaryIO, str]:
+    """
+    Decodes a base64 image (optionally a data URL) chunk by chunk into a
+    spooled temporary file, so a large image is never held in memory both
+    encoded and decoded.
+    """
+    mime_type = "image/png"
+    start = 0
+    if b64_str.startswith("data:"):
+        start = b64_str.index(",") + 1
+        mime_type = b64_str[5:start].split(";")[0]
+
+    file = tempfile.SpooledTemporaryFile(max_size=IMAGE_SPOOL_MAX_SIZE)
     try:
-        if headers:
-            r = requests.get(url, headers=headers)
-        else:
-            r = requests.get(url)
+        remainder = ""
+        for offset in range(start, len(b64_str), B64_DECODE_CHUNK_SIZE):
+            # Line breaks would shift the 4-character groups across chunks, so
+            # drop whitespace and carry any incomplete group to the next chunk
+            chunk = remainder + "".join(
+                b64_str[offset : offset + B64_DECODE_CHUNK_SIZE].split()
+            )
+            end = len(chunk) - len(chunk) % 4
+            file.write(base64.b64decode(chunk[:end]))
+            remainder = chunk[end:]
+        if remainder:
+            file.write(base64.b64decode(remainder))
+        file.seek(0)
+    except Exception:
+        file.close()
+        raise
+    return file, mime_type
+
+
+IMAGE_DOWNLOAD_SESSION: Optional[aiohttp.ClientSession] = None
+
+
+def get_image_download_session() -> aiohttp.ClientSession:
+    """Keep-alive session shared by all generated image downloads."""
+    global IMAGE_DOWNLOAD_SESSION
+    if IMAGE_DOWNLOAD_SESSION is None or IMAGE_DOWNLOAD_SESSION.closed:
+        IMAGE_DOWNLOAD_SESSION = aiohttp.ClientSession(
+            trust_env=True,
+            timeout=aiohttp.ClientTimeout(total=AIOHTTP_CLIENT_TIMEOUT),
+            connector=aiohttp.TCPConnector(limit=IMAGE_DOWNLOAD_MAX_CONCURRENCY),
+        )
+    return IMAGE_DOWNLOAD_SESSION
+
+
+async def close_image_download_session():
+    global IMAGE_DOWNLOAD_SESSION
+    if IMAGE_DOWNLOAD_SESSION is not None and not IMAGE_DOWNLOAD_SESSION.closed:
+        await IMAGE_DOWNLOAD_SESSION.close()
+    IMAGE_DOWNLOAD_SESSION = None
 
-        r.raise_for_status()
-        if r.headers["content-type"].split("/")[0] == "image":
-            mime_type = r.headers["content-type"]
-            return r.content, mime_type
-        else:
-            log.error("Url does not point to an image.")
-            return None
+
+async def load_url_image_data(url, headers=None):
+    """Downloads an image into a spooled temporary file."""
+    try:
+        async with get_image_download_session().get(
+            url, headers=headers, ssl=AIOHTTP_CLIENT_SESSION_SSL
+        ) as r:
+            r.raise_for_status()
+            mime_type = r.headers.get("content-type", "")
+            if mime_type.split("/")[0] != "image":
+                log.error("Url does not point to an image.")
+                return None, None
+
+            file = tempfile.SpooledTemporaryFile(max_size=IMAGE_SPOOL_MAX_SIZE)
+            async for chunk in r.content.iter_chunked(64 * 1024):
+                file.write(chunk)
+            file.seek(0)
+            return file, mime_type
 
     except Exception as e:
         log.exception(f"Error saving image: {e}")
-        return None
+        return None, None
 
 
 def upload_image(request, image_data, content_type, metadata, user):
     image_format = mimetypes.guess_extension(content_type)
     file = UploadFile(
-        file=io.BytesIO(image_data),
+        # Either the image bytes or a file object positioned at its start
+        file=image_data if hasattr(image_data, "read") else io.BytesIO(image_data),
         filename=f"generated-image{image_format}",  # will be converted to a unique ID on upload_file
         headers={
             "content-type": content_type,
@@ -474,6 +547,33 @@ def upload_image(request, image_data, content_type, metadata, user):
     return url
 
 
+async def upload_b64_image(request, b64_str, metadata, user) -> dict:
+    def decode_and_upload():
+        file, content_type = load_b64_image_file(b64_str)
+        with file:
+            return upload_image(request, file, content_type, metadata, user)
+
+    return {"url": await asyncio.to_thread(decode_and_upload)}
+
+
+async def upload_url_image(request, url, metadata, user, headers=None) -> dict:
+    file, content_type = await load_url_image_data(url, headers)
+    if file is None:
+        raise Exception(f"Failed to load image from {url}")
+
+    with file:
+        return {
+            "url": await asyncio.to_thread(
+                upload_image, request, file, content_type, metadata, user
+            )
+        }
+
+
+async def upload_images(uploads) -> list[dict]:
+    """Downloads or decodes and stores the generated images concurrently, in order."""
+    return list(await asyncio.gather(*uploads))
+
+
 @router.post("/generations")
 async def image_generations(
     request: Request,
@@ -535,17 +635,14 @@ async def image_generations(
             r.raise_for_status()
             res = r.json()
 
-            images = []
-
-            for image in res["data"]:
-                if image_url := image.get("url", None):
-                    image_data, content_type = load_url_image_data(image_url, headers)
-                else:
-                    image_data, content_type = load_b64_image_data(image["b64_json"])
-
-                url = upload_image(request, image_data, content_type, data, user)
-                images.append({"url": url})
-            return images
+            return await upload_images(
+                (
+                    upload_url_image(request, image["url"], data, user, headers)
+                    if image.get("url", None)
+                    else upload_b64_image(request, image["b64_json"], data, user)
+                )
+                for image in res["data"]
+            )
 
         elif request.app.state.config.IMAGE_GENERATION_ENGINE == "gemini":
             headers = {}
@@ -572,15 +669,10 @@ async def image_generations(
             r.raise_for_status()
             res = r.json()
 
-            images = []
-            for image in res["predictions"]:
-                image_data, content_type = load_b64_image_data(
-                    image["bytesBase64Encoded"]
-                )
-                url = upload_image(request, image_data, content_type, data, user)
-                images.append({"url": url})
-
-            return images
+            return await upload_images(
+                upload_b64_image(request, image["bytesBase64Encoded"], data, user)
+                for image in res["predictions"]
+            )
 
         elif request.app.state.config.IMAGE_GENERATION_ENGINE == "comfyui":
             data = {
@@ -616,25 +708,17 @@ async def image_generations(
             )
             log.debug(f"res: {res}")
 
-            images = []
-
-            for image in res["data"]:
-                headers = None
-                if request.app.state.config.COMFYUI_API_KEY:
-                    headers = {
-                        "Authorization": f"Bearer {request.app.state.config.COMFYUI_API_KEY}"
-                    }
-
-                image_data, content_type = load_url_image_data(image["url"], headers)
-                url = upload_image(
-                    request,
-                    image_data,
-                    content_type,
-                    form_data.model_dump(exclude_none=True),
-                    user,
-                )
-                images.append({"url": url})
-            return images
+            headers = None
+            if request.app.state.config.COMFYUI_API_KEY:
+                headers = {
+                    "Authorization": f"Bearer {request.app.state.config.COMFYUI_API_KEY}"
+                }
+
+            metadata = form_data.model_dump(exclude_none=True)
+            return await upload_images(
+                upload_url_image(request, image["url"], metadata, user, headers)
+                for image in res["data"]
+            )
         elif (
             request.app.state.config.IMAGE_GENERATION_ENGINE == "automatic1111"
             or request.app.state.config.IMAGE_GENERATION_ENGINE == ""
@@ -675,19 +759,11 @@ async def image_generations(
             res = r.json()
             log.debug(f"res: {res}")
 
-            images = []
-
-            for image in res["images"]:
-                image_data, content_type = load_b64_image_data(image)
-                url = upload_image(
-                    request,
-                    image_data,
-                    content_type,
-                    {**data, "info": res["info"]},
-                    user,
-                )
-                images.append({"url": url})
-            return images
+            metadata = {**data, "info": res["info"]}
+            return await upload_images(
+                upload_b64_image(request, image, metadata, user)
+                for image in res["images"]
+            )
     except Exception as e:
         error = e
         if r != None:
@@ -1,11 +1,15 @@
 from fastapi import APIRouter, Depends, HTTPException, Request
 from pydantic import BaseModel
+import asyncio
 import logging
+import time
 from typing import Optional
 
 from open_webui.models.memories import Memories, MemoryModel
+from open_webui.models.users import Users
+from open_webui.retrieval.utils import get_request_embedding_function
 from open_webui.retrieval.vector.factory import VECTOR_DB_CLIENT
-from open_webui.utils.auth import get_verified_user
+from open_webui.utils.auth import get_admin_user, get_verified_user
 from open_webui.env import SRC_LOG_LEVELS
 
 
@@ -15,6 +19,43 @@ log.setLevel(SRC_LOG_LEVELS["MODELS"])
 router = APIRouter()
 
 
+async def get_memory_vector_items(
+    request: Request, memories: list[MemoryModel], user=None
+) -> list[dict]:
+    """Embeds all memories in one batched call, off the event loop."""
+    if not memories:
+        return []
+
+    vectors = await asyncio.to_thread(
+        request.app.state.EMBEDDING_FUNCTION,
+        [memory.content for memory in memories],
+        user=user,
+    )
+    return [
+        {
+            "id": memory.id,
+            "text": memory.content,
+            "vector": vector,
+            "metadata": {
+                "created_at": memory.created_at,
+                "updated_at": memory.updated_at,
+            },
+        }
+        for memory, vector in zip(memories, vectors)
+    ]
+
+
+async def upsert_memories_to_vector_db(
+    request: Request, memories: list[MemoryModel], user_id: str, user=None
+):
+    items = await get_memory_vector_items(request, memories, user=user)
+    if items:
+        VECTOR_DB_CLIENT.upsert(
+            collection_name=f"user-memory-{user_id}",
+            items=items,
+        )
+
+
 @router.get("/ef")
 async def get_embeddings(request: Request):
     return {"result": request.app.state.EMBEDDING_FUNCTION("hello world")}
@@ -50,20 +91,7 @@ async def add_memory(
     user=Depends(get_verified_user),
 ):
     memory = Memories.insert_new_memory(user.id, form_data.content)
-
-    VECTOR_DB_CLIENT.upsert(
-        collection_name=f"user-memory-{user.id}",
-        items=[
-            {
-                "id": memory.id,
-                "text": memory.content,
-                "vector": request.app.state.EMBEDDING_FUNCTION(
-                    memory.content, user=user
-                ),
-                "metadata": {"created_at": memory.created_at},
-            }
-        ],
-    )
+    await upsert_memories_to_vector_db(request, [memory], user.id, user=user)
 
     return memory
 
@@ -82,13 +110,16 @@ class QueryMemoryForm(BaseModel):
 async def query_memory(
     request: Request, form_data: QueryMemoryForm, user=Depends(get_verified_user)
 ):
-    memories = Memories.get_memories_by_user_id(user.id)
-    if not memories:
+    if not Memories.has_memories_by_user_id(user.id):
         raise HTTPException(status_code=404, detail="No memories found for user")
 
     results = VECTOR_DB_CLIENT.search(
         collection_name=f"user-memory-{user.id}",
-        vectors=[request.app.state.EMBEDDING_FUNCTION(form_data.content, user=user)],
+        vectors=[
+            await asyncio.to_thread(
+                get_request_embedding_function(request, user), form_data.content
+            )
+        ],
         limit=form_data.k,
     )
 
@@ -105,27 +136,96 @@ async def reset_memory_from_vector_db(
     VECTOR_DB_CLIENT.delete_collection(f"user-memory-{user.id}")
 
     memories = Memories.get_memories_by_user_id(user.id)
-    VECTOR_DB_CLIENT.upsert(
-        collection_name=f"user-memory-{user.id}",
-        items=[
-            {
-                "id": memory.id,
-                "text": memory.content,
-                "vector": request.app.state.EMBEDDING_FUNCTION(
-                    memory.content, user=user
-                ),
-                "metadata": {
-                    "created_at": memory.created_at,
-                    "updated_at": memory.updated_at,
-                },
-            }
-            for memory in memories
-        ],
-    )
+    await upsert_memories_to_vector_db(request, memories or [], user.id, user=user)
 
     return True
 
 
+############################
+# ReembedAllMemories
+############################
+
+# Progress of the admin job that re-embeds every user's memories
+MEMORY_REEMBED_STATUS = {
+    "running": False,
+    "users": 0,
+    "processed_users": 0,
+    "memories": 0,
+    "failed_users": [],
+    "started_at": None,
+    "finished_at": None,
+}
+MEMORY_REEMBED_TASK = None
+
+
+async def reembed_all_memories(request: Request):
+    status = MEMORY_REEMBED_STATUS
+    try:
+        user_ids = Memories.get_memory_user_ids()
+        status["users"] = len(user_ids)
+
+        for user_id in user_ids:
+            try:
+                memories = Memories.get_memories_by_user_id(user_id) or []
+                items = await get_memory_vector_items(
+                    request, memories, user=Users.get_user_by_id(user_id)
+                )
+
+                # The vector DBs can't rename collections, so this isn't an
+                # atomic swap: the old collection is dropped (its vectors may
+                # have another dimension) and rebuilt. Embedding first keeps the
+                # gap short, but queries in between see no memories, and if the
+                # upsert fails they stay missing until the user is re-embedded.
+                collection_name = f"user-memory-{user_id}"
+                if VECTOR_DB_CLIENT.has_collection(collection_name=collection_name):
+                    VECTOR_DB_CLIENT.delete_collection(collection_name)
+                if items:
+                    VECTOR_DB_CLIENT.upsert(
+                        collection_name=collection_name, items=items
+                    )
+                status["memories"] += len(items)
+            except Exception as e:
+                log.exception(f"Error re-embedding memories for user {user_id}: {e}")
+                status["failed_users"].append(user_id)
+            status["processed_users"] += 1
+    finally:
+        status["running"] = False
+        status["finished_at"] = int(time.time())
+        log.info(
+            f"Re-embedded {status['memories']} memories for "
+            f"{status['processed_users']} users ({len(status['failed_users'])} failed)"
+        )
+
+
+@router.get("/reembed")
+async def get_reembed_status(user=Depends(get_admin_user)):
+    return MEMORY_REEMBED_STATUS
+
+
+@router.post("/reembed")
+async def reembed_memories(request: Request, user=Depends(get_admin_user)):
+    if MEMORY_REEMBED_STATUS["running"]:
+        raise HTTPException(
+            status_code=409, detail="Memories are already being re-embedded"
+        )
+
+    MEMORY_REEMBED_STATUS.update(
+        {
+            "running": True,
+            "users": 0,
+            "processed_users": 0,
+            "memories": 0,
+            "failed_users": [],
+            "started_at": int(time.time()),
+            "finished_at": None,
+        }
+    )
+    # Keep a reference so the task isn't garbage collected while it runs
+    global MEMORY_REEMBED_TASK
+    MEMORY_REEMBED_TASK = asyncio.create_task(reembed_all_memories(request))
+    return MEMORY_REEMBED_STATUS
+
+
 ############################
 # DeleteMemoriesByUserId
 ############################
@@ -164,22 +264,7 @@ async def update_memory_by_id(
         raise HTTPException(status_code=404, detail="Memory not found")
 
     if form_data.content is not None:
-        VECTOR_DB_CLIENT.upsert(
-            collection_name=f"user-memory-{user.id}",
-            items=[
-                {
-                    "id": memory.id,
-                    "text": memory.content,
-                    "vector": request.app.state.EMBEDDING_FUNCTION(
-                        memory.content, user=user
-                    ),
-                    "metadata": {
-                        "created_at": memory.created_at,
-                        "updated_at": memory.updated_at,
-                    },
-                }
-            ],
-        )
+        await upsert_memories_to_vector_db(request, [memory], user.id, user=user)
 
     return memory
 
@@ -50,6 +50,7 @@ from open_webui.utils.payload import (
     apply_model_system_prompt_to_body,
 )
 from open_webui.utils.auth import get_admin_user, get_verified_user
+from open_webui.utils.singleflight import singleflight, get_user_flight_key
 from open_webui.utils.access_control import has_access
 
 
@@ -339,9 +340,13 @@ def merge_ollama_models_lists(model_lists):
     return list(merged_models.values())
 
 
-@cached(ttl=MODELS_CACHE_TTL)
-async def get_all_models(request: Request, user: UserModel = None):
-    log.info("get_all_models()")
+@singleflight(
+    key=lambda request, user=None: get_user_flight_key(user),
+    redis=lambda request, user=None: request.app.state.redis,
+)
+async def fetch_all_models(request: Request, user: UserModel = None) -> dict:
+    # Only returns the merged model list, so the result can be shared by the
+    # other workers when ENABLE_SINGLEFLIGHT_REDIS_LOCK is set
     if request.app.state.config.ENABLE_OLLAMA_API:
         request_tasks = []
         for idx, url in enumerate(request.app.state.config.OLLAMA_BASE_URLS):
@@ -431,6 +436,14 @@ async def get_all_models(request: Request, user: UserModel = None):
     else:
         models = {"models": []}
 
+    return models
+
+
+@cached(ttl=MODELS_CACHE_TTL)
+async def get_all_models(request: Request, user: UserModel = None):
+    log.info("get_all_models()")
+    models = await fetch_all_models(request, user=user)
+
     request.app.state.OLLAMA_MODELS = {
         model["model"]: model for model in models["models"]
     }
@@ -47,6 +47,7 @@ from open_webui.utils.misc import (
 
 from open_webui.utils.auth import get_admin_user, get_verified_user
 from open_webui.utils.access_control import has_access
+from open_webui.utils.singleflight import singleflight, get_user_flight_key
 
 
 log = logging.getLogger(__name__)
@@ -392,13 +393,13 @@ async def get_filtered_models(models, user):
     return filtered_models
 
 
-@cached(ttl=MODELS_CACHE_TTL)
-async def get_all_models(request: Request, user: UserModel) -> dict[str, list]:
-    log.info("get_all_models()")
-
-    if not request.app.state.config.ENABLE_OPENAI_API:
-        return {"data": []}
-
+@singleflight(
+    key=lambda request, user=None: get_user_flight_key(user),
+    redis=lambda request, user=None: request.app.state.redis,
+)
+async def fetch_all_models(request: Request, user: UserModel) -> dict[str, list]:
+    # Only returns the merged model list, so the result can be shared by the
+    # other workers when ENABLE_SINGLEFLIGHT_REDIS_LOCK is set
     responses = await get_all_models_responses(request, user=user)
 
     def extract_data(response):
@@ -449,6 +450,17 @@ async def get_all_models(request: Request, user: UserModel) -> dict[str, list]:
 
     models = {"data": merge_models_lists(map(extract_data, responses))}
     log.debug(f"models: {models}")
+    return models
+
+
+@cached(ttl=MODELS_CACHE_TTL)
+async def get_all_models(request: Request, user: UserModel) -> dict[str, list]:
+    log.info("get_all_models()")
+
+    if not request.app.state.config.ENABLE_OPENAI_API:
+        return {"data": []}
+
+    models = await fetch_all_models(request, user=user)
 
     request.app.state.OPENAI_MODELS = {model["id"]: model for model in models["data"]}
     return models
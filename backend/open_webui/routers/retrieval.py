@@ -80,6 +80,7 @@ from open_webui.retrieval.utils import (
 from open_webui.utils.misc import (
     calculate_sha256_string,
 )
+from open_webui.retrieval.executor import RETRIEVAL_EXECUTOR
 from open_webui.utils.auth import get_admin_user, get_verified_user
 
 from open_webui.config import (
@@ -383,6 +384,11 @@ async def update_embedding_config(
         )
 
 
+@router.get("/executor/stats")
+async def get_retrieval_executor_stats(user=Depends(get_admin_user)):
+    return RETRIEVAL_EXECUTOR.stats()
+
+
 @router.get("/config")
 async def get_rag_config(request: Request, user=Depends(get_admin_user)):
     return {
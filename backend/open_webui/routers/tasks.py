@@ -3,6 +3,7 @@ from fastapi.responses import JSONResponse, RedirectResponse
 
 from pydantic import BaseModel
 from typing import Optional
+import json
 import logging
 import re
 
@@ -14,6 +15,7 @@ from open_webui.utils.task import (
     image_prompt_generation_template,
     autocomplete_generation_template,
     tags_generation_template,
+    chat_tasks_generation_template,
     emoji_generation_template,
     moa_response_generation_template,
 )
@@ -23,11 +25,14 @@ from open_webui.constants import TASKS
 from open_webui.routers.pipelines import process_pipeline_inlet_filter
 
 from open_webui.utils.task import get_task_model_id
+from open_webui.utils.task_cache import get_task_cache_key
+from open_webui.utils.misc import openai_chat_completion_message_template
 
 from open_webui.config import (
     DEFAULT_TITLE_GENERATION_PROMPT_TEMPLATE,
     DEFAULT_FOLLOW_UP_GENERATION_PROMPT_TEMPLATE,
     DEFAULT_TAGS_GENERATION_PROMPT_TEMPLATE,
+    DEFAULT_CHAT_TASKS_GENERATION_PROMPT_TEMPLATE,
     DEFAULT_IMAGE_PROMPT_GENERATION_PROMPT_TEMPLATE,
     DEFAULT_QUERY_GENERATION_PROMPT_TEMPLATE,
     DEFAULT_AUTOCOMPLETE_GENERATION_PROMPT_TEMPLATE,
@@ -50,6 +55,32 @@ router = APIRouter()
 ##################################
 
 
+async def generate_task_completion(
+    request: Request, task: str, template: str, payload: dict, user
+):
+    cache = getattr(request.app.state, "TASK_RESULT_CACHE", None)
+    if cache is None or payload.get("stream"):
+        return await generate_chat_completion(request, form_data=payload, user=user)
+
+    key = get_task_cache_key(task, payload["model"], template, payload["messages"])
+    return await cache.get_or_generate(
+        key,
+        lambda: generate_chat_completion(request, form_data=payload, user=user),
+        redis=getattr(request.app.state, "redis", None),
+    )
+
+
+def get_autocompletion_text(res: dict) -> str:
+    content = res.get("choices", [{}])[0].get("message", {}).get("content", "") or ""
+    try:
+        text = json.loads(content[content.find("{") : content.rfind("}") + 1]).get(
+            "text", ""
+        )
+    except Exception:
+        return ""
+    return text if isinstance(text, str) else ""
+
+
 @router.get("/config")
 async def get_task_config(request: Request, user=Depends(get_verified_user)):
     return {
@@ -89,6 +120,12 @@ class TaskConfigForm(BaseModel):
     TOOLS_FUNCTION_CALLING_PROMPT_TEMPLATE: str
 
 
+@router.get("/cache/stats")
+async def get_task_cache_stats(request: Request, user=Depends(get_admin_user)):
+    cache = getattr(request.app.state, "TASK_RESULT_CACHE", None)
+    return cache.stats() if cache is not None else {}
+
+
 @router.post("/config/update")
 async def update_task_config(
     request: Request, form_data: TaskConfigForm, user=Depends(get_admin_user)
@@ -237,7 +274,9 @@ async def generate_title(
         raise e
 
     try:
-        return await generate_chat_completion(request, form_data=payload, user=user)
+        return await generate_task_completion(
+            request, str(TASKS.TITLE_GENERATION), template, payload, user
+        )
     except Exception as e:
         log.error("Exception occurred", exc_info=True)
         return JSONResponse(
@@ -385,6 +424,106 @@ async def generate_chat_tags(
         },
     }
 
+    # Process the payload through the pipeline
+    try:
+        payload = await process_pipeline_inlet_filter(request, payload, user, models)
+    except Exception as e:
+        raise e
+
+    try:
+        return await generate_task_completion(
+            request, str(TASKS.TAGS_GENERATION), template, payload, user
+        )
+    except Exception as e:
+        log.error(f"Error generating chat completion: {e}")
+        return JSONResponse(
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            content={"detail": "An internal error has occurred."},
+        )
+
+
+@router.post("/chat/completions")
+async def generate_chat_tasks(
+    request: Request, form_data: dict, user=Depends(get_verified_user)
+):
+    # Generates the title, tags and follow-ups of a chat with a single task call
+    enabled_tasks = {
+        "title": request.app.state.config.ENABLE_TITLE_GENERATION,
+        "tags": request.app.state.config.ENABLE_TAGS_GENERATION,
+        "follow_ups": request.app.state.config.ENABLE_FOLLOW_UP_GENERATION,
+    }
+
+    tasks = [
+        task
+        for task in form_data.get("tasks", list(enabled_tasks.keys()))
+        if enabled_tasks.get(task)
+    ]
+    if not tasks:
+        return JSONResponse(
+            status_code=status.HTTP_200_OK,
+            content={"detail": "Chat tasks generation is disabled"},
+        )
+
+    if getattr(request.state, "direct", False) and hasattr(request.state, "model"):
+        models = {
+            request.state.model["id"]: request.state.model,
+        }
+    else:
+        models = request.app.state.MODELS
+
+    model_id = form_data["model"]
+    if model_id not in models:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail="Model not found",
+        )
+
+    # Check if the user has a custom task model
+    # If the user has a custom task model, use that model
+    task_model_id = get_task_model_id(
+        model_id,
+        request.app.state.config.TASK_MODEL,
+        request.app.state.config.TASK_MODEL_EXTERNAL,
+        models,
+    )
+
+    log.debug(
+        f"generating chat tasks {tasks} using model {task_model_id} for user {user.email} "
+    )
+
+    content = chat_tasks_generation_template(
+        DEFAULT_CHAT_TASKS_GENERATION_PROMPT_TEMPLATE,
+        form_data["messages"],
+        tasks,
+        {
+            "name": user.name,
+            "location": user.info.get("location") if user.info else None,
+        },
+    )
+
+    max_tokens = (
+        models[task_model_id].get("info", {}).get("params", {}).get("max_tokens", 1000)
+    )
+
+    payload = {
+        "model": task_model_id,
+        "messages": [{"role": "user", "content": content}],
+        "stream": False,
+        **(
+            {"max_tokens": max_tokens}
+            if models[task_model_id].get("owned_by") == "ollama"
+            else {
+                "max_completion_tokens": max_tokens,
+            }
+        ),
+        "metadata": {
+            **(request.state.metadata if hasattr(request.state, "metadata") else {}),
+            "task": str(TASKS.CHAT_TASKS_GENERATION),
+            "task_body": {**form_data, "tasks": tasks},
+            "chat_id": form_data.get("chat_id", None),
+        },
+    }
+
     # Process the payload through the pipeline
     try:
         payload = await process_pipeline_inlet_filter(request, payload, user, models)
@@ -464,7 +603,9 @@ async def generate_image_prompt(
         raise e
 
     try:
-        return await generate_chat_completion(request, form_data=payload, user=user)
+        return await generate_task_completion(
+            request, str(TASKS.IMAGE_PROMPT_GENERATION), template, payload, user
+        )
     except Exception as e:
         log.error("Exception occurred", exc_info=True)
         return JSONResponse(
@@ -547,7 +688,9 @@ async def generate_queries(
         raise e
 
     try:
-        return await generate_chat_completion(request, form_data=payload, user=user)
+        return await generate_task_completion(
+            request, str(TASKS.QUERY_GENERATION), template, payload, user
+        )
     except Exception as e:
         return JSONResponse(
             status_code=status.HTTP_400_BAD_REQUEST,
@@ -611,6 +754,28 @@ async def generate_autocompletion(
     else:
         template = DEFAULT_AUTOCOMPLETE_GENERATION_PROMPT_TEMPLATE
 
+    # Reuse the rest of a recent suggestion the user is typing along with
+    prefix_group = None
+    if getattr(request.app.state, "TASK_RESULT_CACHE", None) is not None:
+        prefix_group = get_task_cache_key(
+            str(TASKS.AUTOCOMPLETE_GENERATION),
+            task_model_id,
+            template,
+            # Suggestions can contain the user's name, so they are not shared
+            [
+                {"role": "type", "content": type},
+                {"role": "user_id", "content": user.id},
+                *(messages or []),
+            ],
+        )
+        text = request.app.state.TASK_RESULT_CACHE.get_prefix_completion(
+            prefix_group, prompt
+        )
+        if text:
+            return openai_chat_completion_message_template(
+                task_model_id, json.dumps({"text": text})
+            )
+
     content = autocomplete_generation_template(
         template, prompt, messages, type, {"name": user.name}
     )
@@ -634,7 +799,16 @@ async def generate_autocompletion(
         raise e
 
     try:
-        return await generate_chat_completion(request, form_data=payload, user=user)
+        res = await generate_task_completion(
+            request, str(TASKS.AUTOCOMPLETE_GENERATION), template, payload, user
+        )
+        if prefix_group and isinstance(res, dict):
+            text = get_autocompletion_text(res)
+            if text:
+                request.app.state.TASK_RESULT_CACHE.set_prefix_completion(
+                    prefix_group, prompt, text
+                )
+        return res
     except Exception as e:
         log.error(f"Error generating chat completion: {e}")
         return JSONResponse(
@@ -710,7 +884,9 @@ async def generate_emoji(
         raise e
 
     try:
-        return await generate_chat_completion(request, form_data=payload, user=user)
+        return await generate_task_completion(
+            request, str(TASKS.EMOJI_GENERATION), template, payload, user
+        )
     except Exception as e:
         return JSONResponse(
             status_code=status.HTTP_400_BAD_REQUEST,
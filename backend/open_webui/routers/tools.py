@@ -19,7 +19,11 @@ from open_webui.utils.plugin import load_tool_module_by_id, replace_imports
 from open_webui.utils.tools import get_tool_specs
 from open_webui.utils.auth import get_admin_user, get_verified_user
 from open_webui.utils.access_control import has_access, has_permission
-from open_webui.utils.tools import get_tool_servers_data
+from open_webui.utils.tools import (
+    get_tool_servers_data,
+    TOOL_SERVER_CLIENT_POOL,
+    TOOL_SERVER_SPEC_CACHE,
+)
 
 from open_webui.env import SRC_LOG_LEVELS
 from open_webui.config import CACHE_DIR, ENABLE_ADMIN_WORKSPACE_CONTENT_ACCESS
@@ -40,14 +44,11 @@ router = APIRouter()
 @router.get("/", response_model=list[ToolUserResponse])
 async def get_tools(request: Request, user=Depends(get_verified_user)):
 
-    if not request.app.state.TOOL_SERVERS:
-        # If the tool servers are not set, we need to set them
-        # This is done only once when the server starts
-        # This is done to avoid loading the tool servers every time
-
-        request.app.state.TOOL_SERVERS = await get_tool_servers_data(
-            request.app.state.config.TOOL_SERVER_CONNECTIONS
-        )
+    # Specs are served from the tool server spec cache; stale ones are
+    # revalidated in the background, so this only waits on the first load
+    request.app.state.TOOL_SERVERS = await get_tool_servers_data(
+        request.app.state.config.TOOL_SERVER_CONNECTIONS
+    )
 
     tools = Tools.get_tools()
     for server in request.app.state.TOOL_SERVERS:
@@ -188,6 +189,19 @@ async def export_tools(user=Depends(get_admin_user)):
     return tools
 
 
+############################
+# GetToolServerStats
+############################
+
+
+@router.get("/servers/stats")
+async def get_tool_server_stats(user=Depends(get_admin_user)):
+    return {
+        "specs": TOOL_SERVER_SPEC_CACHE.stats(),
+        "servers": TOOL_SERVER_CLIENT_POOL.stats(),
+    }
+
+
 ############################
 # CreateNewTools
 ############################
@@ -313,6 +327,8 @@ async def update_tools_by_id(
 
         TOOLS = request.app.state.TOOLS
         TOOLS[id] = tool_module
+        # Let the cache adopt the freshly compiled module
+        request.app.state.TOOL_CONTENTS.pop(id, None)
 
         specs = get_tool_specs(TOOLS[id])
 
@@ -370,6 +386,7 @@ async def delete_tools_by_id(
         TOOLS = request.app.state.TOOLS
         if id in TOOLS:
             del TOOLS[id]
+        request.app.state.TOOL_CONTENTS.pop(id, None)
 
     return result
 
@@ -469,6 +486,7 @@ async def update_tools_valves_by_id(
         form_data = {k: v for k, v in form_data.items() if v is not None}
         valves = Valves(**form_data)
         Tools.update_tool_valves_by_id(id, valves.model_dump())
+        getattr(request.app.state, "TOOL_VALVES", {}).pop(id, None)
         return valves.model_dump()
     except Exception as e:
         log.exception(f"Failed to update tool valves by id {id}: {e}")
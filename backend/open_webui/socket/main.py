@@ -5,6 +5,7 @@ import socketio
 import logging
 import sys
 import time
+import weakref
 from typing import Dict, Set
 from redis import asyncio as aioredis
 import pycrdt as Y
@@ -27,11 +28,20 @@ from open_webui.env import (
     WEBSOCKET_SENTINEL_PORT,
     WEBSOCKET_SENTINEL_HOSTS,
     REDIS_KEY_PREFIX,
+    ENABLE_CHAT_RESPONSE_DELTA_EVENTS,
+    CHAT_RESPONSE_DELTA_SNAPSHOT_INTERVAL,
 )
 from open_webui.utils.auth import decode_token
-from open_webui.socket.utils import RedisDict, RedisLock, YdocManager
+from open_webui.socket.utils import (
+    RedisDict,
+    RedisLock,
+    YdocManager,
+    ChatCompletionDeltaEncoder,
+    CHAT_COMPLETION_DELTA_CAPABILITY,
+)
 from open_webui.tasks import create_task, stop_item_tasks
 from open_webui.utils.redis import get_redis_connection
+from open_webui.utils.misc import JSONSerializer
 from open_webui.utils.access_control import has_access, get_users_with_access
 
 
@@ -63,6 +73,7 @@ if WEBSOCKET_MANAGER == "redis":
         transports=(["websocket"] if ENABLE_WEBSOCKET_SUPPORT else ["polling"]),
         allow_upgrades=ENABLE_WEBSOCKET_SUPPORT,
         always_connect=True,
+        json=JSONSerializer,
         client_manager=mgr,
     )
 else:
@@ -72,6 +83,7 @@ else:
         transports=(["websocket"] if ENABLE_WEBSOCKET_SUPPORT else ["polling"]),
         allow_upgrades=ENABLE_WEBSOCKET_SUPPORT,
         always_connect=True,
+        json=JSONSerializer,
     )
 
 
@@ -256,6 +268,14 @@ async def usage(sid, data):
         }
 
 
+def get_session_capabilities(auth):
+    # Optional protocol features the client declared support for on connect
+    capabilities = auth.get("capabilities", []) if auth else []
+    if not isinstance(capabilities, list):
+        return []
+    return [c for c in capabilities if isinstance(c, str)]
+
+
 @sio.event
 async def connect(sid, environ, auth):
     user = None
@@ -266,7 +286,10 @@ async def connect(sid, environ, auth):
             user = Users.get_user_by_id(data["id"])
 
         if user:
-            SESSION_POOL[sid] = user.model_dump()
+            SESSION_POOL[sid] = {
+                **user.model_dump(),
+                "capabilities": get_session_capabilities(auth),
+            }
             if user.id in USER_POOL:
                 USER_POOL[user.id] = USER_POOL[user.id] + [sid]
             else:
@@ -288,7 +311,10 @@ async def user_join(sid, data):
     if not user:
         return
 
-    SESSION_POOL[sid] = user.model_dump()
+    SESSION_POOL[sid] = {
+        **user.model_dump(),
+        "capabilities": get_session_capabilities(auth),
+    }
     if user.id in USER_POOL:
         USER_POOL[user.id] = USER_POOL[user.id] + [sid]
     else:
@@ -636,7 +662,40 @@ async def disconnect(sid):
         # print(f"Unknown session ID {sid} disconnected")
 
 
+# Delta encoders by (chat_id, message_id). Every emitter created for the same
+# response (e.g. the one handed to a pipe) shares the encoder, so `seq` keeps
+# increasing; an entry goes away once no emitter references it anymore.
+DELTA_ENCODERS = weakref.WeakValueDictionary()
+
+
+def get_delta_encoder(request_info):
+    if not ENABLE_CHAT_RESPONSE_DELTA_EVENTS:
+        return None
+
+    chat_id = request_info.get("chat_id")
+    message_id = request_info.get("message_id")
+    if not (chat_id and message_id):
+        return ChatCompletionDeltaEncoder(CHAT_RESPONSE_DELTA_SNAPSHOT_INTERVAL)
+
+    encoder = DELTA_ENCODERS.get((chat_id, message_id))
+    if encoder is None:
+        encoder = ChatCompletionDeltaEncoder(CHAT_RESPONSE_DELTA_SNAPSHOT_INTERVAL)
+        DELTA_ENCODERS[(chat_id, message_id)] = encoder
+    return encoder
+
+
 def get_event_emitter(request_info, update_db=True):
+    delta_encoder = get_delta_encoder(request_info)
+    delta_sessions = {}
+
+    def supports_delta(session_id):
+        if session_id not in delta_sessions:
+            session = SESSION_POOL.get(session_id) or {}
+            delta_sessions[session_id] = CHAT_COMPLETION_DELTA_CAPABILITY in (
+                session.get("capabilities") or []
+            )
+        return delta_sessions[session_id]
+
     async def __event_emitter__(event_data):
         user_id = request_info["user_id"]
 
@@ -651,13 +710,31 @@ def get_event_emitter(request_info, update_db=True):
             )
         )
 
+        payloads = {session_id: event_data for session_id in session_ids}
+
+        if (
+            delta_encoder
+            and event_data.get("type") == "chat:completion"
+            and isinstance(event_data.get("data"), dict)
+            and isinstance(event_data["data"].get("content"), str)
+        ):
+            delta_session_ids = [
+                session_id for session_id in session_ids if supports_delta(session_id)
+            ]
+            if delta_session_ids:
+                for data, _session_ids in delta_encoder.encode(
+                    event_data["data"], delta_session_ids
+                ):
+                    for session_id in _session_ids:
+                        payloads[session_id] = {**event_data, "data": data}
+
         emit_tasks = [
             sio.emit(
                 "chat-events",
                 {
                     "chat_id": request_info.get("chat_id", None),
                     "message_id": request_info.get("message_id", None),
-                    "data": event_data,
+                    "data": payloads[session_id],
                 },
                 to=session_id,
             )
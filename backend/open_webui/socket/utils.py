@@ -108,6 +108,73 @@ class RedisDict:
         return self[key]
 
 
+CHAT_COMPLETION_DELTA_CAPABILITY = "chat:completion:delta"
+
+
+class ChatCompletionDeltaEncoder:
+    """
+    Encodes the full-content `chat:completion` payloads of a single response as
+    append-only deltas for sessions that negotiated the delta protocol.
+
+    Every encoded payload carries a `seq` number. A session receives a full
+    snapshot when it first sees the stream, when the content was rewritten
+    instead of extended, on the final `done` event and every
+    `snapshot_interval` events, so clients that miss a delta can resync.
+    """
+
+    def __init__(self, snapshot_interval: int = 100):
+        self.snapshot_interval = snapshot_interval
+        self.seq = -1
+        self.content = None
+        self.events_since_snapshot = 0
+        self.synced_session_ids = set()
+
+    def encode(self, data: dict, session_ids: List[str]) -> List[Tuple[dict, list]]:
+        content = data["content"]
+        rest = {k: v for k, v in data.items() if k != "content"}
+
+        self.seq += 1
+        snapshot = {**rest, "content": content, "seq": self.seq}
+
+        if (
+            self.content is None
+            or data.get("done")
+            or self.events_since_snapshot >= self.snapshot_interval
+            or not content.startswith(self.content)
+        ):
+            self.content = content
+            self.events_since_snapshot = 0
+            self.synced_session_ids = set(session_ids)
+            return [(snapshot, list(session_ids))]
+
+        delta = {
+            **rest,
+            "delta": {"op": "append", "text": content[len(self.content) :]},
+            "seq": self.seq,
+        }
+        self.content = content
+        self.events_since_snapshot += 1
+
+        delta_session_ids = [
+            session_id
+            for session_id in session_ids
+            if session_id in self.synced_session_ids
+        ]
+        snapshot_session_ids = [
+            session_id
+            for session_id in session_ids
+            if session_id not in self.synced_session_ids
+        ]
+        self.synced_session_ids = set(session_ids)
+
+        payloads = []
+        if delta_session_ids:
+            payloads.append((delta, delta_session_ids))
+        if snapshot_session_ids:
+            payloads.append((snapshot, snapshot_session_ids))
+        return payloads
+
+
 class YdocManager:
     def __init__(
         self,
@@ -1,10 +1,17 @@
 import os
 import shutil
+import hashlib
 import json
 import logging
 import re
+import threading
+import time
+import uuid
+import base64
 from abc import ABC, abstractmethod
-from typing import BinaryIO, Tuple, Dict
+from collections import OrderedDict
+from contextlib import contextmanager
+from typing import BinaryIO, Callable, Iterator, Optional, Tuple, Dict
 
 import boto3
 from botocore.config import Config
@@ -25,13 +32,16 @@ from open_webui.config import (
     AZURE_STORAGE_CONTAINER_NAME,
     AZURE_STORAGE_KEY,
     STORAGE_PROVIDER,
+    STORAGE_LOCAL_CACHE_MAX_SIZE_MB,
+    STORAGE_LOCAL_CACHE_VALIDATION_TTL,
+    STORAGE_UPLOAD_PART_SIZE_MB,
     UPLOAD_DIR,
 )
 from google.cloud import storage
 from google.cloud.exceptions import GoogleCloudError, NotFound
 from open_webui.constants import ERROR_MESSAGES
 from azure.identity import DefaultAzureCredential
-from azure.storage.blob import BlobServiceClient
+from azure.storage.blob import BlobBlock, BlobServiceClient
 from azure.core.exceptions import ResourceNotFoundError
 from open_webui.env import SRC_LOG_LEVELS
 
@@ -39,6 +49,57 @@ from open_webui.env import SRC_LOG_LEVELS
 log = logging.getLogger(__name__)
 log.setLevel(SRC_LOG_LEVELS["MAIN"])
 
+CHUNK_SIZE = 1024 * 1024
+UPLOAD_PART_SIZE = STORAGE_UPLOAD_PART_SIZE_MB * 1024 * 1024
+
+
+def write_file_stream(
+    file: BinaryIO,
+    file_path: str,
+    on_chunk: Optional[Callable[[bytes], None]] = None,
+) -> dict:
+    """
+    Copies `file` to `file_path` chunk by chunk, hashing it on the way, and
+    passes every chunk to `on_chunk`. Returns the size and SHA-256 of the file.
+    """
+    sha256 = hashlib.sha256()
+    size = 0
+    try:
+        with open(file_path, "wb") as f:
+            while chunk := file.read(CHUNK_SIZE):
+                f.write(chunk)
+                sha256.update(chunk)
+                size += len(chunk)
+                if on_chunk:
+                    on_chunk(chunk)
+
+        if not size:
+            raise ValueError(ERROR_MESSAGES.EMPTY_CONTENT)
+    except BaseException:
+        if os.path.exists(file_path):
+            os.remove(file_path)
+        raise
+
+    return {"size": size, "sha256": sha256.hexdigest()}
+
+
+def iter_file_range(
+    file_path: str, start: int = 0, end: Optional[int] = None
+) -> Iterator[bytes]:
+    """Yields the bytes `start`..`end` (inclusive) of a local file in chunks."""
+    with open(file_path, "rb") as f:
+        f.seek(start)
+        remaining = None if end is None else end - start + 1
+        while remaining is None or remaining > 0:
+            chunk = f.read(
+                CHUNK_SIZE if remaining is None else min(CHUNK_SIZE, remaining)
+            )
+            if not chunk:
+                break
+            if remaining is not None:
+                remaining -= len(chunk)
+            yield chunk
+
 
 class StorageProvider(ABC):
     @abstractmethod
@@ -46,9 +107,36 @@ class StorageProvider(ABC):
         pass
 
     @abstractmethod
+    def get_local_file(self, file_path: str) -> Optional[str]:
+        """Returns a valid local copy of the file, if one exists, without remote calls."""
+        pass
+
+    @abstractmethod
+    def get_file_size(self, file_path: str) -> int:
+        pass
+
+    @abstractmethod
+    def get_file_stream(
+        self, file_path: str, start: int = 0, end: Optional[int] = None
+    ) -> Iterator[bytes]:
+        """Streams the bytes `start`..`end` (inclusive) of the file."""
+        pass
+
     def upload_file(
         self, file: BinaryIO, filename: str, tags: Dict[str, str]
     ) -> Tuple[bytes, str]:
+        _, file_path = self.upload_file_stream(file, filename, tags)
+        with open(self.get_file(file_path), "rb") as f:
+            return f.read(), file_path
+
+    @abstractmethod
+    def upload_file_stream(
+        self, file: BinaryIO, filename: str, tags: Dict[str, str]
+    ) -> Tuple[dict, str]:
+        """
+        Uploads the file in chunks without reading it into memory and returns
+        its size and SHA-256 along with the storage path.
+        """
         pass
 
     @abstractmethod
@@ -62,27 +150,37 @@ class StorageProvider(ABC):
 
 class LocalStorageProvider(StorageProvider):
     @staticmethod
-    def upload_file(
+    def upload_file_stream(
         file: BinaryIO, filename: str, tags: Dict[str, str]
-    ) -> Tuple[bytes, str]:
-        contents = file.read()
-        if not contents:
-            raise ValueError(ERROR_MESSAGES.EMPTY_CONTENT)
+    ) -> Tuple[dict, str]:
         file_path = f"{UPLOAD_DIR}/{filename}"
-        with open(file_path, "wb") as f:
-            f.write(contents)
-        return contents, file_path
+        return write_file_stream(file, file_path), file_path
 
     @staticmethod
     def get_file(file_path: str) -> str:
         """Handles downloading of the file from local storage."""
         return file_path
 
+    @staticmethod
+    def get_local_file(file_path: str) -> Optional[str]:
+        return file_path if os.path.isfile(file_path) else None
+
+    @staticmethod
+    def get_file_size(file_path: str) -> int:
+        return os.path.getsize(file_path)
+
+    @staticmethod
+    def get_file_stream(
+        file_path: str, start: int = 0, end: Optional[int] = None
+    ) -> Iterator[bytes]:
+        return iter_file_range(file_path, start, end)
+
     @staticmethod
     def delete_file(file_path: str) -> None:
         """Handles deletion of the file from local storage."""
         filename = file_path.split("/")[-1]
         file_path = f"{UPLOAD_DIR}/{filename}"
+        LOCAL_FILE_CACHE.discard(file_path)
         if os.path.isfile(file_path):
             os.remove(file_path)
         else:
@@ -91,6 +189,7 @@ class LocalStorageProvider(StorageProvider):
     @staticmethod
     def delete_all_files() -> None:
         """Handles deletion of all files from local storage."""
+        LOCAL_FILE_CACHE.clear()
         if os.path.exists(UPLOAD_DIR):
             for filename in os.listdir(UPLOAD_DIR):
                 file_path = os.path.join(UPLOAD_DIR, filename)
@@ -105,6 +204,213 @@ class LocalStorageProvider(StorageProvider):
             log.warning(f"Directory {UPLOAD_DIR} not found in local storage.")
 
 
+class LocalFileCache:
+    """
+    Size-bounded LRU index of the local copies that remote storage providers
+    keep in UPLOAD_DIR.
+
+    A local copy is served without touching the remote store for
+    `validation_ttl` seconds after it was downloaded or validated; after that
+    it is revalidated with a metadata request (ETag and size) and only
+    downloaded again when the object changed. Concurrent downloads of the same
+    file are deduplicated and written atomically, and the least recently used
+    copies are removed once the total size exceeds `max_size` bytes.
+
+    Callers open the returned path after `get` has released its lock, so a
+    copy is not evicted within `eviction_grace` seconds of being returned.
+    """
+
+    def __init__(
+        self, max_size: int = 0, validation_ttl: int = 300, eviction_grace: int = 60
+    ):
+        self.max_size = max_size
+        self.validation_ttl = validation_ttl
+        self.eviction_grace = eviction_grace
+
+        self._lock = threading.Lock()
+        self._file_locks: Dict[str, list] = {}
+        # local path -> {"size", "etag", "validated_at", "used_at"}
+        self._entries: OrderedDict[str, dict] = OrderedDict()
+        self._total_size = 0
+
+        self.hits = 0
+        self.misses = 0
+        self.validations = 0
+        self.evictions = 0
+        self.downloaded_bytes = 0
+
+    @contextmanager
+    def _file_lock(self, local_path: str):
+        with self._lock:
+            slot = self._file_locks.setdefault(local_path, [threading.Lock(), 0])
+            slot[1] += 1
+        try:
+            with slot[0]:
+                yield
+        finally:
+            with self._lock:
+                slot[1] -= 1
+                if slot[1] == 0:
+                    self._file_locks.pop(local_path, None)
+
+    def _set_entry(self, local_path: str, size: int, etag: Optional[str]):
+        with self._lock:
+            entry = self._entries.pop(local_path, None)
+            if entry is not None:
+                self._total_size -= entry["size"]
+            now = time.monotonic()
+            self._entries[local_path] = {
+                "size": size,
+                "etag": etag,
+                "validated_at": now,
+                "used_at": now,
+            }
+            self._total_size += size
+
+    def get(
+        self,
+        local_path: str,
+        stat: Callable[[], Tuple[Optional[str], Optional[int]]],
+        download: Callable[[str], None],
+    ) -> str:
+        """
+        Returns `local_path` once it holds a valid copy of the remote object.
+        `stat` returns the remote (etag, size); `download` writes the object to
+        the given temporary path.
+        """
+        with self._file_lock(local_path):
+            etag = None
+            if os.path.isfile(local_path):
+                local_size = os.path.getsize(local_path)
+                entry = self._entries.get(local_path)
+
+                if (
+                    entry is not None
+                    and entry["size"] == local_size
+                    and time.monotonic() - entry["validated_at"] < self.validation_ttl
+                ):
+                    self._touch(local_path)
+                    self.hits += 1
+                    return local_path
+
+                self.validations += 1
+                etag, size = stat()
+                if size == local_size and (
+                    entry is None or not entry["etag"] or entry["etag"] == etag
+                ):
+                    self._set_entry(local_path, local_size, etag)
+                    self.hits += 1
+                    return local_path
+
+            self.misses += 1
+            tmp_path = f"{local_path}.{uuid.uuid4().hex}.part"
+            try:
+                download(tmp_path)
+                os.replace(tmp_path, local_path)
+            finally:
+                if os.path.exists(tmp_path):
+                    os.remove(tmp_path)
+
+            size = os.path.getsize(local_path)
+            self.downloaded_bytes += size
+            # Without an ETag the copy is validated by size on the next check
+            self._set_entry(local_path, size, etag)
+
+        self.evict(keep=local_path)
+        return local_path
+
+    def peek(self, local_path: str) -> Optional[str]:
+        """Returns `local_path` if it holds a copy that needs no revalidation yet."""
+        entry = self._entries.get(local_path)
+        if (
+            entry is not None
+            and time.monotonic() - entry["validated_at"] < self.validation_ttl
+            and os.path.isfile(local_path)
+            and os.path.getsize(local_path) == entry["size"]
+        ):
+            self._touch(local_path)
+            self.hits += 1
+            return local_path
+        return None
+
+    def add(self, local_path: str, etag: Optional[str] = None):
+        if os.path.isfile(local_path):
+            self._set_entry(local_path, os.path.getsize(local_path), etag)
+            self.evict(keep=local_path)
+
+    def discard(self, local_path: str):
+        with self._lock:
+            entry = self._entries.pop(local_path, None)
+            if entry is not None:
+                self._total_size -= entry["size"]
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+            self._total_size = 0
+
+    def _touch(self, local_path: str):
+        with self._lock:
+            if local_path in self._entries:
+                self._entries[local_path]["used_at"] = time.monotonic()
+                self._entries.move_to_end(local_path)
+
+    def evict(self, keep: Optional[str] = None):
+        if not self.max_size:
+            return
+
+        with self._lock:
+            # Entries are ordered by last use, the ones after the first copy
+            # still in its grace period may be in use as well
+            grace_start = time.monotonic() - self.eviction_grace
+            candidates = []
+            for path, entry in self._entries.items():
+                if entry["used_at"] > grace_start:
+                    break
+                if path != keep and path not in self._file_locks:
+                    candidates.append(path)
+
+        for path in candidates:
+            with self._lock:
+                if self._total_size <= self.max_size:
+                    break
+                entry = self._entries.get(path)
+                if (
+                    entry is None
+                    or entry["used_at"] > grace_start
+                    or path in self._file_locks
+                ):
+                    continue
+                del self._entries[path]
+                self._total_size -= entry["size"]
+
+            try:
+                os.remove(path)
+                self.evictions += 1
+            except FileNotFoundError:
+                pass
+            except Exception as e:
+                log.warning(f"Failed to evict cached file {path}: {e}")
+
+    def stats(self) -> dict:
+        return {
+            "files": len(self._entries),
+            "size": self._total_size,
+            "max_size": self.max_size,
+            "hits": self.hits,
+            "misses": self.misses,
+            "validations": self.validations,
+            "evictions": self.evictions,
+            "downloaded_bytes": self.downloaded_bytes,
+        }
+
+
+LOCAL_FILE_CACHE = LocalFileCache(
+    max_size=STORAGE_LOCAL_CACHE_MAX_SIZE_MB * 1024 * 1024,
+    validation_ttl=STORAGE_LOCAL_CACHE_VALIDATION_TTL,
+)
+
+
 class S3StorageProvider(StorageProvider):
     def __init__(self):
         config = Config(
@@ -142,14 +448,59 @@ class S3StorageProvider(StorageProvider):
         """Only include S3 allowed characters."""
         return re.sub(r"[^a-zA-Z0-9 äöüÄÖÜß\+\-=\._:/@]", "", s)
 
-    def upload_file(
+    def upload_file_stream(
         self, file: BinaryIO, filename: str, tags: Dict[str, str]
-    ) -> Tuple[bytes, str]:
-        """Handles uploading of the file to S3 storage."""
-        _, file_path = LocalStorageProvider.upload_file(file, filename, tags)
+    ) -> Tuple[dict, str]:
+        """
+        Handles uploading of the file to S3 storage. Files larger than one part
+        are sent as a multipart upload while they are being received.
+        """
+        file_path = f"{UPLOAD_DIR}/{filename}"
         s3_key = os.path.join(self.key_prefix, filename)
+        upload_id = None
+        parts = []
+        buffer = bytearray()
+
+        def upload_part():
+            nonlocal upload_id
+            if upload_id is None:
+                upload_id = self.s3_client.create_multipart_upload(
+                    Bucket=self.bucket_name, Key=s3_key
+                )["UploadId"]
+
+            part_number = len(parts) + 1
+            response = self.s3_client.upload_part(
+                Bucket=self.bucket_name,
+                Key=s3_key,
+                PartNumber=part_number,
+                UploadId=upload_id,
+                Body=bytes(buffer),
+            )
+            parts.append({"ETag": response["ETag"], "PartNumber": part_number})
+            buffer.clear()
+
+        def on_chunk(chunk: bytes):
+            buffer.extend(chunk)
+            if len(buffer) >= UPLOAD_PART_SIZE:
+                upload_part()
+
         try:
-            self.s3_client.upload_file(file_path, self.bucket_name, s3_key)
+            info = write_file_stream(file, file_path, on_chunk)
+            if upload_id is None:
+                response = self.s3_client.put_object(
+                    Bucket=self.bucket_name, Key=s3_key, Body=bytes(buffer)
+                )
+            else:
+                if buffer:
+                    upload_part()
+                response = self.s3_client.complete_multipart_upload(
+                    Bucket=self.bucket_name,
+                    Key=s3_key,
+                    UploadId=upload_id,
+                    MultipartUpload={"Parts": parts},
+                )
+                upload_id = None
+
             if S3_ENABLE_TAGGING and tags:
                 sanitized_tags = {
                     self.sanitize_tag_value(k): self.sanitize_tag_value(v)
@@ -165,22 +516,65 @@ class S3StorageProvider(StorageProvider):
                     Key=s3_key,
                     Tagging=tagging,
                 )
-            return (
-                open(file_path, "rb").read(),
-                f"s3://{self.bucket_name}/{s3_key}",
-            )
+            LOCAL_FILE_CACHE.add(file_path, response.get("ETag"))
+            return info, f"s3://{self.bucket_name}/{s3_key}"
         except ClientError as e:
             raise RuntimeError(f"Error uploading file to S3: {e}")
+        finally:
+            if upload_id is not None:
+                try:
+                    self.s3_client.abort_multipart_upload(
+                        Bucket=self.bucket_name, Key=s3_key, UploadId=upload_id
+                    )
+                except ClientError as e:
+                    log.warning(f"Failed to abort multipart upload of {s3_key}: {e}")
 
     def get_file(self, file_path: str) -> str:
         """Handles downloading of the file from S3 storage."""
         try:
             s3_key = self._extract_s3_key(file_path)
-            local_file_path = self._get_local_file_path(s3_key)
-            self.s3_client.download_file(self.bucket_name, s3_key, local_file_path)
-            return local_file_path
+
+            def stat():
+                head = self.s3_client.head_object(Bucket=self.bucket_name, Key=s3_key)
+                return head.get("ETag"), head.get("ContentLength")
+
+            return LOCAL_FILE_CACHE.get(
+                self._get_local_file_path(s3_key),
+                stat,
+                lambda path: self.s3_client.download_file(
+                    self.bucket_name, s3_key, path
+                ),
+            )
+        except ClientError as e:
+            raise RuntimeError(f"Error downloading file from S3: {e}")
+
+    def get_local_file(self, file_path: str) -> Optional[str]:
+        return LOCAL_FILE_CACHE.peek(
+            self._get_local_file_path(self._extract_s3_key(file_path))
+        )
+
+    def get_file_size(self, file_path: str) -> int:
+        try:
+            return self.s3_client.head_object(
+                Bucket=self.bucket_name, Key=self._extract_s3_key(file_path)
+            )["ContentLength"]
+        except ClientError as e:
+            raise RuntimeError(f"Error downloading file from S3: {e}")
+
+    def get_file_stream(
+        self, file_path: str, start: int = 0, end: Optional[int] = None
+    ) -> Iterator[bytes]:
+        """Streams the file from S3 storage without a local copy."""
+        kwargs = {}
+        if start or end is not None:
+            kwargs["Range"] = f"bytes={start}-{'' if end is None else end}"
+        try:
+            response = self.s3_client.get_object(
+                Bucket=self.bucket_name, Key=self._extract_s3_key(file_path), **kwargs
+            )
         except ClientError as e:
             raise RuntimeError(f"Error downloading file from S3: {e}")
+        return response["Body"].iter_chunks(CHUNK_SIZE)
 
     def delete_file(self, file_path: str) -> None:
         """Handles deletion of the file from S3 storage."""
@@ -235,15 +629,37 @@ class GCSStorageProvider(StorageProvider):
             self.gcs_client = storage.Client()
         self.bucket = self.gcs_client.bucket(GCS_BUCKET_NAME)
 
-    def upload_file(
+    def upload_file_stream(
         self, file: BinaryIO, filename: str, tags: Dict[str, str]
-    ) -> Tuple[bytes, str]:
-        """Handles uploading of the file to GCS storage."""
-        contents, file_path = LocalStorageProvider.upload_file(file, filename, tags)
+    ) -> Tuple[dict, str]:
+        """
+        Handles uploading of the file to GCS storage. Files larger than one part
+        are sent as a resumable upload while they are being received.
+        """
+        file_path = f"{UPLOAD_DIR}/{filename}"
+        blob = self.bucket.blob(filename)
+        writer = None
+        buffer = bytearray()
+
+        def on_chunk(chunk: bytes):
+            nonlocal writer
+            if writer is None:
+                buffer.extend(chunk)
+                if len(buffer) < UPLOAD_PART_SIZE:
+                    return
+                writer = blob.open("wb", chunk_size=UPLOAD_PART_SIZE)
+                chunk = bytes(buffer)
+                buffer.clear()
+            writer.write(chunk)
+
         try:
-            blob = self.bucket.blob(filename)
-            blob.upload_from_filename(file_path)
-            return contents, "gs://" + self.bucket_name + "/" + filename
+            info = write_file_stream(file, file_path, on_chunk)
+            if writer is None:
+                blob.upload_from_string(bytes(buffer))
+            else:
+                writer.close()
+            LOCAL_FILE_CACHE.add(file_path, blob.etag)
+            return info, "gs://" + self.bucket_name + "/" + filename
         except GoogleCloudError as e:
             raise RuntimeError(f"Error uploading file to GCS: {e}")
 
@@ -251,14 +667,59 @@ class GCSStorageProvider(StorageProvider):
         """Handles downloading of the file from GCS storage."""
         try:
             filename = file_path.removeprefix("gs://").split("/")[1]
-            local_file_path = f"{UPLOAD_DIR}/{filename}"
-            blob = self.bucket.get_blob(filename)
-            blob.download_to_filename(local_file_path)
 
-            return local_file_path
+            def stat():
+                blob = self.bucket.get_blob(filename)
+                if blob is None:
+                    raise NotFound(f"File {filename} not found in GCS")
+                return blob.etag, blob.size
+
+            return LOCAL_FILE_CACHE.get(
+                f"{UPLOAD_DIR}/{filename}",
+                stat,
+                lambda path: self.bucket.blob(filename).download_to_filename(path),
+            )
         except NotFound as e:
             raise RuntimeError(f"Error downloading file from GCS: {e}")
 
+    def get_local_file(self, file_path: str) -> Optional[str]:
+        filename = file_path.removeprefix("gs://").split("/")[1]
+        return LOCAL_FILE_CACHE.peek(f"{UPLOAD_DIR}/{filename}")
+
+    def _get_blob(self, file_path: str):
+        filename = file_path.removeprefix("gs://").split("/")[1]
+        blob = self.bucket.get_blob(filename)
+        if blob is None:
+            raise RuntimeError(
+                f"Error downloading file from GCS: File {filename} not found in GCS"
+            )
+        return blob
+
+    def get_file_size(self, file_path: str) -> int:
+        return self._get_blob(file_path).size
+
+    def get_file_stream(
+        self, file_path: str, start: int = 0, end: Optional[int] = None
+    ) -> Iterator[bytes]:
+        """Streams the file from GCS storage in ranged requests without a local copy."""
+        blob = self._get_blob(file_path)
+        end = blob.size - 1 if end is None else min(end, blob.size - 1)
+
+        def iterator():
+            position = start
+            while position <= end:
+                chunk_end = min(position + CHUNK_SIZE - 1, end)
+                # Pin the generation so a concurrent overwrite can't mix versions
+                yield blob.download_as_bytes(
+                    start=position,
+                    end=chunk_end,
+                    if_generation_match=blob.generation,
+                    checksum=None,
+                )
+                position = chunk_end + 1
+
+        return iterator()
+
     def delete_file(self, file_path: str) -> None:
         """Handles deletion of the file from GCS storage."""
         try:
@@ -307,15 +768,41 @@ class AzureStorageProvider(StorageProvider):
             self.container_name
         )
 
-    def upload_file(
+    def upload_file_stream(
         self, file: BinaryIO, filename: str, tags: Dict[str, str]
-    ) -> Tuple[bytes, str]:
-        """Handles uploading of the file to Azure Blob Storage."""
-        contents, file_path = LocalStorageProvider.upload_file(file, filename, tags)
+    ) -> Tuple[dict, str]:
+        """
+        Handles uploading of the file to Azure Blob Storage. Files larger than
+        one part are staged block by block while they are being received.
+        """
+        file_path = f"{UPLOAD_DIR}/{filename}"
+        blob_client = self.container_client.get_blob_client(filename)
+        blocks = []
+        buffer = bytearray()
+
+        def stage_block():
+            block_id = base64.b64encode(f"{len(blocks):08d}".encode()).decode()
+            blob_client.stage_block(block_id, bytes(buffer))
+            blocks.append(BlobBlock(block_id=block_id))
+            buffer.clear()
+
+        def on_chunk(chunk: bytes):
+            buffer.extend(chunk)
+            if len(buffer) >= UPLOAD_PART_SIZE:
+                stage_block()
+
         try:
-            blob_client = self.container_client.get_blob_client(filename)
-            blob_client.upload_blob(contents, overwrite=True)
-            return contents, f"{self.endpoint}/{self.container_name}/{filename}"
+            info = write_file_stream(file, file_path, on_chunk)
+            if not blocks:
+                blob_client.upload_blob(bytes(buffer), overwrite=True)
+            else:
+                if buffer:
+                    stage_block()
+                blob_client.commit_block_list(blocks)
+            LOCAL_FILE_CACHE.add(file_path)
+            return info, f"{self.endpoint}/{self.container_name}/{filename}"
+        except ValueError:
+            raise
         except Exception as e:
             raise RuntimeError(f"Error uploading file to Azure Blob Storage: {e}")
 
@@ -323,13 +810,48 @@ class AzureStorageProvider(StorageProvider):
         """Handles downloading of the file from Azure Blob Storage."""
         try:
             filename = file_path.split("/")[-1]
-            local_file_path = f"{UPLOAD_DIR}/{filename}"
             blob_client = self.container_client.get_blob_client(filename)
-            with open(local_file_path, "wb") as download_file:
-                download_file.write(blob_client.download_blob().readall())
-            return local_file_path
+
+            def stat():
+                properties = blob_client.get_blob_properties()
+                return properties.etag, properties.size
+
+            def download(path):
+                with open(path, "wb") as download_file:
+                    blob_client.download_blob().readinto(download_file)
+
+            return LOCAL_FILE_CACHE.get(f"{UPLOAD_DIR}/{filename}", stat, download)
+        except ResourceNotFoundError as e:
+            raise RuntimeError(f"Error downloading file from Azure Blob Storage: {e}")
+
+    def get_local_file(self, file_path: str) -> Optional[str]:
+        return LOCAL_FILE_CACHE.peek(f"{UPLOAD_DIR}/{file_path.split('/')[-1]}")
+
+    def get_file_size(self, file_path: str) -> int:
+        try:
+            blob_client = self.container_client.get_blob_client(
+                file_path.split("/")[-1]
+            )
+            return blob_client.get_blob_properties().size
+        except ResourceNotFoundError as e:
+            raise RuntimeError(f"Error downloading file from Azure Blob Storage: {e}")
+
+    def get_file_stream(
+        self, file_path: str, start: int = 0, end: Optional[int] = None
+    ) -> Iterator[bytes]:
+        """Streams the file from Azure Blob Storage without a local copy."""
+        try:
+            blob_client = self.container_client.get_blob_client(
+                file_path.split("/")[-1]
+            )
+            downloader = blob_client.download_blob(
+                offset=start,
+                length=None if end is None else end - start + 1,
+                max_concurrency=1,
+            )
         except ResourceNotFoundError as e:
             raise RuntimeError(f"Error downloading file from Azure Blob Storage: {e}")
+        return downloader.chunks()
 
     def delete_file(self, file_path: str) -> None:
         """Handles deletion of the file from Azure Blob Storage."""
@@ -1,3 +1,4 @@
+import hashlib
 import io
 import os
 import boto3
@@ -74,12 +75,32 @@ class TestLocalStorageProvider:
         with pytest.raises(ValueError):
             self.Storage.upload_file(self.file_bytesio_empty, self.filename)
 
+    def test_upload_file_stream(self, monkeypatch, tmp_path):
+        upload_dir = mock_upload_dir(monkeypatch, tmp_path)
+        file_info, file_path = self.Storage.upload_file_stream(
+            io.BytesIO(self.file_content), self.filename, {}
+        )
+        assert file_info["size"] == len(self.file_content)
+        assert file_info["sha256"] == hashlib.sha256(self.file_content).hexdigest()
+        assert file_path == str(upload_dir / self.filename)
+        with pytest.raises(ValueError):
+            self.Storage.upload_file_stream(io.BytesIO(), self.filename_extra, {})
+        assert not (upload_dir / self.filename_extra).exists()
+
     def test_get_file(self, monkeypatch, tmp_path):
         upload_dir = mock_upload_dir(monkeypatch, tmp_path)
         file_path = str(upload_dir / self.filename)
         file_path_return = self.Storage.get_file(file_path)
         assert file_path == file_path_return
 
+    def test_get_file_stream(self, monkeypatch, tmp_path):
+        upload_dir = mock_upload_dir(monkeypatch, tmp_path)
+        (upload_dir / self.filename).write_bytes(self.file_content)
+        file_path = str(upload_dir / self.filename)
+        assert self.Storage.get_file_size(file_path) == len(self.file_content)
+        assert b"".join(self.Storage.get_file_stream(file_path)) == self.file_content
+        assert b"".join(self.Storage.get_file_stream(file_path, 5, 11)) == b"content"
+
     def test_delete_file(self, monkeypatch, tmp_path):
         upload_dir = mock_upload_dir(monkeypatch, tmp_path)
         (upload_dir / self.filename).write_bytes(self.file_content)
@@ -97,6 +118,59 @@ class TestLocalStorageProvider:
         assert not (upload_dir / self.filename_extra).exists()
 
 
+class TestLocalFileCache:
+    file_content = b"test content"
+
+    def test_get_reuses_valid_copy(self, tmp_path):
+        cache = provider.LocalFileCache(validation_ttl=0)
+        local_path = str(tmp_path / "test.txt")
+        downloads = []
+
+        def download(path):
+            downloads.append(path)
+            with open(path, "wb") as f:
+                f.write(self.file_content)
+
+        stat = lambda: ("etag-1", len(self.file_content))
+        assert cache.get(local_path, stat, download) == local_path
+        assert cache.get(local_path, stat, download) == local_path
+        assert len(downloads) == 1
+        assert cache.stats()["hits"] == 1
+        assert cache.stats()["misses"] == 1
+
+        # A changed remote object is downloaded again
+        stat = lambda: ("etag-2", len(self.file_content))
+        cache.get(local_path, stat, download)
+        assert len(downloads) == 2
+        assert not any(os.path.exists(path) for path in downloads)
+
+    def test_evicts_least_recently_used(self, tmp_path):
+        cache = provider.LocalFileCache(
+            max_size=2 * len(self.file_content), eviction_grace=0
+        )
+        paths = [str(tmp_path / f"test_{idx}.txt") for idx in range(3)]
+        for path in paths:
+            with open(path, "wb") as f:
+                f.write(self.file_content)
+            cache.add(path)
+
+        assert not os.path.exists(paths[0])
+        assert os.path.exists(paths[1]) and os.path.exists(paths[2])
+        assert cache.stats()["evictions"] == 1
+
+    def test_keeps_recently_returned_copies(self, tmp_path):
+        cache = provider.LocalFileCache(max_size=2 * len(self.file_content))
+        paths = [str(tmp_path / f"test_{idx}.txt") for idx in range(3)]
+        for path in paths:
+            with open(path, "wb") as f:
+                f.write(self.file_content)
+            cache.add(path)
+
+        # Callers may still be about to open them, so nothing is evicted yet
+        assert all(os.path.exists(path) for path in paths)
+        assert cache.stats()["evictions"] == 0
+
+
 @mock_aws
 class TestS3StorageProvider:
 
@@ -0,0 +1,151 @@
+"""
+Streaming benchmark for `process_chat_response`.
+
+Replays a recorded SSE transcript (one `data: {...}` line per chunk, as sent
+by an OpenAI-compatible upstream) through the streaming response handler and
+reports tokens/sec, CPU time per token and the socket payload volume. Database
+writes and socket emits are replaced by in-memory counters. With `--delta-events`
+the payload is measured as sent to a client that negotiated append-only deltas.
+
+    python -m open_webui.test.benchmarks.bench_chat_stream --transcript chat.sse
+    python -m open_webui.test.benchmarks.bench_chat_stream --tokens 8000
+    python -m open_webui.test.benchmarks.bench_chat_stream --delta-events
+"""
+
+import argparse
+import asyncio
+import json
+import time
+from types import SimpleNamespace
+from unittest.mock import patch
+
+from starlette.responses import StreamingResponse
+
+from open_webui.socket.utils import ChatCompletionDeltaEncoder
+from open_webui.utils import middleware
+from open_webui.utils.misc import json_dumps
+
+
+def load_transcript(path: str) -> list[bytes]:
+    with open(path, "rb") as f:
+        return [line for line in f.read().splitlines() if line.strip()]
+
+
+def generate_transcript(tokens: int) -> list[bytes]:
+    lines = []
+    for idx in range(tokens):
+        chunk = {
+            "id": "chatcmpl-bench",
+            "object": "chat.completion.chunk",
+            "choices": [{"index": 0, "delta": {"content": f"token{idx} "}}],
+        }
+        lines.append(f"data: {json.dumps(chunk)}".encode("utf-8"))
+    lines.append(b"data: [DONE]")
+    return lines
+
+
+async def replay(lines: list[bytes], delta_chunk_size: int, delta_events: bool):
+    stats = {"events": 0, "bytes": 0, "db_writes": 0}
+    delta_encoder = ChatCompletionDeltaEncoder() if delta_events else None
+
+    async def body_iterator():
+        for line in lines:
+            yield line
+
+    async def event_emitter(event):
+        if (
+            delta_encoder
+            and event.get("type") == "chat:completion"
+            and isinstance(event.get("data", {}).get("content"), str)
+        ):
+            [(data, _)] = delta_encoder.encode(event["data"], ["session"])
+            event = {**event, "data": data}
+
+        stats["events"] += 1
+        stats["bytes"] += len(json_dumps(event))
+
+    async def event_caller(event):
+        return None
+
+    async def create_task(redis, coroutine, id=None):
+        await coroutine
+        return "bench", None
+
+    def upsert_message(*args, **kwargs):
+        stats["db_writes"] += 1
+
+    chats = SimpleNamespace(
+        get_message_by_id_and_message_id=lambda *args: None,
+        upsert_message_to_chat_by_id_and_message_id=upsert_message,
+        get_chat_title_by_id=lambda *args: "Benchmark",
+        get_messages_by_chat_id=lambda *args: None,
+    )
+
+    request = SimpleNamespace(
+        app=SimpleNamespace(state=SimpleNamespace(redis=None)),
+        state=SimpleNamespace(),
+    )
+    user = SimpleNamespace(id="user", model_dump=lambda: {"id": "user"})
+    metadata = {
+        "chat_id": "chat",
+        "message_id": "message",
+        "session_id": "session",
+        "user_id": "user",
+        "params": {"stream_delta_chunk_size": delta_chunk_size},
+    }
+    response = StreamingResponse(body_iterator(), media_type="text/event-stream")
+
+    with (
+        patch.object(middleware, "Chats", chats),
+        patch.object(middleware, "get_event_emitter", lambda _: event_emitter),
+        patch.object(middleware, "get_event_call", lambda _: event_caller),
+        patch.object(middleware, "create_task", create_task),
+        patch.object(middleware, "get_sorted_filter_ids", lambda *args: []),
+        patch.object(middleware, "get_active_status_by_user_id", lambda _: True),
+    ):
+        wall_start = time.perf_counter()
+        cpu_start = time.process_time()
+        await middleware.process_chat_response(
+            request,
+            response,
+            {"model": "bench", "messages": []},
+            user,
+            metadata,
+            {"id": "bench"},
+            [],
+            {},
+        )
+        wall = time.perf_counter() - wall_start
+        cpu = time.process_time() - cpu_start
+
+    return wall, cpu, stats
+
+
+async def run(lines: list[bytes], delta_chunk_size: int, delta_events: bool):
+    tokens = sum(1 for line in lines if b'"content"' in line)
+    wall, cpu, stats = await replay(lines, delta_chunk_size, delta_events)
+
+    print(
+        f"tokens={tokens} delta_chunk_size={delta_chunk_size} delta_events={delta_events}"
+    )
+    print(f"  throughput:     {tokens / wall:10.1f} tokens/s")
+    print(f"  cpu per token:  {cpu * 1e6 / max(tokens, 1):10.2f} us")
+    print(f"  socket events:  {stats['events']:10d}")
+    print(f"  socket payload: {stats['bytes'] / 1024:10.1f} KiB")
+    print(f"  db writes:      {stats['db_writes']:10d}")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--transcript", type=str, default=None)
+    parser.add_argument("--tokens", type=int, default=4000)
+    parser.add_argument("--delta-chunk-size", type=int, default=1)
+    parser.add_argument("--delta-events", action="store_true")
+    args = parser.parse_args()
+
+    lines = (
+        load_transcript(args.transcript)
+        if args.transcript
+        else generate_transcript(args.tokens)
+    )
+    asyncio.run(run(lines, args.delta_chunk_size, args.delta_events))
@@ -0,0 +1,107 @@
+"""
+Micro-benchmark for stream filters.
+
+Compares resolving the filters for every chunk (`process_filter_functions`)
+with a filter pipeline compiled once per response (`get_filter_pipeline`).
+
+    python -m open_webui.test.benchmarks.bench_stream_filters --filters 4 --chunks 5000
+"""
+
+import argparse
+import asyncio
+import os
+import time
+from collections import OrderedDict
+from types import SimpleNamespace
+
+os.environ.setdefault("FUNCTIONS_CACHE_TTL", "3600")
+
+from pydantic import BaseModel
+
+from open_webui.utils.filter import (
+    get_filter_pipeline,
+    process_filter_functions,
+    process_filter_pipeline,
+)
+
+
+class Filter:
+    class Valves(BaseModel):
+        priority: int = 0
+        suffix: str = ""
+
+    class UserValves(BaseModel):
+        enabled: bool = True
+
+    def __init__(self):
+        self.valves = self.Valves()
+
+    def stream(self, event: dict, __user__: dict, __id__: str) -> dict:
+        return event
+
+
+def get_request(filter_count: int):
+    functions = {}
+    rows = {}
+    for idx in range(filter_count):
+        function_id = f"filter_{idx}"
+        functions[function_id] = Filter()
+        rows[function_id] = SimpleNamespace(
+            id=function_id,
+            type="filter",
+            valves={"priority": idx, "suffix": ""},
+            is_active=True,
+            is_global=True,
+        )
+
+    state = SimpleNamespace(
+        FUNCTIONS=functions,
+        FUNCTION_CONTENTS={},
+        FUNCTION_VALVES={},
+        FUNCTION_ROWS=rows,
+        FUNCTION_ROWS_LOADED_AT=time.monotonic(),
+        USER_VALVES=OrderedDict(),
+    )
+    return SimpleNamespace(app=SimpleNamespace(state=state)), list(rows.values())
+
+
+def get_chunk(idx: int) -> dict:
+    return {"choices": [{"delta": {"content": f"token{idx} "}}]}
+
+
+async def run(filter_count: int, chunk_count: int):
+    request, filter_functions = get_request(filter_count)
+    extra_params = {
+        "__user__": {"id": "user", "settings": {}},
+        "__metadata__": {},
+    }
+
+    start = time.perf_counter()
+    for idx in range(chunk_count):
+        await process_filter_functions(
+            request=request,
+            filter_functions=filter_functions,
+            filter_type="stream",
+            form_data=get_chunk(idx),
+            extra_params=extra_params,
+        )
+    per_chunk = time.perf_counter() - start
+
+    start = time.perf_counter()
+    pipeline = get_filter_pipeline(request, filter_functions, "stream", extra_params)
+    for idx in range(chunk_count):
+        await process_filter_pipeline(pipeline, "stream", get_chunk(idx))
+    compiled = time.perf_counter() - start
+
+    print(f"filters={filter_count} chunks={chunk_count}")
+    print(f"  per-chunk resolution: {per_chunk * 1e6 / chunk_count:8.2f} us/chunk")
+    print(f"  compiled pipeline:    {compiled * 1e6 / chunk_count:8.2f} us/chunk")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--filters", type=int, default=4)
+    parser.add_argument("--chunks", type=int, default=5000)
+    args = parser.parse_args()
+
+    asyncio.run(run(args.filters, args.chunks))
@@ -0,0 +1,43 @@
+from open_webui.utils.leaderboard import (
+    Comparison,
+    LeaderboardEngine,
+    compute_bradley_terry,
+)
+
+
+def get_comparison(id, model_id, opponent, outcome, tags=(), created_at=1):
+    return Comparison(
+        id=id,
+        model_id=model_id,
+        opponents=(opponent,),
+        outcome=outcome,
+        tags=frozenset(tags),
+        created_at=created_at,
+    )
+
+
+class TestBradleyTerry:
+    def test_no_comparisons(self):
+        assert compute_bradley_terry([]) == {}
+
+    def test_winner_is_rated_higher(self):
+        stats = compute_bradley_terry(
+            [
+                get_comparison("1", "a", "b", 1),
+                get_comparison("2", "a", "b", 1),
+                get_comparison("3", "b", "a", 1),
+            ]
+        )
+        assert stats["a"]["rating"] > stats["b"]["rating"]
+        assert (stats["a"]["won"], stats["a"]["lost"]) == (2, 1)
+
+    def test_empty_leaderboard(self):
+        engine = LeaderboardEngine(lambda: [], lambda: (0, None))
+        assert engine.get_leaderboard("bradley_terry") == []
+
+    def test_filter_without_matches(self):
+        engine = LeaderboardEngine(
+            lambda: [get_comparison("1", "a", "b", 1, tags=["code"])],
+            lambda: (1, 1),
+        )
+        assert engine.get_leaderboard("bradley_terry", tag="math") == []
@@ -36,15 +36,18 @@ from open_webui.routers.pipelines import (
     process_pipeline_outlet_filter,
 )
 
-from open_webui.models.functions import Functions
 from open_webui.models.models import Models
 
 
 from open_webui.utils.plugin import (
     load_function_module_by_id,
     get_function_module_from_cache,
+    get_function_from_cache,
+    apply_function_valves,
+    get_user_valves_from_cache,
 )
 from open_webui.utils.models import get_all_models, check_model_access
+from open_webui.utils.files import inline_file_images
 from open_webui.utils.payload import convert_payload_openai_to_ollama
 from open_webui.utils.response import (
     convert_response_ollama_to_openai,
@@ -191,6 +194,9 @@ async def generate_chat_completion(
 
     model = models[model_id]
 
+    # Images stored as files are only inlined for the upstream request
+    await asyncio.to_thread(inline_file_images, form_data.get("messages"), user)
+
     if getattr(request.state, "direct", False):
         return await generate_direct_chat_completion(
             request, form_data, user=user, models=models
@@ -328,7 +334,7 @@ async def chat_completed(request: Request, form_data: dict, user: Any):
 
     try:
         filter_functions = [
-            Functions.get_function_by_id(filter_id)
+            get_function_from_cache(request, filter_id)
             for filter_id in get_sorted_filter_ids(
                 request, model, metadata.get("filter_ids", [])
             )
@@ -352,7 +358,7 @@ async def chat_action(request: Request, action_id: str, form_data: dict, user: A
     else:
         sub_action_id = None
 
-    action = Functions.get_function_by_id(action_id)
+    action = get_function_from_cache(request, action_id)
     if not action:
         raise Exception(f"Action not found: {action_id}")
 
@@ -391,10 +397,7 @@ async def chat_action(request: Request, action_id: str, form_data: dict, user: A
     )
 
     function_module, _, _ = get_function_module_from_cache(request, action_id)
-
-    if hasattr(function_module, "valves") and hasattr(function_module, "Valves"):
-        valves = Functions.get_function_valves_by_id(action_id)
-        function_module.valves = function_module.Valves(**(valves if valves else {}))
+    apply_function_valves(request, action_id, function_module)
 
     if hasattr(function_module, "action"):
         try:
@@ -423,10 +426,8 @@ async def chat_action(request: Request, action_id: str, form_data: dict, user: A
 
                 try:
                     if hasattr(function_module, "UserValves"):
-                        __user__["valves"] = function_module.UserValves(
-                            **Functions.get_user_valves_by_id_and_user_id(
-                                action_id, user.id
-                            )
+                        __user__["valves"] = get_user_valves_from_cache(
+                            request, "functions", action_id, function_module, __user__
                         )
                 except Exception as e:
                     log.exception(f"Failed to get user values: {e}")
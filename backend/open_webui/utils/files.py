@@ -0,0 +1,257 @@
+import base64
+import hashlib
+import io
+import logging
+import mimetypes
+import re
+import uuid
+from typing import Optional
+
+from open_webui.models.chats import Chats
+from open_webui.models.files import FileForm, Files
+from open_webui.storage.provider import Storage
+from open_webui.env import SRC_LOG_LEVELS
+
+log = logging.getLogger(__name__)
+log.setLevel(SRC_LOG_LEVELS["MODELS"])
+
+
+IMAGE_DATA_URL_PATTERN = re.compile(r"^data:(image/[\w.+-]+);base64,(.*)$", re.DOTALL)
+FILE_CONTENT_URL_PATTERN = re.compile(r"/api/v1/files/([\w-]+)/content(?:[?#].*)?$")
+
+# Namespace of the deterministic file ids given to images moved out of chats
+CHAT_IMAGE_NAMESPACE = uuid.UUID("634e9587-6b95-4878-85c4-2e0e98ed9b06")
+
+
+def get_file_content_url(file_id: str) -> str:
+    return f"/api/v1/files/{file_id}/content"
+
+
+def store_chat_image(data: bytes, content_type: str, user_id: str) -> str:
+    """
+    Stores an image of a chat message as a file owned by `user_id` and returns
+    its content URL.
+
+    Files are content-addressed: the id is derived from the owner and the
+    SHA-256 of the image, so the same image is only stored once per user and
+    the usual owner-based file access checks keep working.
+    """
+    sha256 = hashlib.sha256(data).hexdigest()
+    file_id = str(uuid.uuid5(CHAT_IMAGE_NAMESPACE, f"{user_id}:{sha256}"))
+
+    if Files.get_file_by_id(file_id) is None:
+        name = f"image{mimetypes.guess_extension(content_type) or ''}"
+        _, file_path = Storage.upload_file_stream(
+            io.BytesIO(data),
+            f"{file_id}_{name}",
+            {"OpenWebUI-User-Id": user_id, "OpenWebUI-File-Id": file_id},
+        )
+        Files.insert_new_file(
+            user_id,
+            FileForm(
+                id=file_id,
+                hash=sha256,
+                filename=name,
+                path=file_path,
+                meta={
+                    "name": name,
+                    "content_type": content_type,
+                    "size": len(data),
+                    "sha256": sha256,
+                    "source": "chat",
+                },
+            ),
+        )
+
+    return get_file_content_url(file_id)
+
+
+def store_image_data_url(data_url: str, user_id: str) -> Optional[str]:
+    """Stores a base64 image data URL as a file and returns its content URL."""
+    match = IMAGE_DATA_URL_PATTERN.match(data_url)
+    if not match:
+        return None
+
+    content_type, encoded = match.groups()
+    try:
+        data = base64.b64decode(encoded)
+    except Exception as e:
+        log.warning(f"Skipping invalid inline image: {e}")
+        return None
+
+    return store_chat_image(data, content_type, user_id)
+
+
+def is_shared_chat_image(file) -> bool:
+    # Images of a shared chat can be read by everyone who can open the share link
+    meta = file.meta or {}
+    return meta.get("source") == "chat" and Chats.has_shared_chat(
+        meta.get("shared_chat_ids") or [], file.user_id
+    )
+
+
+def get_chat_image_file_ids(chat: Optional[dict]) -> set[str]:
+    file_ids = set()
+    for file in get_chat_message_files(chat or {}):
+        url = file.get("url")
+        match = FILE_CONTENT_URL_PATTERN.search(url) if isinstance(url, str) else None
+        if match:
+            file_ids.add(match.group(1))
+    return file_ids
+
+
+def update_shared_chat_images(
+    chat_id: str, chat: Optional[dict], previous_chat: Optional[dict] = None
+):
+    """
+    Records on the chat images in the shared snapshot `chat` of chat `chat_id`
+    that they are shared through it, and removes that mark from the images
+    only `previous_chat` (the snapshot being replaced) referenced. Pass
+    `chat=None` when the chat is unshared.
+
+    `is_shared_chat_image` then only has to look up these chat ids.
+    """
+    file_ids = get_chat_image_file_ids(chat)
+    previous_file_ids = get_chat_image_file_ids(previous_chat)
+
+    for file_id in file_ids | previous_file_ids:
+        file = Files.get_file_by_id(file_id)
+        if file is None or (file.meta or {}).get("source") != "chat":
+            continue
+
+        chat_ids = set(file.meta.get("shared_chat_ids") or [])
+        if file_id in file_ids:
+            updated_chat_ids = chat_ids | {chat_id}
+        else:
+            updated_chat_ids = chat_ids - {chat_id}
+
+        if updated_chat_ids != chat_ids:
+            Files.update_file_metadata_by_id(
+                file_id, {"shared_chat_ids": sorted(updated_chat_ids)}
+            )
+
+
+def get_chat_message_files(chat: dict) -> list[dict]:
+    return [
+        file
+        for message in [
+            *((chat.get("history") or {}).get("messages") or {}).values(),
+            *(chat.get("messages") or []),
+        ]
+        if isinstance(message, dict)
+        for file in message.get("files") or []
+        if isinstance(file, dict)
+    ]
+
+
+def copy_chat_images(chat: dict, user_id: str) -> int:
+    """
+    Gives `user_id` its own copy of the chat images of other users referenced
+    by `chat`, in place, e.g. when cloning a shared chat. Returns the number
+    of references replaced.
+    """
+    urls = {}
+    count = 0
+    for file in get_chat_message_files(chat):
+        url = file.get("url")
+        match = FILE_CONTENT_URL_PATTERN.search(url) if isinstance(url, str) else None
+        if not match:
+            continue
+
+        if url not in urls:
+            urls[url] = None
+            image = Files.get_file_by_id(match.group(1))
+            if (
+                image is not None
+                and image.user_id != user_id
+                and (image.meta or {}).get("source") == "chat"
+            ):
+                try:
+                    with open(Storage.get_file(image.path), "rb") as f:
+                        urls[url] = store_chat_image(
+                            f.read(),
+                            (image.meta or {}).get("content_type") or "image/png",
+                            user_id,
+                        )
+                except Exception as e:
+                    log.warning(f"Failed to copy chat image {image.id}: {e}")
+
+        if urls[url]:
+            file["url"] = urls[url]
+            count += 1
+
+    return count
+
+
+def externalize_chat_images(chat: dict, user_id: str) -> int:
+    """
+    Replaces the inline base64 images attached to the messages of `chat` with
+    file references, in place. Returns the number of images replaced.
+    """
+    # The same image usually appears both in history and in the message list
+    urls = {}
+    count = 0
+    for file in get_chat_message_files(chat):
+        url = file.get("url")
+        if not isinstance(url, str) or not url.startswith("data:image"):
+            continue
+
+        if url not in urls:
+            urls[url] = store_image_data_url(url, user_id)
+        if urls[url]:
+            file["url"] = urls[url]
+            count += 1
+
+    return count
+
+
+def get_file_data_url(file_id: str, user) -> Optional[str]:
+    file = Files.get_file_by_id(file_id)
+    if file is None:
+        return None
+
+    if not (
+        file.user_id == user.id or user.role == "admin" or is_shared_chat_image(file)
+    ):
+        return None
+
+    try:
+        with open(Storage.get_file(file.path), "rb") as f:
+            data = f.read()
+    except Exception as e:
+        log.warning(f"Failed to load image file {file_id}: {e}")
+        return None
+
+    content_type = (file.meta or {}).get("content_type") or "image/png"
+    return f"data:{content_type};base64,{base64.b64encode(data).decode()}"
+
+
+def inline_file_images(messages: Optional[list[dict]], user) -> Optional[list[dict]]:
+    """
+    Replaces image_url parts that point at stored files with base64 data URLs,
+    in place, so upstream providers receive the image itself.
+    """
+    data_urls = {}
+    for message in messages or []:
+        content = message.get("content")
+        if not isinstance(content, list):
+            continue
+
+        for item in content:
+            if not isinstance(item, dict) or item.get("type") != "image_url":
+                continue
+
+            url = (item.get("image_url") or {}).get("url")
+            if not isinstance(url, str) or url.startswith("data:"):
+                continue
+
+            match = FILE_CONTENT_URL_PATTERN.search(url)
+            if not match:
+                continue
+
+            if url not in data_urls:
+                data_urls[url] = get_file_data_url(match.group(1), user)
+            if data_urls[url]:
+                item["image_url"] = {**item["image_url"], "url": data_urls[url]}
+
+    return messages
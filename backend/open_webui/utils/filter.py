@@ -4,8 +4,10 @@ import logging
 from open_webui.utils.plugin import (
     load_function_module_by_id,
     get_function_module_from_cache,
+    get_functions_from_cache,
+    apply_function_valves,
+    get_user_valves_from_cache,
 )
-from open_webui.models.functions import Functions
 from open_webui.env import SRC_LOG_LEVELS
 
 log = logging.getLogger(__name__)
@@ -23,20 +25,27 @@ def get_function_module(request, function_id, load_from_db=True):
 
 
 def get_sorted_filter_ids(request, model: dict, enabled_filter_ids: list = None):
+    functions = get_functions_from_cache(request)
+
     def get_priority(function_id):
-        function = Functions.get_function_by_id(function_id)
+        function = functions.get(function_id)
         if function is not None:
-            valves = Functions.get_function_valves_by_id(function_id)
+            valves = function.valves
             return valves.get("priority", 0) if valves else 0
         return 0
 
-    filter_ids = [function.id for function in Functions.get_global_filter_functions()]
+    filter_ids = [
+        function.id
+        for function in functions.values()
+        if function.type == "filter" and function.is_active and function.is_global
+    ]
     if "info" in model and "meta" in model["info"]:
         filter_ids.extend(model["info"]["meta"].get("filterIds", []))
         filter_ids = list(set(filter_ids))
     active_filter_ids = [
         function.id
-        for function in Functions.get_functions_by_type("filter", active_only=True)
+        for function in functions.values()
+        if function.type == "filter" and function.is_active
     ]
 
     def get_active_status(filter_id):
@@ -57,16 +66,20 @@ def get_sorted_filter_ids(request, model: dict, enabled_filter_ids: list = None)
     return filter_ids
 
 
-async def process_filter_functions(
-    request, filter_functions, filter_type, form_data, extra_params
-):
-    skip_files = None
+def get_filter_pipeline(request, filter_functions, filter_type, extra_params):
+    """
+    Resolve the `filter_type` handlers of the given filters once.
+
+    Filters without the hook are skipped, and each handler gets its valves and
+    signature-matched extra parameters bound up front, so running the pipeline
+    (e.g. for every streamed chunk) only costs the handler calls.
+    """
+    pipeline = []
 
     for function in filter_functions:
-        filter = function
-        filter_id = function.id
-        if not filter:
+        if not function:
             continue
+        filter_id = function.id
 
         function_module = get_function_module(
             request, filter_id, load_from_db=(filter_type != "stream")
@@ -76,57 +89,80 @@ async def process_filter_functions(
         if not handler:
             continue
 
-        # Check if the function has a file_handler variable
-        if filter_type == "inlet" and hasattr(function_module, "file_handler"):
-            skip_files = function_module.file_handler
-
         # Apply valves to the function
-        if hasattr(function_module, "valves") and hasattr(function_module, "Valves"):
-            valves = Functions.get_function_valves_by_id(filter_id)
-            function_module.valves = function_module.Valves(
-                **(valves if valves else {})
-            )
-
-        try:
-            # Prepare parameters
-            sig = inspect.signature(handler)
-
-            params = {"body": form_data}
-            if filter_type == "stream":
-                params = {"event": form_data}
-
-            params = params | {
-                k: v
-                for k, v in {
-                    **extra_params,
-                    "__id__": filter_id,
-                }.items()
-                if k in sig.parameters
+        apply_function_valves(request, filter_id, function_module)
+
+        # Prepare parameters
+        sig = inspect.signature(handler)
+        params = {
+            k: v
+            for k, v in {
+                **extra_params,
+                "__id__": filter_id,
+            }.items()
+            if k in sig.parameters
+        }
+
+        # Handle user parameters
+        if "__user__" in params and hasattr(function_module, "UserValves"):
+            try:
+                params["__user__"] = {
+                    **params["__user__"],
+                    "valves": get_user_valves_from_cache(
+                        request,
+                        "functions",
+                        filter_id,
+                        function_module,
+                        params["__user__"],
+                    ),
+                }
+            except Exception as e:
+                log.exception(f"Failed to get user values: {e}")
+
+        pipeline.append(
+            {
+                "id": filter_id,
+                "handler": handler,
+                "is_coroutine": inspect.iscoroutinefunction(handler),
+                "params": params,
+                # Check if the function has a file_handler variable
+                "file_handler": getattr(function_module, "file_handler", None),
             }
+        )
+
+    return pipeline
+
 
-            # Handle user parameters
-            if "__user__" in sig.parameters:
-                if hasattr(function_module, "UserValves"):
-                    try:
-                        params["__user__"]["valves"] = function_module.UserValves(
-                            **Functions.get_user_valves_by_id_and_user_id(
-                                filter_id, params["__user__"]["id"]
-                            )
-                        )
-                    except Exception as e:
-                        log.exception(f"Failed to get user values: {e}")
+async def process_filter_pipeline(pipeline, filter_type, form_data):
+    key = "event" if filter_type == "stream" else "body"
 
+    for item in pipeline:
+        try:
             # Execute handler
-            if inspect.iscoroutinefunction(handler):
-                form_data = await handler(**params)
+            if item["is_coroutine"]:
+                form_data = await item["handler"](**{key: form_data}, **item["params"])
             else:
-                form_data = handler(**params)
-
+                form_data = item["handler"](**{key: form_data}, **item["params"])
         except Exception as e:
-            log.debug(f"Error in {filter_type} handler {filter_id}: {e}")
+            log.debug(f"Error in {filter_type} handler {item['id']}: {e}")
             raise e
 
+    return form_data
+
+
+async def process_filter_functions(
+    request, filter_functions, filter_type, form_data, extra_params
+):
+    pipeline = get_filter_pipeline(request, filter_functions, filter_type, extra_params)
+    form_data = await process_filter_pipeline(pipeline, filter_type, form_data)
+
     # Handle file cleanup for inlet
+    skip_files = None
+    if filter_type == "inlet":
+        for item in pipeline:
+            if item["file_handler"] is not None:
+                skip_files = item["file_handler"]
+
     if skip_files and "files" in form_data.get("metadata", {}):
         del form_data["files"]
         del form_data["metadata"]["files"]
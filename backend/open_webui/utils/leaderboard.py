@@ -0,0 +1,324 @@
+import logging
+import math
+import time
+from collections import defaultdict
+from typing import Callable, Iterable, Optional
+
+from open_webui.env import SRC_LOG_LEVELS
+
+log = logging.getLogger(__name__)
+log.setLevel(SRC_LOG_LEVELS["MODELS"])
+
+
+ELO_K = 32
+ELO_INITIAL_RATING = 1000
+
+# Seconds a time-window view is reused before its window is moved forward
+LEADERBOARD_WINDOW_VIEW_TTL = 60
+
+
+class Comparison:
+    """The parts of a rating feedback the leaderboard needs."""
+
+    __slots__ = ("id", "model_id", "opponents", "outcome", "tags", "created_at")
+
+    def __init__(self, id, model_id, opponents, outcome, tags, created_at):
+        self.id = id
+        self.model_id = model_id
+        self.opponents = opponents
+        self.outcome = outcome
+        self.tags = tags
+        self.created_at = created_at
+
+
+def get_feedback_comparison(
+    id: str, data: Optional[dict], meta: Optional[dict], created_at: int
+) -> Optional[Comparison]:
+    data = data or {}
+    model_id = data.get("model_id")
+    rating = str(data.get("rating", ""))
+    if not model_id or rating not in ("1", "-1"):
+        return None
+
+    return Comparison(
+        id=id,
+        model_id=model_id,
+        opponents=tuple(data.get("sibling_model_ids") or ()),
+        outcome=1 if rating == "1" else 0,
+        tags=frozenset((meta or {}).get("tags") or ()),
+        created_at=created_at or 0,
+    )
+
+
+class EloRatings:
+    """Elo ratings (K=32, starting at 1000) updated one comparison at a time."""
+
+    def __init__(self):
+        self.stats: dict[str, dict] = {}
+
+    def get(self, model_id: str) -> dict:
+        stats = self.stats.get(model_id)
+        if stats is None:
+            stats = {"rating": float(ELO_INITIAL_RATING), "won": 0, "lost": 0}
+            self.stats[model_id] = stats
+        return stats
+
+    def apply(self, comparison: Comparison):
+        stats_a = self.get(comparison.model_id)
+        for opponent in comparison.opponents:
+            stats_b = self.get(opponent)
+            expected_a = 1 / (1 + 10 ** ((stats_b["rating"] - stats_a["rating"]) / 400))
+            change = ELO_K * (comparison.outcome - expected_a)
+
+            stats_a["rating"] += change
+            stats_b["rating"] -= change
+            winner, loser = (
+                (stats_a, stats_b) if comparison.outcome == 1 else (stats_b, stats_a)
+            )
+            winner["won"] += 1
+            loser["lost"] += 1
+
+
+def compute_elo(comparisons: Iterable[Comparison]) -> dict[str, dict]:
+    elo = EloRatings()
+    for comparison in comparisons:
+        elo.apply(comparison)
+    return elo.stats
+
+
+def compute_bradley_terry(
+    comparisons: Iterable[Comparison], iterations: int = 200, tolerance: float = 1e-6
+) -> dict[str, dict]:
+    """
+    Order-independent Bradley-Terry ratings on the Elo scale, fitted with the
+    MM algorithm. Every model also gets one win and one loss against a
+    reference player of strength 1, so unbeaten or winless models stay finite.
+    """
+    wins = defaultdict(int)
+    games = defaultdict(lambda: defaultdict(int))
+    stats = {}
+
+    for comparison in comparisons:
+        for opponent in comparison.opponents:
+            winner, loser = (
+                (comparison.model_id, opponent)
+                if comparison.outcome == 1
+                else (opponent, comparison.model_id)
+            )
+            wins[winner] += 1
+            games[winner][loser] += 1
+            games[loser][winner] += 1
+            stats.setdefault(winner, {"won": 0, "lost": 0})["won"] += 1
+            stats.setdefault(loser, {"won": 0, "lost": 0})["lost"] += 1
+
+    if not stats:
+        return {}
+
+    strengths = {model_id: 1.0 for model_id in stats}
+    for _ in range(iterations):
+        updated = {}
+        for model_id, strength in strengths.items():
+            denominator = 2 / (strength + 1) + sum(
+                count / (strength + strengths[opponent])
+                for opponent, count in games[model_id].items()
+            )
+            updated[model_id] = (wins[model_id] + 1) / denominator
+
+        # Normalize to a geometric mean of 1
+        scale = math.exp(
+            sum(math.log(strength) for strength in updated.values()) / len(updated)
+        )
+        updated = {model_id: strength / scale for model_id, strength in updated.items()}
+
+        converged = all(
+            abs(updated[model_id] - strengths[model_id]) < tolerance
+            for model_id in strengths
+        )
+        strengths = updated
+        if converged:
+            break
+
+    return {
+        model_id: {
+            "rating": ELO_INITIAL_RATING + 400 * math.log10(strengths[model_id]),
+            **model_stats,
+        }
+        for model_id, model_stats in stats.items()
+    }
+
+
+LEADERBOARD_METHODS = {
+    "elo": compute_elo,
+    "bradley_terry": compute_bradley_terry,
+}
+
+
+class LeaderboardEngine:
+    """
+    Keeps model ratings up to date as rating feedback changes, so the
+    leaderboard is served precomputed instead of replayed over every
+    feedback on each page load.
+
+    The engine holds one compact `Comparison` per rating feedback, loaded
+    once. Inserts are applied incrementally to the running Elo ratings.
+    Updates, deletes and feedback older than the last applied comparison mark
+    them for a replay, which only walks the compact comparisons. Per-tag,
+    per-time-window and Bradley-Terry views are computed on demand and cached
+    until the feedback changes.
+
+    `get_signature` returns a cheap (count, last update) summary of the
+    feedback table, so changes made by other workers trigger a reload.
+    """
+
+    def __init__(
+        self,
+        load_comparisons: Callable[[], Iterable[Comparison]],
+        get_signature: Callable[[], tuple],
+    ):
+        self.load_comparisons = load_comparisons
+        self.get_signature = get_signature
+
+        self._comparisons: Optional[dict[str, Comparison]] = None
+        self._signature = None
+        self._elo: Optional[EloRatings] = None
+        self._last_created_at = 0
+        self._views: dict[tuple, tuple[float, list[dict]]] = {}
+
+        self.version = 0
+        self.reloads = 0
+        self.replays = 0
+
+    def _changed(self):
+        self.version += 1
+        self._views.clear()
+
+    def _sync(self):
+        signature = self.get_signature()
+        if self._comparisons is not None and signature == self._signature:
+            return
+
+        comparisons = sorted(
+            self.load_comparisons(), key=lambda comparison: comparison.created_at
+        )
+        self._comparisons = {comparison.id: comparison for comparison in comparisons}
+        self._signature = signature
+        self._elo = None
+        self.reloads += 1
+        self._changed()
+
+    def _ordered(self) -> list[Comparison]:
+        return sorted(
+            self._comparisons.values(), key=lambda comparison: comparison.created_at
+        )
+
+    def _get_elo(self) -> dict[str, dict]:
+        if self._elo is None:
+            self._elo = EloRatings()
+            for comparison in self._ordered():
+                self._elo.apply(comparison)
+            self._last_created_at = max(
+                (c.created_at for c in self._comparisons.values()), default=0
+            )
+            self.replays += 1
+        return self._elo.stats
+
+    def add(self, comparison: Optional[Comparison], updated_at: int):
+        if self._comparisons is None:
+            return
+
+        if comparison is not None:
+            self._comparisons[comparison.id] = comparison
+            if self._elo is not None and comparison.created_at >= self._last_created_at:
+                self._elo.apply(comparison)
+                self._last_created_at = comparison.created_at
+            else:
+                self._elo = None
+
+        count, last_updated_at = self._signature
+        self._signature = (count + 1, max(last_updated_at or 0, updated_at))
+        self._changed()
+
+    def update(self, id: str, comparison: Optional[Comparison], updated_at: int):
+        if self._comparisons is None:
+            return
+
+        self._comparisons.pop(id, None)
+        if comparison is not None:
+            self._comparisons[id] = comparison
+        self._elo = None
+
+        count, last_updated_at = self._signature
+        self._signature = (count, max(last_updated_at or 0, updated_at))
+        self._changed()
+
+    def remove(self, id: str):
+        if self._comparisons is None:
+            return
+
+        if self._comparisons.pop(id, None) is not None:
+            self._elo = None
+
+        count, last_updated_at = self._signature
+        self._signature = (count - 1, last_updated_at)
+        self._changed()
+
+    def reset(self):
+        """Drops everything, the next read reloads the feedback."""
+        self._comparisons = None
+        self._signature = None
+        self._elo = None
+        self._changed()
+
+    def get_leaderboard(
+        self,
+        method: str = "elo",
+        tag: Optional[str] = None,
+        window: Optional[int] = None,
+    ) -> list[dict]:
+        self._sync()
+
+        key = (method, tag, window)
+        cached = self._views.get(key)
+        if cached is not None and (
+            window is None or time.time() - cached[0] < LEADERBOARD_WINDOW_VIEW_TTL
+        ):
+            return cached[1]
+
+        if method == "elo" and tag is None and window is None:
+            stats = self._get_elo()
+        else:
+            since = time.time() - window if window else None
+            stats = LEADERBOARD_METHODS[method](
+                comparison
+                for comparison in self._ordered()
+                if (tag is None or tag in comparison.tags)
+                and (since is None or comparison.created_at >= since)
+            )
+
+        entries = sorted(
+            (
+                {
+                    "model_id": model_id,
+                    "rating": round(model_stats["rating"]),
+                    "won": model_stats["won"],
+                    "lost": model_stats["lost"],
+                    "count": model_stats["won"] + model_stats["lost"],
+                }
+                for model_id, model_stats in stats.items()
+            ),
+            key=lambda entry: (-entry["rating"], entry["model_id"]),
+        )
+        for rank, entry in enumerate(entries, start=1):
+            entry["rank"] = rank
+
+        self._views[key] = (time.time(), entries)
+        return entries
+
+    def stats(self) -> dict:
+        return {
+            "comparisons": len(self._comparisons or {}),
+            "version": self.version,
+            "reloads": self.reloads,
+            "replays": self.replays,
+            "views": len(self._views),
+        }
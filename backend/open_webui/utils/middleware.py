@@ -15,7 +15,6 @@ import re
 import ast
 
 from uuid import uuid4
-from concurrent.futures import ThreadPoolExecutor
 
 
 from fastapi import Request, HTTPException
@@ -36,6 +35,7 @@ from open_webui.routers.tasks import (
     generate_follow_ups,
     generate_image_prompt,
     generate_chat_tags,
+    generate_chat_tasks,
 )
 from open_webui.routers.retrieval import process_web_search, SearchForm
 from open_webui.routers.images import (
@@ -54,10 +54,19 @@ from open_webui.utils.webhook import post_webhook
 
 
 from open_webui.models.users import UserModel
-from open_webui.models.functions import Functions
 from open_webui.models.models import Models
 
-from open_webui.retrieval.utils import get_sources_from_items
+from open_webui.retrieval.utils import (
+    EmbeddingMemo,
+    get_request_embedding_function,
+    get_sources_from_items,
+    merge_sources,
+)
+from open_webui.retrieval.executor import (
+    RETRIEVAL_EXECUTOR,
+    RetrievalExecutorBusyError,
+)
+from open_webui.utils.stages import StageScheduler
 
 
 from open_webui.utils.chat import generate_chat_completion
@@ -75,12 +84,18 @@ from open_webui.utils.misc import (
     get_last_assistant_message,
     prepend_to_first_user_message_content,
     convert_logit_bias_input_to_json,
+    json_loads,
 )
 from open_webui.utils.tools import get_tools
-from open_webui.utils.plugin import load_function_module_by_id
+from open_webui.utils.plugin import (
+    load_function_module_by_id,
+    get_function_from_cache,
+)
 from open_webui.utils.filter import (
     get_sorted_filter_ids,
+    get_filter_pipeline,
     process_filter_functions,
+    process_filter_pipeline,
 )
 from open_webui.utils.code_interpreter import execute_code_jupyter
 from open_webui.utils.payload import apply_model_system_prompt_to_body
@@ -96,6 +111,12 @@ from open_webui.env import (
     SRC_LOG_LEVELS,
     GLOBAL_LOG_LEVEL,
     CHAT_RESPONSE_STREAM_DELTA_CHUNK_SIZE,
+    CHAT_PAYLOAD_STAGE_TIMEOUTS,
+    ENABLE_SPECULATIVE_RETRIEVAL,
+    SPECULATIVE_RETRIEVAL_QUERY_BUDGET,
+    CHAT_BACKGROUND_TASKS_TIMEOUT,
+    ENABLE_CONCURRENT_TOOL_CALLS,
+    ENABLE_COMBINED_CHAT_TASKS_GENERATION,
     BYPASS_MODEL_ACCESS_CONTROL,
     ENABLE_REALTIME_CHAT_SAVE,
 )
@@ -107,6 +128,13 @@ log = logging.getLogger(__name__)
 log.setLevel(SRC_LOG_LEVELS["MAIN"])
 
 
+async def execute_tool_calls(handler, tool_calls: list) -> list:
+    # The tool calls of a single model turn do not depend on each other
+    if ENABLE_CONCURRENT_TOOL_CALLS and len(tool_calls) > 1:
+        return await asyncio.gather(*[handler(tool_call) for tool_call in tool_calls])
+    return [await handler(tool_call) for tool_call in tool_calls]
+
+
 async def chat_completion_tools_handler(
     request: Request, body: dict, extra_params: dict, user: UserModel, models, tools
 ) -> tuple[dict, dict]:
@@ -155,6 +183,7 @@ async def chat_completion_tools_handler(
 
     skip_files = False
     sources = []
+    tool_outputs = []
 
     specs = [tool["spec"] for tool in tools.values()]
     tools_specs = json.dumps(specs)
@@ -187,14 +216,12 @@ async def chat_completion_tools_handler(
 
             result = json.loads(content)
 
-            async def tool_call_handler(tool_call):
-                nonlocal skip_files
-
+            async def execute_tool_call(tool_call):
                 log.debug(f"{tool_call=}")
 
                 tool_function_name = tool_call.get("name", None)
                 if tool_function_name not in tools:
-                    return body, {}
+                    return None
 
                 tool_function_params = tool_call.get("parameters", {})
 
@@ -231,6 +258,13 @@ async def chat_completion_tools_handler(
                 except Exception as e:
                     tool_result = str(e)
 
+                return tool_function_name, tool_function_params, tool_result
+
+            def apply_tool_call_result(
+                tool_function_name, tool_function_params, tool_result
+            ):
+                nonlocal skip_files
+
                 tool_result_files = []
                 if isinstance(tool_result, list):
                     for item in tool_result:
@@ -269,10 +303,7 @@ async def chat_completion_tools_handler(
                         }
                     )
                     # Citation is not enabled for this tool
-                    body["messages"] = add_or_update_user_message(
-                        f"\nTool `{tool_name}` Output: {tool_result}",
-                        body["messages"],
-                    )
+                    tool_outputs.append(f"\nTool `{tool_name}` Output: {tool_result}")
 
                     if (
                         tools[tool_function_name]
@@ -282,11 +313,14 @@ async def chat_completion_tools_handler(
                         skip_files = True
 
             # check if "tool_calls" in result
-            if result.get("tool_calls"):
-                for tool_call in result.get("tool_calls"):
-                    await tool_call_handler(tool_call)
-            else:
-                await tool_call_handler(result)
+            tool_calls = result.get("tool_calls") or [result]
+
+            # Results are applied in call order so the prompt stays deterministic
+            for tool_call_result in await execute_tool_calls(
+                execute_tool_call, tool_calls
+            ):
+                if tool_call_result:
+                    apply_tool_call_result(*tool_call_result)
 
         except Exception as e:
             log.debug(f"Error: {e}")
@@ -300,12 +334,46 @@ async def chat_completion_tools_handler(
     if skip_files and "files" in body.get("metadata", {}):
         del body["metadata"]["files"]
 
-    return body, {"sources": sources}
+    # The outputs are added to the last user message by the caller
+    return body, {"sources": sources, "tool_outputs": tool_outputs}
+
+
+def parse_generated_queries(content: str) -> list[str]:
+    try:
+        bracket_start = content.find("{")
+        bracket_end = content.rfind("}") + 1
+
+        if bracket_start == -1 or bracket_end == -1:
+            raise Exception("No JSON object found in the response")
+
+        return json.loads(content[bracket_start:bracket_end]).get("queries", [])
+    except Exception:
+        return [content]
+
+
+async def generate_chat_queries(
+    request: Request, form_data: dict, user, type: str
+) -> list[str]:
+    """
+    Generate search queries for `type` ("web_search" or "retrieval") with the
+    task model. Raises when query generation is disabled or fails.
+    """
+    res = await generate_queries(
+        request,
+        {
+            "model": form_data["model"],
+            "messages": form_data["messages"],
+            "prompt": get_last_user_message(form_data["messages"]),
+            "type": type,
+        },
+        user,
+    )
+    return parse_generated_queries(res["choices"][0]["message"]["content"])
 
 
 async def chat_memory_handler(
     request: Request, form_data: dict, extra_params: dict, user
-):
+) -> str:
     try:
         results = await query_memory(
             request,
@@ -335,15 +403,16 @@ async def chat_memory_handler(
 
                 user_context += f"{doc_idx + 1}. [{created_at_date}] {doc}\n"
 
-    form_data["messages"] = add_or_update_system_message(
-        f"User Context:\n{user_context}\n", form_data["messages"], append=True
-    )
-
-    return form_data
+    # Appended to the system message by the caller
+    return f"User Context:\n{user_context}\n"
 
 
 async def chat_web_search_handler(
-    request: Request, form_data: dict, extra_params: dict, user
+    request: Request,
+    form_data: dict,
+    extra_params: dict,
+    user,
+    queries: Optional[list[str]] = None,
 ):
     event_emitter = extra_params["__event_emitter__"]
     await event_emitter(
@@ -360,37 +429,14 @@ async def chat_web_search_handler(
     messages = form_data["messages"]
     user_message = get_last_user_message(messages)
 
-    queries = []
-    try:
-        res = await generate_queries(
-            request,
-            {
-                "model": form_data["model"],
-                "messages": messages,
-                "prompt": user_message,
-                "type": "web_search",
-            },
-            user,
-        )
-
-        response = res["choices"][0]["message"]["content"]
-
+    if queries is None:
         try:
-            bracket_start = response.find("{")
-            bracket_end = response.rfind("}") + 1
-
-            if bracket_start == -1 or bracket_end == -1:
-                raise Exception("No JSON object found in the response")
-
-            response = response[bracket_start:bracket_end]
-            queries = json.loads(response)
-            queries = queries.get("queries", [])
+            queries = await generate_chat_queries(
+                request, form_data, user, "web_search"
+            )
         except Exception as e:
-            queries = [response]
-
-    except Exception as e:
-        log.exception(e)
-        queries = [user_message]
+            log.exception(e)
+            queries = [user_message]
 
     # Check if generated queries are empty
     if len(queries) == 1 and queries[0].strip() == "":
@@ -503,7 +549,7 @@ async def chat_web_search_handler(
 
 async def chat_image_generation_handler(
     request: Request, form_data: dict, extra_params: dict, user
-):
+) -> str:
     __event_emitter__ = extra_params["__event_emitter__"]
     await __event_emitter__(
         {
@@ -594,83 +640,61 @@ async def chat_image_generation_handler(
 
         system_message_content = "<context>Unable to generate an image, tell the user that an error occurred</context>"
 
-    if system_message_content:
-        form_data["messages"] = add_or_update_system_message(
-            system_message_content, form_data["messages"]
-        )
-
-    return form_data
+    # Added to the system message by the caller
+    return system_message_content
 
 
 async def chat_completion_files_handler(
-    request: Request, body: dict, user: UserModel
+    request: Request,
+    body: dict,
+    user: UserModel,
+    queries: Optional[list[str]] = None,
+    files: Optional[list[dict]] = None,
 ) -> tuple[dict, dict[str, list]]:
     sources = []
 
-    if files := body.get("metadata", {}).get("files", None):
-        queries = []
-        try:
-            queries_response = await generate_queries(
-                request,
-                {
-                    "model": body["model"],
-                    "messages": body["messages"],
-                    "type": "retrieval",
-                },
-                user,
-            )
-            queries_response = queries_response["choices"][0]["message"]["content"]
+    if files is None:
+        files = body.get("metadata", {}).get("files", None)
 
+    if files:
+        if queries is None:
             try:
-                bracket_start = queries_response.find("{")
-                bracket_end = queries_response.rfind("}") + 1
-
-                if bracket_start == -1 or bracket_end == -1:
-                    raise Exception("No JSON object found in the response")
-
-                queries_response = queries_response[bracket_start:bracket_end]
-                queries_response = json.loads(queries_response)
-            except Exception as e:
-                queries_response = {"queries": [queries_response]}
-
-            queries = queries_response.get("queries", [])
-        except:
-            pass
+                queries = await generate_chat_queries(request, body, user, "retrieval")
+            except:
+                queries = []
 
         if len(queries) == 0:
             queries = [get_last_user_message(body["messages"])]
 
         try:
-            # Offload get_sources_from_items to a separate thread
-            loop = asyncio.get_running_loop()
-            with ThreadPoolExecutor() as executor:
-                sources = await loop.run_in_executor(
-                    executor,
-                    lambda: get_sources_from_items(
-                        request=request,
-                        items=files,
-                        queries=queries,
-                        embedding_function=lambda query, prefix: request.app.state.EMBEDDING_FUNCTION(
-                            query, prefix=prefix, user=user
-                        ),
-                        k=request.app.state.config.TOP_K,
-                        reranking_function=(
-                            (
-                                lambda sentences: request.app.state.RERANKING_FUNCTION(
-                                    sentences, user=user
-                                )
+            # Run get_sources_from_items on the shared retrieval executor
+            sources = await RETRIEVAL_EXECUTOR.run(
+                user.id,
+                lambda: get_sources_from_items(
+                    request=request,
+                    items=files,
+                    queries=queries,
+                    embedding_function=get_request_embedding_function(request, user),
+                    k=request.app.state.config.TOP_K,
+                    reranking_function=(
+                        (
+                            lambda sentences: request.app.state.RERANKING_FUNCTION(
+                                sentences, user=user
                             )
-                            if request.app.state.RERANKING_FUNCTION
-                            else None
-                        ),
-                        k_reranker=request.app.state.config.TOP_K_RERANKER,
-                        r=request.app.state.config.RELEVANCE_THRESHOLD,
-                        hybrid_bm25_weight=request.app.state.config.HYBRID_BM25_WEIGHT,
-                        hybrid_search=request.app.state.config.ENABLE_RAG_HYBRID_SEARCH,
-                        full_context=request.app.state.config.RAG_FULL_CONTEXT,
-                        user=user,
+                        )
+                        if request.app.state.RERANKING_FUNCTION
+                        else None
                     ),
-                )
+                    k_reranker=request.app.state.config.TOP_K_RERANKER,
+                    r=request.app.state.config.RELEVANCE_THRESHOLD,
+                    hybrid_bm25_weight=request.app.state.config.HYBRID_BM25_WEIGHT,
+                    hybrid_search=request.app.state.config.ENABLE_RAG_HYBRID_SEARCH,
+                    full_context=request.app.state.config.RAG_FULL_CONTEXT,
+                    user=user,
+                ),
+            )
+        except RetrievalExecutorBusyError:
+            raise
         except Exception as e:
             log.exception(e)
 
@@ -729,9 +753,9 @@ def apply_params_to_form_data(form_data, model):
 
 
 async def process_chat_payload(request, form_data, user, metadata, model):
-    # Pipeline Inlet -> Filter Inlet -> Chat Memory -> Chat Web Search -> Chat Image Generation
-    # -> Chat Code Interpreter (Form Data Update) -> (Default) Chat Tools Function Calling
-    # -> Chat Files
+    # Pipeline Inlet -> Filter Inlet -> Chat Code Interpreter (Form Data Update)
+    # -> [Chat Memory -> (Default) Chat Tools Function Calling | Chat Query Generation
+    # -> Chat Web Search | Chat Image Generation] -> Chat Files
 
     form_data = apply_params_to_form_data(form_data, model)
     log.debug(f"form_data: {form_data}")
@@ -767,6 +791,11 @@ async def process_chat_payload(request, form_data, user, metadata, model):
     events = []
     sources = []
 
+    # Shared by every retrieval stage below, so the user message is embedded once
+    request.state.embedding_memo = EmbeddingMemo(
+        request.app.state.EMBEDDING_FUNCTION, user=user
+    )
+
     # Folder "Project" handling
     # Check if the request has chat_id and is inside of a folder
     chat_id = metadata.get("chat_id", None)
@@ -840,7 +869,7 @@ async def process_chat_payload(request, form_data, user, metadata, model):
 
     try:
         filter_functions = [
-            Functions.get_function_by_id(filter_id)
+            get_function_from_cache(request, filter_id)
             for filter_id in get_sorted_filter_ids(
                 request, model, metadata.get("filter_ids", [])
             )
@@ -856,32 +885,17 @@ async def process_chat_payload(request, form_data, user, metadata, model):
     except Exception as e:
         raise Exception(f"Error: {e}")
 
-    features = form_data.pop("features", None)
-    if features:
-        if "memory" in features and features["memory"]:
-            form_data = await chat_memory_handler(
-                request, form_data, extra_params, user
-            )
+    features = form_data.pop("features", None) or {}
 
-        if "web_search" in features and features["web_search"]:
-            form_data = await chat_web_search_handler(
-                request, form_data, extra_params, user
-            )
-
-        if "image_generation" in features and features["image_generation"]:
-            form_data = await chat_image_generation_handler(
-                request, form_data, extra_params, user
-            )
-
-        if "code_interpreter" in features and features["code_interpreter"]:
-            form_data["messages"] = add_or_update_user_message(
-                (
-                    request.app.state.config.CODE_INTERPRETER_PROMPT_TEMPLATE
-                    if request.app.state.config.CODE_INTERPRETER_PROMPT_TEMPLATE != ""
-                    else DEFAULT_CODE_INTERPRETER_PROMPT
-                ),
-                form_data["messages"],
-            )
+    if "code_interpreter" in features and features["code_interpreter"]:
+        form_data["messages"] = add_or_update_user_message(
+            (
+                request.app.state.config.CODE_INTERPRETER_PROMPT_TEMPLATE
+                if request.app.state.config.CODE_INTERPRETER_PROMPT_TEMPLATE != ""
+                else DEFAULT_CODE_INTERPRETER_PROMPT
+            ),
+            form_data["messages"],
+        )
 
     tool_ids = form_data.pop("tool_ids", None)
     files = form_data.pop("files", None)
@@ -931,29 +945,241 @@ async def process_chat_payload(request, form_data, user, metadata, model):
                     "server": tool_server,
                 }
 
-    if tools_dict:
-        if metadata.get("params", {}).get("function_calling") == "native":
-            # If the function calling is native, then call the tools function calling handler
-            metadata["tools"] = tools_dict
-            form_data["tools"] = [
-                {"type": "function", "function": tool.get("spec", {})}
-                for tool in tools_dict.values()
-            ]
+    if tools_dict and metadata.get("params", {}).get("function_calling") == "native":
+        # If the function calling is native, then pass the tools to the model
+        metadata["tools"] = tools_dict
+        form_data["tools"] = [
+            {"type": "function", "function": tool.get("spec", {})}
+            for tool in tools_dict.values()
+        ]
+
+    # Independent stages run concurrently, each starting once its dependencies are done:
+    # queries -> web_search -> files and memory -> tools, with image_generation alongside.
+    # Stages do not touch form_data["messages"]; they return their contribution,
+    # which is applied in a fixed order once every stage has finished.
+    scheduler = StageScheduler(CHAT_PAYLOAD_STAGE_TIMEOUTS)
+
+    web_search_enabled = bool(features.get("web_search"))
+    query_types = [
+        type
+        for type, enabled in [
+            (
+                "web_search",
+                web_search_enabled
+                and request.app.state.config.ENABLE_SEARCH_QUERY_GENERATION,
+            ),
+            (
+                "retrieval",
+                (web_search_enabled or bool(files))
+                and request.app.state.config.ENABLE_RETRIEVAL_QUERY_GENERATION,
+            ),
+        ]
+        if enabled
+    ]
+
+    if query_types:
+        # A single task model call serves both web search and retrieval
+        async def queries_stage():
+            try:
+                return await generate_chat_queries(
+                    request, form_data, user, query_types[0]
+                )
+            except Exception as e:
+                log.debug(f"Error generating queries: {e}")
+                return None
+
+        scheduler.add("queries", queries_stage)
+
+    # Speculative mode retrieves on the raw user message right away and only waits
+    # for the generated queries until the latency budget runs out
+    speculative = (
+        ENABLE_SPECULATIVE_RETRIEVAL and "retrieval" in query_types and bool(files)
+    )
+    queries_deadline = time.monotonic() + SPECULATIVE_RETRIEVAL_QUERY_BUDGET
+
+    async def get_stage_queries(type: str, fallback: list[str]) -> list[str]:
+        if type not in query_types:
+            return fallback
+
+        if speculative:
+            queries = await scheduler.wait(
+                "queries", max(0, queries_deadline - time.monotonic())
+            )
         else:
-            # If the function calling is not native, then call the tools function calling handler
+            queries = scheduler.results.get("queries")
+        return queries if queries is not None else fallback
+
+    if features.get("memory"):
+
+        async def memory_stage():
+            return await chat_memory_handler(request, form_data, extra_params, user)
+
+        scheduler.add("memory", memory_stage)
+
+    if web_search_enabled:
+
+        async def web_search_stage():
+            # The handler adds the search results to the "files" of its own payload
+            web_search_form_data = await chat_web_search_handler(
+                request,
+                {**form_data},
+                extra_params,
+                user,
+                queries=await get_stage_queries(
+                    "web_search", [get_last_user_message(form_data["messages"])]
+                ),
+            )
+
+            web_search_files = web_search_form_data.get("files")
+            # Files may have been dropped by a tool acting as file handler
+            if web_search_files and "files" in metadata:
+                metadata["files"] = list(
+                    {
+                        json.dumps(f, sort_keys=True): f
+                        for f in [*(metadata["files"] or []), *web_search_files]
+                    }.values()
+                )
+
+        scheduler.add(
+            "web_search",
+            web_search_stage,
+            after=[] if speculative else ["queries"],
+        )
+
+    if features.get("image_generation"):
+
+        async def image_generation_stage():
+            return await chat_image_generation_handler(
+                request, form_data, extra_params, user
+            )
+
+        scheduler.add("image_generation", image_generation_stage)
+
+    if tools_dict and metadata.get("params", {}).get("function_calling") != "native":
+        # If the function calling is not native, then call the tools function calling handler
+        async def tools_stage():
+            # Tool selection sees the memory context, like the final payload does
+            messages = form_data["messages"]
+            memory_context = scheduler.results.get("memory")
+            if memory_context:
+                messages = add_or_update_system_message(
+                    memory_context, [{**m} for m in messages], append=True
+                )
+
             try:
-                form_data, flags = await chat_completion_tools_handler(
-                    request, form_data, extra_params, user, models, tools_dict
+                _, flags = await chat_completion_tools_handler(
+                    request,
+                    {**form_data, "messages": messages},
+                    extra_params,
+                    user,
+                    models,
+                    tools_dict,
                 )
-                sources.extend(flags.get("sources", []))
+                return flags
             except Exception as e:
                 log.exception(e)
 
-    try:
-        form_data, flags = await chat_completion_files_handler(request, form_data, user)
-        sources.extend(flags.get("sources", []))
-    except Exception as e:
-        log.exception(e)
+        scheduler.add("tools", tools_stage, after=["memory"])
+
+    if speculative:
+        speculative_files = metadata["files"]
+        speculative_file_ids = {id(f) for f in speculative_files}
+
+        async def speculative_files_stage():
+            try:
+                _, flags = await chat_completion_files_handler(
+                    request, form_data, user, queries=[], files=speculative_files
+                )
+                return flags.get("sources", [])
+            except RetrievalExecutorBusyError:
+                raise
+            except Exception as e:
+                log.exception(e)
+
+        scheduler.add("speculative_files", speculative_files_stage)
+
+    async def speculative_files_handler():
+        queries = await get_stage_queries("retrieval", [])
+        speculative_sources = await scheduler.wait("speculative_files") or []
+
+        # Files may have been dropped by a tool acting as file handler
+        if not metadata.get("files"):
+            return []
+
+        if not queries:
+            # Query generation failed or ran over budget, only search files
+            # (e.g. web search results) the speculative run did not cover
+            remaining_files = [
+                f for f in metadata["files"] if id(f) not in speculative_file_ids
+            ]
+            if not remaining_files:
+                return speculative_sources
+
+            _, flags = await chat_completion_files_handler(
+                request, form_data, user, queries=[], files=remaining_files
+            )
+            return [*speculative_sources, *flags.get("sources", [])]
+
+        _, flags = await chat_completion_files_handler(
+            request, form_data, user, queries=queries
+        )
+        return merge_sources(
+            [*speculative_sources, *flags.get("sources", [])],
+            k=request.app.state.config.TOP_K,
+        )
+
+    async def files_stage():
+        try:
+            if speculative:
+                return await speculative_files_handler()
+
+            _, flags = await chat_completion_files_handler(
+                request,
+                form_data,
+                user,
+                queries=await get_stage_queries("retrieval", []),
+            )
+            return flags.get("sources", [])
+        except RetrievalExecutorBusyError:
+            raise
+        except Exception as e:
+            log.exception(e)
+
+    scheduler.add(
+        "files",
+        files_stage,
+        after=(
+            ["web_search", "tools"]
+            if speculative
+            else ["queries", "web_search", "tools"]
+        ),
+    )
+
+    results = await scheduler.run()
+    log.debug(f"embedding memo: {request.state.embedding_memo.stats()}")
+
+    # Apply the stage contributions in the order the handlers used to run in
+    if results.get("memory"):
+        form_data["messages"] = add_or_update_system_message(
+            results["memory"], form_data["messages"], append=True
+        )
+    if results.get("image_generation"):
+        form_data["messages"] = add_or_update_system_message(
+            results["image_generation"], form_data["messages"]
+        )
+
+    tools_flags = results.get("tools") or {}
+    for tool_output in tools_flags.get("tool_outputs", []):
+        form_data["messages"] = add_or_update_user_message(
+            tool_output, form_data["messages"]
+        )
+
+    # Keep the source order (and with it the citation numbering) deterministic
+    sources.extend(tools_flags.get("sources", []))
+    sources.extend(results.get("files") or [])
+
+    if len(scheduler.stages) > 1:
+        events.append({"stage_timings": scheduler.timings})
 
     # If context is not empty, insert it into the messages
     if len(sources) > 0:
@@ -1039,6 +1265,305 @@ async def process_chat_payload(request, form_data, user, metadata, model):
     return form_data, metadata, events
 
 
+def split_content_and_whitespace(content):
+    content_stripped = content.rstrip()
+    original_whitespace = (
+        content[len(content_stripped) :] if len(content) > len(content_stripped) else ""
+    )
+    return content_stripped, original_whitespace
+
+
+def is_opening_code_block(content):
+    backtick_segments = content.split("```")
+    # Even number of segments means the last backticks are opening a new block
+    return len(backtick_segments) > 1 and len(backtick_segments) % 2 == 0
+
+
+def serialize_content_block(content: str, block: dict, raw: bool = False) -> str:
+    """
+    Append the serialized form of a single content block to `content`.
+    The result only depends on `content` (the serialized preceding blocks)
+    and the block itself.
+    """
+    if block["type"] == "text":
+        block_content = block["content"].strip()
+        if block_content:
+            content = f"{content}{block_content}\n"
+    elif block["type"] == "tool_calls":
+        attributes = block.get("attributes", {})
+
+        tool_calls = block.get("content", [])
+        results = block.get("results", [])
+
+        if content and not content.endswith("\n"):
+            content += "\n"
+
+        if results:
+
+            tool_calls_display_content = ""
+            for tool_call in tool_calls:
+
+                tool_call_id = tool_call.get("id", "")
+                tool_name = tool_call.get("function", {}).get("name", "")
+                tool_arguments = tool_call.get("function", {}).get("arguments", "")
+
+                tool_result = None
+                tool_result_files = None
+                for result in results:
+                    if tool_call_id == result.get("tool_call_id", ""):
+                        tool_result = result.get("content", None)
+                        tool_result_files = result.get("files", None)
+                        break
+
+                if tool_result:
+                    tool_calls_display_content = f'{tool_calls_display_content}<details type="tool_calls" done="true" id="{tool_call_id}" name="{tool_name}" arguments="{html.escape(json.dumps(tool_arguments))}" result="{html.escape(json.dumps(tool_result, ensure_ascii=False))}" files="{html.escape(json.dumps(tool_result_files)) if tool_result_files else ""}">\n<summary>Tool Executed</summary>\n</details>\n'
+                else:
+                    tool_calls_display_content = f'{tool_calls_display_content}<details type="tool_calls" done="false" id="{tool_call_id}" name="{tool_name}" arguments="{html.escape(json.dumps(tool_arguments))}">\n<summary>Executing...</summary>\n</details>\n'
+
+            if not raw:
+                content = f"{content}{tool_calls_display_content}"
+        else:
+            tool_calls_display_content = ""
+
+            for tool_call in tool_calls:
+                tool_call_id = tool_call.get("id", "")
+                tool_name = tool_call.get("function", {}).get("name", "")
+                tool_arguments = tool_call.get("function", {}).get("arguments", "")
+
+                tool_calls_display_content = f'{tool_calls_display_content}\n<details type="tool_calls" done="false" id="{tool_call_id}" name="{tool_name}" arguments="{html.escape(json.dumps(tool_arguments))}">\n<summary>Executing...</summary>\n</details>\n'
+
+            if not raw:
+                content = f"{content}{tool_calls_display_content}"
+
+    elif block["type"] == "reasoning":
+        reasoning_display_content = "\n".join(
+            (f"> {line}" if not line.startswith(">") else line)
+            for line in block["content"].splitlines()
+        )
+
+        reasoning_duration = block.get("duration", None)
+
+        start_tag = block.get("start_tag", "")
+        end_tag = block.get("end_tag", "")
+
+        if content and not content.endswith("\n"):
+            content += "\n"
+
+        if reasoning_duration is not None:
+            if raw:
+                content = f'{content}{start_tag}{block["content"]}{end_tag}\n'
+            else:
+                content = f'{content}<details type="reasoning" done="true" duration="{reasoning_duration}">\n<summary>Thought for {reasoning_duration} seconds</summary>\n{reasoning_display_content}\n</details>\n'
+        else:
+            if raw:
+                content = f'{content}{start_tag}{block["content"]}{end_tag}\n'
+            else:
+                content = f'{content}<details type="reasoning" done="false">\n<summary>Thinking…</summary>\n{reasoning_display_content}\n</details>\n'
+
+    elif block["type"] == "code_interpreter":
+        attributes = block.get("attributes", {})
+        output = block.get("output", None)
+        lang = attributes.get("lang", "")
+
+        content_stripped, original_whitespace = split_content_and_whitespace(content)
+        if is_opening_code_block(content_stripped):
+            # Remove trailing backticks that would open a new block
+            content = content_stripped.rstrip("`").rstrip() + original_whitespace
+        else:
+            # Keep content as is - either closing backticks or no backticks
+            content = content_stripped + original_whitespace
+
+        if content and not content.endswith("\n"):
+            content += "\n"
+
+        if output:
+            output = html.escape(json.dumps(output))
+
+            if raw:
+                content = f'{content}<code_interpreter type="code" lang="{lang}">\n{block["content"]}\n</code_interpreter>\n```output\n{output}\n```\n'
+            else:
+                content = f'{content}<details type="code_interpreter" done="true" output="{output}">\n<summary>Analyzed</summary>\n```{lang}\n{block["content"]}\n```\n</details>\n'
+        else:
+            if raw:
+                content = f'{content}<code_interpreter type="code" lang="{lang}">\n{block["content"]}\n</code_interpreter>\n'
+            else:
+                content = f'{content}<details type="code_interpreter" done="false">\n<summary>Analyzing...</summary>\n```{lang}\n{block["content"]}\n```\n</details>\n'
+
+    else:
+        block_content = str(block["content"]).strip()
+        if block_content:
+            content = f"{content}{block['type']}: {block_content}\n"
+
+    return content
+
+
+def serialize_content_blocks(content_blocks: list[dict], raw: bool = False) -> str:
+    content = ""
+
+    for block in content_blocks:
+        content = serialize_content_block(content, block, raw)
+
+    return content.strip()
+
+
+class ContentBlocksSerializer:
+    """
+    Incremental `serialize_content_blocks` for streamed responses.
+
+    The serialized prefix after every block is kept, and only the blocks from
+    the first one that was replaced or changed (the dirty range) are serialized
+    again. While streaming, that is usually just the last block.
+    """
+
+    BLOCK_FIELDS = (
+        "type",
+        "content",
+        "attributes",
+        "results",
+        "output",
+        "duration",
+        "start_tag",
+        "end_tag",
+    )
+
+    def __init__(self, raw: bool = False):
+        self.raw = raw
+        self.prefixes = []
+        self.fingerprints = []
+
+    def get_fingerprint(self, block: dict) -> tuple:
+        return (block, *(block.get(field) for field in self.BLOCK_FIELDS))
+
+    def is_clean(self, idx: int, block: dict) -> bool:
+        fingerprint = self.fingerprints[idx]
+        return fingerprint[0] is block and all(
+            value is block.get(field)
+            for value, field in zip(fingerprint[1:], self.BLOCK_FIELDS)
+        )
+
+    def serialize(self, content_blocks: list[dict]) -> str:
+        # The last block is always re-serialized as it may be mutated in place
+        dirty = 0
+        clean_count = min(len(self.fingerprints), len(content_blocks) - 1)
+        while dirty < clean_count and self.is_clean(dirty, content_blocks[dirty]):
+            dirty += 1
+
+        del self.prefixes[dirty:]
+        del self.fingerprints[dirty:]
+
+        content = self.prefixes[-1] if self.prefixes else ""
+        for block in content_blocks[dirty:]:
+            content = serialize_content_block(content, block, self.raw)
+            self.prefixes.append(content)
+            self.fingerprints.append(self.get_fingerprint(block))
+
+        return content.strip()
+
+
+def get_task_response_json(res) -> Optional[dict]:
+    # The JSON object in the content of a task response, None if there is none
+    if len(res.get("choices", [])) == 1:
+        content = res["choices"][0].get("message", {}).get("content", "") or ""
+    else:
+        content = ""
+
+    try:
+        result = json.loads(content[content.find("{") : content.rfind("}") + 1])
+    except Exception:
+        return None
+    return result if isinstance(result, dict) else None
+
+
+def get_task_response_list(result: dict, key: str) -> list:
+    value = result.get(key, [])
+    if not isinstance(value, list):
+        return []
+    return [item for item in value if isinstance(item, str)]
+
+
+async def generate_background_task_results(
+    request, form_data: dict, user, enabled: dict
+) -> dict:
+    """
+    Runs the enabled post-response tasks ("title", "tags", "follow_ups")
+    concurrently under a shared deadline and returns their parsed results.
+
+    A task that is missing from the result timed out, failed or was disabled
+    on the server; a title of "" means the model returned no usable title.
+    With ENABLE_COMBINED_CHAT_TASKS_GENERATION, two or more enabled tasks are
+    generated with a single structured task call instead. Tasks with a custom
+    prompt template configured by an admin keep their own call, so the
+    template is honoured.
+    """
+    names = [name for name, value in enabled.items() if value]
+    if not names:
+        return {}
+
+    combined = []
+    if ENABLE_COMBINED_CHAT_TASKS_GENERATION:
+        templates = {
+            "title": request.app.state.config.TITLE_GENERATION_PROMPT_TEMPLATE,
+            "tags": request.app.state.config.TAGS_GENERATION_PROMPT_TEMPLATE,
+            "follow_ups": request.app.state.config.FOLLOW_UP_GENERATION_PROMPT_TEMPLATE,
+        }
+        combined = [name for name in names if not templates.get(name)]
+        if len(combined) < 2:
+            combined = []
+
+    generators = {
+        "follow_ups": generate_follow_ups,
+        "title": generate_title,
+        "tags": generate_chat_tags,
+    }
+    coroutines = {
+        name: generators[name](request, form_data, user)
+        for name in names
+        if name not in combined
+    }
+    if combined:
+        coroutines["combined"] = generate_chat_tasks(
+            request, {**form_data, "tasks": combined}, user
+        )
+
+    tasks = {name: asyncio.create_task(coro) for name, coro in coroutines.items()}
+    done, pending = await asyncio.wait(
+        tasks.values(), timeout=CHAT_BACKGROUND_TASKS_TIMEOUT
+    )
+    for task in pending:
+        task.cancel()
+    if pending:
+        log.warning(
+            f"Background tasks timed out after {CHAT_BACKGROUND_TASKS_TIMEOUT}s: "
+            f"{[name for name, task in tasks.items() if task in pending]}"
+        )
+
+    responses = {}
+    for name, task in tasks.items():
+        if task not in done:
+            continue
+        if task.exception():
+            log.error(f"Error generating {name}: {task.exception()}")
+            continue
+        # Non-dict responses (e.g. a JSONResponse for a disabled task) are skipped
+        if isinstance(task.result(), dict):
+            responses[name] = get_task_response_json(task.result())
+
+    if "combined" in responses:
+        combined_response = responses.pop("combined")
+        responses.update({name: combined_response for name in combined})
+
+    results = {}
+    for name in ("follow_ups", "tags"):
+        if responses.get(name) is not None:
+            results[name] = get_task_response_list(responses[name], name)
+
+    if "title" in responses:
+        title = (responses["title"] or {}).get("title", "")
+        results["title"] = title.strip() if isinstance(title, str) else ""
+
+    return results
+
+
 async def process_chat_response(
     request, response, form_data, user, metadata, model, events, tasks
 ):
@@ -1081,162 +1606,83 @@ async def process_chat_response(
                 )
 
             if tasks and messages:
-                if (
-                    TASKS.FOLLOW_UP_GENERATION in tasks
-                    and tasks[TASKS.FOLLOW_UP_GENERATION]
-                ):
-                    res = await generate_follow_ups(
-                        request,
-                        {
-                            "model": message["model"],
-                            "messages": messages,
-                            "message_id": metadata["message_id"],
-                            "chat_id": metadata["chat_id"],
-                        },
-                        user,
-                    )
-
-                    if res and isinstance(res, dict):
-                        if len(res.get("choices", [])) == 1:
-                            follow_ups_string = (
-                                res.get("choices", [])[0]
-                                .get("message", {})
-                                .get("content", "")
-                            )
-                        else:
-                            follow_ups_string = ""
-
-                        follow_ups_string = follow_ups_string[
-                            follow_ups_string.find("{") : follow_ups_string.rfind("}")
-                            + 1
-                        ]
-
-                        try:
-                            follow_ups = json.loads(follow_ups_string).get(
-                                "follow_ups", []
-                            )
+                user_message = get_last_user_message(messages)
+                if user_message and len(user_message) > 100:
+                    user_message = user_message[:100] + "..."
+
+                enabled = {
+                    "follow_ups": bool(tasks.get(TASKS.FOLLOW_UP_GENERATION)),
+                    "title": bool(tasks.get(TASKS.TITLE_GENERATION)),
+                    "tags": bool(tasks.get(TASKS.TAGS_GENERATION)),
+                }
 
-                            Chats.upsert_message_to_chat_by_id_and_message_id(
-                                metadata["chat_id"],
-                                metadata["message_id"],
-                                {
-                                    "followUps": follow_ups,
-                                },
-                            )
+                form_data = {
+                    "model": message["model"],
+                    "messages": messages,
+                    "message_id": metadata["message_id"],
+                    "chat_id": metadata["chat_id"],
+                }
 
-                            await event_emitter(
-                                {
-                                    "type": "chat:message:follow_ups",
-                                    "data": {
-                                        "follow_ups": follow_ups,
-                                    },
-                                }
-                            )
-                        except Exception as e:
-                            pass
+                results = await generate_background_task_results(
+                    request, form_data, user, enabled
+                )
 
+                title = None
                 if TASKS.TITLE_GENERATION in tasks:
-                    user_message = get_last_user_message(messages)
-                    if user_message and len(user_message) > 100:
-                        user_message = user_message[:100] + "..."
-
-                    if tasks[TASKS.TITLE_GENERATION]:
-
-                        res = await generate_title(
-                            request,
-                            {
-                                "model": message["model"],
-                                "messages": messages,
-                                "chat_id": metadata["chat_id"],
-                            },
-                            user,
-                        )
-
-                        if res and isinstance(res, dict):
-                            if len(res.get("choices", [])) == 1:
-                                title_string = (
-                                    res.get("choices", [])[0]
-                                    .get("message", {})
-                                    .get(
-                                        "content", message.get("content", user_message)
-                                    )
-                                )
-                            else:
-                                title_string = ""
-
-                            title_string = title_string[
-                                title_string.find("{") : title_string.rfind("}") + 1
-                            ]
-
-                            try:
-                                title = json.loads(title_string).get(
-                                    "title", user_message
-                                )
-                            except Exception as e:
-                                title = ""
-
-                            if not title:
-                                title = messages[0].get("content", user_message)
-
-                            Chats.update_chat_title_by_id(metadata["chat_id"], title)
-
-                            await event_emitter(
-                                {
-                                    "type": "chat:title",
-                                    "data": title,
-                                }
+                    if enabled["title"]:
+                        if results.get("title") is not None:
+                            title = results["title"] or messages[0].get(
+                                "content", user_message
                             )
                     elif len(messages) == 2:
                         title = messages[0].get("content", user_message)
 
-                        Chats.update_chat_title_by_id(metadata["chat_id"], title)
-
-                        await event_emitter(
-                            {
-                                "type": "chat:title",
-                                "data": message.get("content", user_message),
-                            }
-                        )
+                follow_ups = results.get("follow_ups")
+                tags = results.get("tags")
 
-                if TASKS.TAGS_GENERATION in tasks and tasks[TASKS.TAGS_GENERATION]:
-                    res = await generate_chat_tags(
-                        request,
-                        {
-                            "model": message["model"],
-                            "messages": messages,
-                            "chat_id": metadata["chat_id"],
-                        },
+                if title is not None or tags is not None or follow_ups is not None:
+                    Chats.update_chat_task_results_by_id(
+                        metadata["chat_id"],
                         user,
+                        title=title,
+                        tags=tags,
+                        message_id=metadata["message_id"],
+                        message=(
+                            {"followUps": follow_ups}
+                            if follow_ups is not None
+                            else None
+                        ),
                     )
 
-                    if res and isinstance(res, dict):
-                        if len(res.get("choices", [])) == 1:
-                            tags_string = (
-                                res.get("choices", [])[0]
-                                .get("message", {})
-                                .get("content", "")
-                            )
-                        else:
-                            tags_string = ""
-
-                        tags_string = tags_string[
-                            tags_string.find("{") : tags_string.rfind("}") + 1
-                        ]
+                if follow_ups is not None:
+                    await event_emitter(
+                        {
+                            "type": "chat:message:follow_ups",
+                            "data": {
+                                "follow_ups": follow_ups,
+                            },
+                        }
+                    )
 
-                        try:
-                            tags = json.loads(tags_string).get("tags", [])
-                            Chats.update_chat_tags_by_id(
-                                metadata["chat_id"], tags, user
-                            )
+                if title is not None:
+                    await event_emitter(
+                        {
+                            "type": "chat:title",
+                            "data": (
+                                title
+                                if enabled["title"]
+                                else message.get("content", user_message)
+                            ),
+                        }
+                    )
 
-                            await event_emitter(
-                                {
-                                    "type": "chat:tags",
-                                    "data": tags,
-                                }
-                            )
-                        except Exception as e:
-                            pass
+                if tags is not None:
+                    await event_emitter(
+                        {
+                            "type": "chat:tags",
+                            "data": tags,
+                        }
+                    )
 
     event_emitter = None
     event_caller = None
@@ -1393,7 +1839,7 @@ async def process_chat_response(
         "__model__": model,
     }
     filter_functions = [
-        Functions.get_function_by_id(filter_id)
+        get_function_from_cache(request, filter_id)
         for filter_id in get_sorted_filter_ids(
             request, model, metadata.get("filter_ids", [])
         )
@@ -1404,154 +1850,8 @@ async def process_chat_response(
         task_id = str(uuid4())  # Create a unique task ID.
         model_id = form_data.get("model", "")
 
-        def split_content_and_whitespace(content):
-            content_stripped = content.rstrip()
-            original_whitespace = (
-                content[len(content_stripped) :]
-                if len(content) > len(content_stripped)
-                else ""
-            )
-            return content_stripped, original_whitespace
-
-        def is_opening_code_block(content):
-            backtick_segments = content.split("```")
-            # Even number of segments means the last backticks are opening a new block
-            return len(backtick_segments) > 1 and len(backtick_segments) % 2 == 0
-
         # Handle as a background task
         async def response_handler(response, events):
-            def serialize_content_blocks(content_blocks, raw=False):
-                content = ""
-
-                for block in content_blocks:
-                    if block["type"] == "text":
-                        block_content = block["content"].strip()
-                        if block_content:
-                            content = f"{content}{block_content}\n"
-                    elif block["type"] == "tool_calls":
-                        attributes = block.get("attributes", {})
-
-                        tool_calls = block.get("content", [])
-                        results = block.get("results", [])
-
-                        if content and not content.endswith("\n"):
-                            content += "\n"
-
-                        if results:
-
-                            tool_calls_display_content = ""
-                            for tool_call in tool_calls:
-
-                                tool_call_id = tool_call.get("id", "")
-                                tool_name = tool_call.get("function", {}).get(
-                                    "name", ""
-                                )
-                                tool_arguments = tool_call.get("function", {}).get(
-                                    "arguments", ""
-                                )
-
-                                tool_result = None
-                                tool_result_files = None
-                                for result in results:
-                                    if tool_call_id == result.get("tool_call_id", ""):
-                                        tool_result = result.get("content", None)
-                                        tool_result_files = result.get("files", None)
-                                        break
-
-                                if tool_result:
-                                    tool_calls_display_content = f'{tool_calls_display_content}<details type="tool_calls" done="true" id="{tool_call_id}" name="{tool_name}" arguments="{html.escape(json.dumps(tool_arguments))}" result="{html.escape(json.dumps(tool_result, ensure_ascii=False))}" files="{html.escape(json.dumps(tool_result_files)) if tool_result_files else ""}">\n<summary>Tool Executed</summary>\n</details>\n'
-                                else:
-                                    tool_calls_display_content = f'{tool_calls_display_content}<details type="tool_calls" done="false" id="{tool_call_id}" name="{tool_name}" arguments="{html.escape(json.dumps(tool_arguments))}">\n<summary>Executing...</summary>\n</details>\n'
-
-                            if not raw:
-                                content = f"{content}{tool_calls_display_content}"
-                        else:
-                            tool_calls_display_content = ""
-
-                            for tool_call in tool_calls:
-                                tool_call_id = tool_call.get("id", "")
-                                tool_name = tool_call.get("function", {}).get(
-                                    "name", ""
-                                )
-                                tool_arguments = tool_call.get("function", {}).get(
-                                    "arguments", ""
-                                )
-
-                                tool_calls_display_content = f'{tool_calls_display_content}\n<details type="tool_calls" done="false" id="{tool_call_id}" name="{tool_name}" arguments="{html.escape(json.dumps(tool_arguments))}">\n<summary>Executing...</summary>\n</details>\n'
-
-                            if not raw:
-                                content = f"{content}{tool_calls_display_content}"
-
-                    elif block["type"] == "reasoning":
-                        reasoning_display_content = "\n".join(
-                            (f"> {line}" if not line.startswith(">") else line)
-                            for line in block["content"].splitlines()
-                        )
-
-                        reasoning_duration = block.get("duration", None)
-
-                        start_tag = block.get("start_tag", "")
-                        end_tag = block.get("end_tag", "")
-
-                        if content and not content.endswith("\n"):
-                            content += "\n"
-
-                        if reasoning_duration is not None:
-                            if raw:
-                                content = (
-                                    f'{content}{start_tag}{block["content"]}{end_tag}\n'
-                                )
-                            else:
-                                content = f'{content}<details type="reasoning" done="true" duration="{reasoning_duration}">\n<summary>Thought for {reasoning_duration} seconds</summary>\n{reasoning_display_content}\n</details>\n'
-                        else:
-                            if raw:
-                                content = (
-                                    f'{content}{start_tag}{block["content"]}{end_tag}\n'
-                                )
-                            else:
-                                content = f'{content}<details type="reasoning" done="false">\n<summary>Thinking…</summary>\n{reasoning_display_content}\n</details>\n'
-
-                    elif block["type"] == "code_interpreter":
-                        attributes = block.get("attributes", {})
-                        output = block.get("output", None)
-                        lang = attributes.get("lang", "")
-
-                        content_stripped, original_whitespace = (
-                            split_content_and_whitespace(content)
-                        )
-                        if is_opening_code_block(content_stripped):
-                            # Remove trailing backticks that would open a new block
-                            content = (
-                                content_stripped.rstrip("`").rstrip()
-                                + original_whitespace
-                            )
-                        else:
-                            # Keep content as is - either closing backticks or no backticks
-                            content = content_stripped + original_whitespace
-
-                        if content and not content.endswith("\n"):
-                            content += "\n"
-
-                        if output:
-                            output = html.escape(json.dumps(output))
-
-                            if raw:
-                                content = f'{content}<code_interpreter type="code" lang="{lang}">\n{block["content"]}\n</code_interpreter>\n```output\n{output}\n```\n'
-                            else:
-                                content = f'{content}<details type="code_interpreter" done="true" output="{output}">\n<summary>Analyzed</summary>\n```{lang}\n{block["content"]}\n```\n</details>\n'
-                        else:
-                            if raw:
-                                content = f'{content}<code_interpreter type="code" lang="{lang}">\n{block["content"]}\n</code_interpreter>\n'
-                            else:
-                                content = f'{content}<details type="code_interpreter" done="false">\n<summary>Analyzing...</summary>\n```{lang}\n{block["content"]}\n```\n</details>\n'
-
-                    else:
-                        block_content = str(block["content"]).strip()
-                        if block_content:
-                            content = f"{content}{block['type']}: {block_content}\n"
-
-                return content.strip()
-
             def convert_content_blocks_to_messages(content_blocks, raw=False):
                 messages = []
 
@@ -1791,6 +2091,7 @@ async def process_chat_response(
                     "content": content,
                 }
             ]
+            content_serializer = ContentBlocksSerializer()
 
             # We might want to disable this by default
             DETECT_REASONING = True
@@ -1847,6 +2148,18 @@ async def process_chat_response(
                         ),
                     )
 
+                    # Resolve the stream filters once instead of for every chunk
+                    try:
+                        stream_filter_pipeline = get_filter_pipeline(
+                            request,
+                            filter_functions,
+                            "stream",
+                            {"__body__": form_data, **extra_params},
+                        )
+                    except Exception as e:
+                        log.exception(f"Error preparing stream filters: {e}")
+                        stream_filter_pipeline = []
+
                     async for line in response.body_iterator:
                         line = line.decode("utf-8") if isinstance(line, bytes) else line
                         data = line
@@ -1863,14 +2176,10 @@ async def process_chat_response(
                         data = data[len("data:") :].strip()
 
                         try:
-                            data = json.loads(data)
-
-                            data, _ = await process_filter_functions(
-                                request=request,
-                                filter_functions=filter_functions,
-                                filter_type="stream",
-                                form_data=data,
-                                extra_params={"__body__": form_data, **extra_params},
+                            data = json_loads(data)
+
+                            data = await process_filter_pipeline(
+                                stream_filter_pipeline, "stream", data
                             )
 
                             if data:
@@ -2000,11 +2309,8 @@ async def process_chat_response(
 
                                         reasoning_block["content"] += reasoning_content
 
-                                        data = {
-                                            "content": serialize_content_blocks(
-                                                content_blocks
-                                            )
-                                        }
+                                        # Serialized lazily, only when emitted
+                                        data = None
 
                                     if value:
                                         if (
@@ -2082,21 +2388,25 @@ async def process_chat_response(
                                                 metadata["chat_id"],
                                                 metadata["message_id"],
                                                 {
-                                                    "content": serialize_content_blocks(
+                                                    "content": content_serializer.serialize(
                                                         content_blocks
                                                     ),
                                                 },
                                             )
                                         else:
+                                            # Serialized lazily, only when emitted
+                                            data = None
+
+                                if delta:
+                                    delta_count += 1
+                                    if delta_count >= delta_chunk_size:
+                                        if data is None:
                                             data = {
-                                                "content": serialize_content_blocks(
+                                                "content": content_serializer.serialize(
                                                     content_blocks
                                                 ),
                                             }
 
-                                if delta:
-                                    delta_count += 1
-                                    if delta_count >= delta_chunk_size:
                                         await event_emitter(
                                             {
                                                 "type": "chat:completion",
@@ -2174,16 +2484,14 @@ async def process_chat_response(
                         {
                             "type": "chat:completion",
                             "data": {
-                                "content": serialize_content_blocks(content_blocks),
+                                "content": content_serializer.serialize(content_blocks),
                             },
                         }
                     )
 
                     tools = metadata.get("tools", {})
 
-                    results = []
-
-                    for tool_call in response_tool_calls:
+                    async def execute_tool_call(tool_call):
                         tool_call_id = tool_call.get("id", "")
                         tool_name = tool_call.get("function", {}).get("name", "")
                         tool_args = tool_call.get("function", {}).get("arguments", "{}")
@@ -2273,17 +2581,19 @@ async def process_chat_response(
                                 tool_result, indent=2, ensure_ascii=False
                             )
 
-                        results.append(
-                            {
-                                "tool_call_id": tool_call_id,
-                                "content": tool_result,
-                                **(
-                                    {"files": tool_result_files}
-                                    if tool_result_files
-                                    else {}
-                                ),
-                            }
-                        )
+                        return {
+                            "tool_call_id": tool_call_id,
+                            "content": tool_result,
+                            **(
+                                {"files": tool_result_files}
+                                if tool_result_files
+                                else {}
+                            ),
+                        }
+
+                    results = await execute_tool_calls(
+                        execute_tool_call, response_tool_calls
+                    )
 
                     content_blocks[-1]["results"] = results
 
@@ -2298,7 +2608,7 @@ async def process_chat_response(
                         {
                             "type": "chat:completion",
                             "data": {
-                                "content": serialize_content_blocks(content_blocks),
+                                "content": content_serializer.serialize(content_blocks),
                             },
                         }
                     )
@@ -2343,7 +2653,9 @@ async def process_chat_response(
                             {
                                 "type": "chat:completion",
                                 "data": {
-                                    "content": serialize_content_blocks(content_blocks),
+                                    "content": content_serializer.serialize(
+                                        content_blocks
+                                    ),
                                 },
                             }
                         )
@@ -2465,7 +2777,9 @@ async def process_chat_response(
                             {
                                 "type": "chat:completion",
                                 "data": {
-                                    "content": serialize_content_blocks(content_blocks),
+                                    "content": content_serializer.serialize(
+                                        content_blocks
+                                    ),
                                 },
                             }
                         )
@@ -2502,7 +2816,7 @@ async def process_chat_response(
                 title = Chats.get_chat_title_by_id(metadata["chat_id"])
                 data = {
                     "done": True,
-                    "content": serialize_content_blocks(content_blocks),
+                    "content": content_serializer.serialize(content_blocks),
                     "title": title,
                 }
 
@@ -2512,7 +2826,7 @@ async def process_chat_response(
                         metadata["chat_id"],
                         metadata["message_id"],
                         {
-                            "content": serialize_content_blocks(content_blocks),
+                            "content": content_serializer.serialize(content_blocks),
                         },
                     )
 
@@ -2550,7 +2864,7 @@ async def process_chat_response(
                         metadata["chat_id"],
                         metadata["message_id"],
                         {
-                            "content": serialize_content_blocks(content_blocks),
+                            "content": content_serializer.serialize(content_blocks),
                         },
                     )
 
@@ -2571,25 +2885,21 @@ async def process_chat_response(
             def wrap_item(item):
                 return f"data: {item}\n\n"
 
+            stream_filter_pipeline = get_filter_pipeline(
+                request, filter_functions, "stream", extra_params
+            )
+
             for event in events:
-                event, _ = await process_filter_functions(
-                    request=request,
-                    filter_functions=filter_functions,
-                    filter_type="stream",
-                    form_data=event,
-                    extra_params=extra_params,
+                event = await process_filter_pipeline(
+                    stream_filter_pipeline, "stream", event
                 )
 
                 if event:
                     yield wrap_item(json.dumps(event))
 
             async for data in original_generator:
-                data, _ = await process_filter_functions(
-                    request=request,
-                    filter_functions=filter_functions,
-                    filter_type="stream",
-                    form_data=data,
-                    extra_params=extra_params,
+                data = await process_filter_pipeline(
+                    stream_filter_pipeline, "stream", data
                 )
 
                 if data:
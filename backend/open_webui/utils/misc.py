@@ -10,12 +10,61 @@ import json
 
 
 import collections.abc
-from open_webui.env import SRC_LOG_LEVELS
+from open_webui.env import SRC_LOG_LEVELS, ENABLE_ORJSON
+
+try:
+    import orjson
+
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
 
 log = logging.getLogger(__name__)
 log.setLevel(SRC_LOG_LEVELS["MAIN"])
 
 
+USE_ORJSON = ENABLE_ORJSON and ORJSON_AVAILABLE
+
+
+def json_loads(data):
+    if USE_ORJSON:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
+def json_dumps(obj) -> str:
+    if USE_ORJSON:
+        try:
+            return orjson.dumps(obj).decode("utf-8")
+        except TypeError:
+            # e.g. non-str dict keys or types orjson does not know
+            pass
+    return json.dumps(obj)
+
+
+class JSONSerializer:
+    """
+    `json` module replacement (e.g. for python-socketio's `json` option)
+    backed by orjson when it is available and enabled.
+    """
+
+    @staticmethod
+    def loads(data, *args, **kwargs):
+        if USE_ORJSON and not args and not kwargs:
+            return orjson.loads(data)
+        return json.loads(data, *args, **kwargs)
+
+    @staticmethod
+    def dumps(obj, *args, **kwargs):
+        # orjson output is always compact, which is all socket.io asks for
+        if USE_ORJSON and not args and set(kwargs) <= {"separators"}:
+            try:
+                return orjson.dumps(obj).decode("utf-8")
+            except TypeError:
+                pass
+        return json.dumps(obj, *args, **kwargs)
+
+
 def deep_update(d, u):
     for k, v in u.items():
         if isinstance(v, collections.abc.Mapping):
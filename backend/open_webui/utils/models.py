@@ -19,6 +19,7 @@ from open_webui.utils.plugin import (
     get_function_module_from_cache,
 )
 from open_webui.utils.access_control import has_access
+from open_webui.utils.singleflight import singleflight, get_user_flight_key
 
 
 from open_webui.config import (
@@ -56,6 +57,9 @@ async def fetch_openai_models(request: Request, user: UserModel = None):
     return openai_response["data"]
 
 
+# Process-local only: the fetchers fill app.state.OPENAI_MODELS and
+# app.state.OLLAMA_MODELS, which a result taken from another worker would skip
+@singleflight(key=lambda request, user=None: get_user_flight_key(user))
 async def get_all_base_models(request: Request, user: UserModel = None):
     openai_task = (
         fetch_openai_models(request, user)
@@ -76,6 +80,9 @@ async def get_all_base_models(request: Request, user: UserModel = None):
     return function_models + openai_models + ollama_models
 
 
+@singleflight(
+    key=lambda request, refresh=False, user=None: get_user_flight_key(user, refresh)
+)
 async def get_all_models(request, refresh: bool = False, user: UserModel = None):
     if (
         request.app.state.MODELS
@@ -1,13 +1,22 @@
 import os
 import re
+import hashlib
 import subprocess
 import sys
 from importlib import util
 import types
 import tempfile
 import logging
-
-from open_webui.env import SRC_LOG_LEVELS, PIP_OPTIONS, PIP_PACKAGE_INDEX_OPTIONS
+import time
+from collections import OrderedDict
+
+from open_webui.env import (
+    SRC_LOG_LEVELS,
+    PIP_OPTIONS,
+    PIP_PACKAGE_INDEX_OPTIONS,
+    FUNCTIONS_CACHE_TTL,
+    USER_VALVES_CACHE_MAX_SIZE,
+)
 from open_webui.models.functions import Functions
 from open_webui.models.tools import Tools
 
@@ -166,60 +175,229 @@ def load_function_module_by_id(function_id: str, content: str | None = None):
         os.unlink(temp_file.name)
 
 
+def get_content_hash(content: str) -> str:
+    return hashlib.sha256(content.encode("utf-8")).hexdigest()
+
+
+def get_functions_from_cache(request, force=False) -> dict:
+    """
+    Get all function rows (including valves) keyed by id.
+
+    The rows are kept in a process-local snapshot. At most every
+    FUNCTIONS_CACHE_TTL seconds (or when `force` is set) the snapshot is checked
+    against the table signature, so changes made by other workers are picked up,
+    and the rows are only reloaded when the signature differs. Local changes
+    reload it right away through `invalidate_function_cache`.
+    """
+    state = request.app.state
+    functions = getattr(state, "FUNCTION_ROWS", None)
+    checked_at = getattr(state, "FUNCTION_ROWS_LOADED_AT", 0)
+
+    if (
+        not force
+        and functions is not None
+        and FUNCTIONS_CACHE_TTL
+        and time.monotonic() - checked_at < FUNCTIONS_CACHE_TTL
+    ):
+        return functions
+
+    signature = Functions.get_functions_signature() if FUNCTIONS_CACHE_TTL else None
+    if (
+        functions is None
+        or signature is None
+        or signature != getattr(state, "FUNCTION_ROWS_SIGNATURE", None)
+    ):
+        # The signature is read first, a change in between triggers the next reload
+        functions = {
+            function.id: function for function in Functions.get_functions_with_valves()
+        }
+        state.FUNCTION_ROWS = functions
+        state.FUNCTION_ROWS_SIGNATURE = signature
+
+    state.FUNCTION_ROWS_LOADED_AT = time.monotonic()
+    return functions
+
+
+def get_function_from_cache(request, function_id):
+    function = get_functions_from_cache(request).get(function_id)
+    if function is None:
+        # The function may have been created by another worker since the last check
+        function = get_functions_from_cache(request, force=True).get(function_id)
+    return function
+
+
+def invalidate_function_cache(request, function_id=None):
+    """
+    Drop the cached function rows so that the next lookup reloads them.
+    Compiled modules are kept and only recompiled if their content changed.
+    """
+    request.app.state.FUNCTION_ROWS = None
+
+    if function_id:
+        getattr(request.app.state, "FUNCTION_VALVES", {}).pop(function_id, None)
+
+
 def get_function_module_from_cache(request, function_id, load_from_db=True):
+    if not hasattr(request.app.state, "FUNCTIONS"):
+        request.app.state.FUNCTIONS = {}
+
+    if not hasattr(request.app.state, "FUNCTION_CONTENTS"):
+        request.app.state.FUNCTION_CONTENTS = {}
+
+    FUNCTIONS = request.app.state.FUNCTIONS
+    # function_id -> (updated_at, content hash) of the compiled module
+    FUNCTION_CONTENTS = request.app.state.FUNCTION_CONTENTS
+
     if load_from_db:
-        # Always load from the database by default
+        # Validate the compiled module against the cached function row
         # This is useful for hooks like "inlet" or "outlet" where the content might change
         # and we want to ensure the latest content is used.
 
-        function = Functions.get_function_by_id(function_id)
+        function = get_function_from_cache(request, function_id)
         if not function:
             raise Exception(f"Function not found: {function_id}")
-        content = function.content
 
-        new_content = replace_imports(content)
-        if new_content != content:
-            content = new_content
+        version = FUNCTION_CONTENTS.get(function_id)
+        if function_id in FUNCTIONS and version:
+            if version[0] == function.updated_at:
+                return FUNCTIONS[function_id], None, None
+
+        content = replace_imports(function.content)
+        content_hash = get_content_hash(content)
+
+        if function_id in FUNCTIONS and version and version[1] == content_hash:
+            # Only the metadata (e.g. valves) changed, keep the compiled module
+            FUNCTION_CONTENTS[function_id] = (function.updated_at, content_hash)
+            return FUNCTIONS[function_id], None, None
+
+        if content != function.content:
             # Update the function content in the database
             Functions.update_function_by_id(function_id, {"content": content})
 
-        if (
-            hasattr(request.app.state, "FUNCTION_CONTENTS")
-            and function_id in request.app.state.FUNCTION_CONTENTS
-        ) and (
-            hasattr(request.app.state, "FUNCTIONS")
-            and function_id in request.app.state.FUNCTIONS
-        ):
-            if request.app.state.FUNCTION_CONTENTS[function_id] == content:
-                return request.app.state.FUNCTIONS[function_id], None, None
-
         function_module, function_type, frontmatter = load_function_module_by_id(
             function_id, content
         )
+        FUNCTION_CONTENTS[function_id] = (function.updated_at, content_hash)
     else:
         # Load from cache (e.g. "stream" hook)
         # This is useful for performance reasons
 
-        if (
-            hasattr(request.app.state, "FUNCTIONS")
-            and function_id in request.app.state.FUNCTIONS
-        ):
-            return request.app.state.FUNCTIONS[function_id], None, None
+        if function_id in FUNCTIONS:
+            return FUNCTIONS[function_id], None, None
 
         function_module, function_type, frontmatter = load_function_module_by_id(
             function_id
         )
 
-    if not hasattr(request.app.state, "FUNCTIONS"):
-        request.app.state.FUNCTIONS = {}
+    FUNCTIONS[function_id] = function_module
 
-    if not hasattr(request.app.state, "FUNCTION_CONTENTS"):
-        request.app.state.FUNCTION_CONTENTS = {}
+    return function_module, function_type, frontmatter
 
-    request.app.state.FUNCTIONS[function_id] = function_module
-    request.app.state.FUNCTION_CONTENTS[function_id] = content
 
-    return function_module, function_type, frontmatter
+def apply_function_valves(request, function_id, function_module):
+    """
+    Hydrate `function_module.valves` from the cached function row.
+    The Valves object is only rebuilt when the stored valves have changed.
+    """
+    if not (hasattr(function_module, "valves") and hasattr(function_module, "Valves")):
+        return function_module
+
+    if not hasattr(request.app.state, "FUNCTION_VALVES"):
+        request.app.state.FUNCTION_VALVES = {}
+
+    function = get_function_from_cache(request, function_id)
+    valves = (function.valves if function else None) or {}
+
+    cached = request.app.state.FUNCTION_VALVES.get(function_id)
+    if cached is None or cached[0] is not function_module or cached[1] != valves:
+        function_module.valves = function_module.Valves(**valves)
+        request.app.state.FUNCTION_VALVES[function_id] = (function_module, valves)
+
+    return function_module
+
+
+def get_tool_module_from_cache(request, tool):
+    """
+    Get the compiled module of a tool row, recompiling it only when the
+    (import-rewritten) content hash differs from the cached one.
+    """
+    TOOLS = request.app.state.TOOLS
+    # tool_id -> (updated_at, content hash) of the compiled module
+    TOOL_CONTENTS = request.app.state.TOOL_CONTENTS
+
+    version = TOOL_CONTENTS.get(tool.id)
+    if tool.id in TOOLS:
+        if version is not None and version[0] == tool.updated_at:
+            return TOOLS[tool.id]
+
+        content_hash = get_content_hash(replace_imports(tool.content))
+        if version is None or version[1] == content_hash:
+            # Modules without a version were just compiled by the tools router
+            TOOL_CONTENTS[tool.id] = (tool.updated_at, content_hash)
+            return TOOLS[tool.id]
+
+    module, _ = load_tool_module_by_id(tool.id)
+    TOOLS[tool.id] = module
+    TOOL_CONTENTS[tool.id] = (
+        tool.updated_at,
+        get_content_hash(replace_imports(tool.content)),
+    )
+    return module
+
+
+def apply_tool_valves(request, tool, module):
+    """
+    Hydrate `module.valves` for a tool row. Valves updates bump the row's
+    `updated_at`, so the stored valves are only read again when it changes.
+    """
+    if not (hasattr(module, "valves") and hasattr(module, "Valves")):
+        return module
+
+    if not hasattr(request.app.state, "TOOL_VALVES"):
+        request.app.state.TOOL_VALVES = {}
+
+    cached = request.app.state.TOOL_VALVES.get(tool.id)
+    if cached is None or cached[0] is not module or cached[1] != tool.updated_at:
+        valves = Tools.get_tool_valves_by_id(tool.id) or {}
+        module.valves = module.Valves(**valves)
+        request.app.state.TOOL_VALVES[tool.id] = (module, tool.updated_at)
+
+    return module
+
+
+def get_user_valves_from_cache(request, plugin_type, plugin_id, module, user):
+    """
+    Build the `UserValves` object of a function or tool (`plugin_type` is
+    "functions" or "tools") for the given user dict (`__user__`).
+
+    The valves are read from the user settings that were already loaded with
+    the request, and the validated object is reused until they change.
+    """
+    if not hasattr(request.app.state, "USER_VALVES"):
+        request.app.state.USER_VALVES = OrderedDict()
+    USER_VALVES = request.app.state.USER_VALVES
+
+    if isinstance(user, dict) and "settings" in user:
+        settings = user.get("settings") or {}
+        valves = (settings.get(plugin_type) or {}).get("valves", {}).get(
+            plugin_id
+        ) or {}
+    else:
+        table = Functions if plugin_type == "functions" else Tools
+        valves = table.get_user_valves_by_id_and_user_id(plugin_id, user["id"]) or {}
+
+    key = (plugin_type, plugin_id, user["id"])
+    cached = USER_VALVES.get(key)
+    if cached is None or cached[0] is not module.UserValves or cached[1] != valves:
+        cached = (module.UserValves, valves, module.UserValves(**valves))
+        USER_VALVES[key] = cached
+
+    # Least recently used entries are dropped once the cache is full
+    USER_VALVES.move_to_end(key)
+    while len(USER_VALVES) > USER_VALVES_CACHE_MAX_SIZE:
+        USER_VALVES.popitem(last=False)
+
+    return cached[2].model_copy()
 
 
 def install_frontmatter_requirements(requirements: str):
@@ -0,0 +1,193 @@
+import asyncio
+import functools
+import hashlib
+import json
+import logging
+import time
+import uuid
+from typing import Any, Awaitable, Callable, Optional
+
+from open_webui.env import (
+    SRC_LOG_LEVELS,
+    REDIS_KEY_PREFIX,
+    ENABLE_FORWARD_USER_INFO_HEADERS,
+    ENABLE_SINGLEFLIGHT_REDIS_LOCK,
+    SINGLEFLIGHT_REDIS_LOCK_TIMEOUT,
+)
+
+log = logging.getLogger(__name__)
+log.setLevel(SRC_LOG_LEVELS["MAIN"])
+
+
+class SingleFlight:
+    """
+    Coalesces concurrent calls with the same key into one execution whose
+    result (or exception) is shared by every caller that arrived while it was
+    running. Nothing is cached once the call has finished. Cancelling one
+    caller does not cancel the shared call.
+
+    With a Redis connection, the flight is also deduplicated across processes:
+    the process holding the Redis lock runs the call and publishes its
+    JSON-serializable result; the others wait for it and fall back to running
+    the call themselves if the lock holder does not publish in time.
+    """
+
+    def __init__(
+        self,
+        name: str,
+        lock_timeout: float = 30,
+        poll_interval: float = 0.05,
+    ):
+        self.name = name
+        self.lock_timeout = lock_timeout
+        self.poll_interval = poll_interval
+
+        self._inflight: dict[str, asyncio.Task] = {}
+
+        self.calls = 0
+        self.coalesced = 0
+        self.remote = 0
+
+    async def do(self, key: str, fn: Callable[[], Awaitable[Any]], redis=None) -> Any:
+        task = self._inflight.get(key)
+        if task is not None:
+            self.coalesced += 1
+            return await asyncio.shield(task)
+
+        # The call runs in its own task, so cancelling the caller that started
+        # it does not cancel it for the callers waiting on it
+        task = asyncio.create_task(self._run(key, fn, redis))
+        self._inflight[key] = task
+        task.add_done_callback(lambda task: self._finished(key, task))
+        return await asyncio.shield(task)
+
+    async def _run(self, key: str, fn: Callable[[], Awaitable[Any]], redis=None) -> Any:
+        if redis is not None:
+            return await self._do_with_redis_lock(key, fn, redis)
+
+        self.calls += 1
+        return await fn()
+
+    def _finished(self, key: str, task: asyncio.Task):
+        if self._inflight.get(key) is task:
+            del self._inflight[key]
+        # Retrieve the exception so a call nobody waits for does not log it
+        if not task.cancelled():
+            task.exception()
+
+    async def _do_with_redis_lock(
+        self, key: str, fn: Callable[[], Awaitable[Any]], redis
+    ) -> Any:
+        lock_key = f"{REDIS_KEY_PREFIX}:singleflight:{self.name}:{key}:lock"
+        result_key = f"{REDIS_KEY_PREFIX}:singleflight:{self.name}:{key}:result"
+        lock_id = str(uuid.uuid4())
+        timeout = max(int(self.lock_timeout), 1)
+
+        try:
+            acquired = await redis.set(lock_key, lock_id, nx=True, ex=timeout)
+            owner_id = None if acquired else await redis.get(lock_key)
+        except Exception as e:
+            log.debug(f"Single-flight Redis lock unavailable for {self.name}: {e}")
+            self.calls += 1
+            return await fn()
+
+        if acquired or owner_id is None:
+            self.calls += 1
+            try:
+                result = await fn()
+                try:
+                    await redis.set(
+                        result_key,
+                        json.dumps({"id": lock_id, "result": result}),
+                        ex=timeout,
+                    )
+                except Exception as e:
+                    log.debug(f"Single-flight result not shared for {self.name}: {e}")
+                return result
+            finally:
+                if acquired:
+                    try:
+                        if await redis.get(lock_key) == lock_id:
+                            await redis.delete(lock_key)
+                    except Exception:
+                        pass
+
+        # Another process is running the call, wait for it to publish its result
+        deadline = time.monotonic() + self.lock_timeout
+        while time.monotonic() < deadline:
+            await asyncio.sleep(self.poll_interval)
+            try:
+                value = await redis.get(result_key)
+                if value is not None:
+                    value = json.loads(value)
+                    if value.get("id") == owner_id:
+                        self.remote += 1
+                        return value["result"]
+                if await redis.get(lock_key) != owner_id:
+                    break
+            except Exception:
+                break
+
+        self.calls += 1
+        return await fn()
+
+    def stats(self) -> dict:
+        return {
+            "inflight": len(self._inflight),
+            "calls": self.calls,
+            "coalesced": self.coalesced,
+            "remote": self.remote,
+        }
+
+
+def singleflight(
+    key: Callable[..., Optional[str]],
+    redis: Optional[Callable[..., Any]] = None,
+    name: Optional[str] = None,
+):
+    """
+    Decorates an async function so concurrent calls that map to the same
+    `key(*args, **kwargs)` share one execution. A key of None bypasses
+    coalescing. `redis(*args, **kwargs)` may return an async Redis connection
+    to also coalesce across processes when ENABLE_SINGLEFLIGHT_REDIS_LOCK is set.
+    """
+
+    def decorator(fn):
+        group = SingleFlight(
+            name or f"{fn.__module__}.{fn.__qualname__}",
+            lock_timeout=SINGLEFLIGHT_REDIS_LOCK_TIMEOUT,
+        )
+
+        @functools.wraps(fn)
+        async def wrapper(*args, **kwargs):
+            flight_key = key(*args, **kwargs)
+            if flight_key is None:
+                return await fn(*args, **kwargs)
+
+            connection = None
+            if redis is not None and ENABLE_SINGLEFLIGHT_REDIS_LOCK:
+                try:
+                    connection = redis(*args, **kwargs)
+                except Exception:
+                    connection = None
+
+            return await group.do(
+                flight_key, lambda: fn(*args, **kwargs), redis=connection
+            )
+
+        wrapper.singleflight = group
+        return wrapper
+
+    return decorator
+
+
+def get_user_flight_key(user=None, *parts) -> str:
+    # Upstream responses only differ per user when user info headers are forwarded
+    user_id = user.id if user is not None and ENABLE_FORWARD_USER_INFO_HEADERS else ""
+    return ":".join([user_id, *[str(part) for part in parts]])
+
+
+def get_data_flight_key(*data) -> str:
+    return hashlib.sha256(
+        json.dumps(data, sort_keys=True, default=str).encode()
+    ).hexdigest()
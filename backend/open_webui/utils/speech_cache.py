@@ -0,0 +1,200 @@
+import asyncio
+import hashlib
+import json
+import logging
+import os
+import re
+import uuid
+from collections import OrderedDict
+from pathlib import Path
+from typing import Awaitable, Callable, Optional
+
+from open_webui.env import SRC_LOG_LEVELS
+
+log = logging.getLogger(__name__)
+log.setLevel(SRC_LOG_LEVELS["AUDIO"])
+
+
+def normalize_speech_text(text: str) -> str:
+    return " ".join(str(text or "").split())
+
+
+def split_speech_text(text: str, split_on: str) -> list[str]:
+    """Splits text the same way the frontend does for TTS_SPLIT_ON."""
+    if split_on == "punctuation":
+        parts = re.split(r"(?<=[.!?。！？])\s+", text)
+    elif split_on == "paragraphs":
+        parts = re.split(r"\n+", text)
+    else:
+        parts = [text]
+    return [part for part in map(normalize_speech_text, parts) if part]
+
+
+def get_speech_cache_key(
+    engine: str, model: str, voice: str, text: str, options: Optional[dict] = None
+) -> str:
+    return hashlib.sha256(
+        json.dumps(
+            [engine, model, voice, options or {}, normalize_speech_text(text)],
+            sort_keys=True,
+        ).encode()
+    ).hexdigest()
+
+
+class SpeechCache:
+    """
+    Size-bounded LRU cache of synthesized speech, one file per sentence.
+
+    Entries are keyed on (engine, model, voice, options, normalized text) so a
+    sentence is reused by every message that contains it. The in-memory index
+    is rebuilt from the cache directory on startup, ordered by last use (file
+    mtime), and the least recently used files are removed once the total size
+    exceeds `max_size` bytes. Concurrent requests for the same missing entry
+    share one synthesis.
+    """
+
+    def __init__(self, cache_dir: Path, max_size: int = 0, extension: str = "mp3"):
+        self.cache_dir = Path(cache_dir)
+        self.max_size = max_size
+        self.extension = extension
+
+        # key -> size in bytes
+        self._entries: OrderedDict[str, int] = OrderedDict()
+        self._total_size = 0
+        self._inflight: dict[str, asyncio.Future] = {}
+
+        self.hits = 0
+        self.misses = 0
+        self.coalesced = 0
+        self.evictions = 0
+
+        self._load_index()
+
+    def _load_index(self):
+        self.cache_dir.mkdir(parents=True, exist_ok=True)
+        files = []
+        for path in self.cache_dir.glob(f"*.{self.extension}"):
+            try:
+                stat = path.stat()
+                files.append((stat.st_mtime, path.stem, stat.st_size))
+            except FileNotFoundError:
+                continue
+
+        for _, key, size in sorted(files):
+            self._entries[key] = size
+            self._total_size += size
+        self.evict()
+
+    def get_path(self, key: str) -> Path:
+        return self.cache_dir / f"{key}.{self.extension}"
+
+    def get(self, key: str) -> Optional[Path]:
+        path = self.get_path(key)
+        try:
+            size = path.stat().st_size
+        except FileNotFoundError:
+            self._remove_entry(key)
+            return None
+
+        if key in self._entries:
+            self._entries.move_to_end(key)
+        else:
+            # Written by another worker process
+            self._add(key, size)
+        try:
+            # Keeps the LRU order across restarts
+            os.utime(path)
+        except OSError:
+            pass
+        return path
+
+    @staticmethod
+    def _write_file(path: Path, data: bytes):
+        tmp_path = path.with_name(f"{path.name}.{uuid.uuid4().hex}.part")
+        try:
+            tmp_path.write_bytes(data)
+            os.replace(tmp_path, path)
+        finally:
+            if tmp_path.exists():
+                tmp_path.unlink()
+
+    def _add(self, key: str, size: int):
+        self._remove_entry(key)
+        self._entries[key] = size
+        self._total_size += size
+        self.evict(keep=key)
+
+    def put(self, key: str, data: bytes) -> Path:
+        path = self.get_path(key)
+        self._write_file(path, data)
+        self._add(key, len(data))
+        return path
+
+    async def get_or_synthesize(
+        self, key: str, synthesize: Callable[[], Awaitable[bytes]]
+    ) -> Path:
+        path = self.get(key)
+        if path is not None:
+            self.hits += 1
+            return path
+
+        task = self._inflight.get(key)
+        if task is not None:
+            self.coalesced += 1
+        else:
+            self.misses += 1
+
+            async def run():
+                try:
+                    data = await synthesize()
+                    path = self.get_path(key)
+                    await asyncio.to_thread(self._write_file, path, data)
+                    self._add(key, len(data))
+                    return path
+                finally:
+                    self._inflight.pop(key, None)
+
+            # The synthesis outlives callers that go away, so its result is still cached
+            task = asyncio.ensure_future(run())
+            self._inflight[key] = task
+
+        return await asyncio.shield(task)
+
+    def _remove_entry(self, key: str):
+        size = self._entries.pop(key, None)
+        if size is not None:
+            self._total_size -= size
+
+    def evict(self, keep: Optional[str] = None):
+        if not self.max_size:
+            return
+
+        for key in list(self._entries):
+            if self._total_size <= self.max_size:
+                break
+            if key == keep or key in self._inflight:
+                continue
+
+            self._remove_entry(key)
+            path = self.get_path(key)
+            # Older versions stored the request body next to the audio
+            for stale_path in (path, path.with_suffix(".json")):
+                try:
+                    stale_path.unlink()
+                except FileNotFoundError:
+                    pass
+                except Exception as e:
+                    log.warning(f"Failed to evict cached speech {stale_path}: {e}")
+            self.evictions += 1
+
+    def stats(self) -> dict:
+        return {
+            "entries": len(self._entries),
+            "size": self._total_size,
+            "max_size": self.max_size,
+            "inflight": len(self._inflight),
+            "hits": self.hits,
+            "misses": self.misses,
+            "coalesced": self.coalesced,
+            "evictions": self.evictions,
+        }
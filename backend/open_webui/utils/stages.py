@@ -0,0 +1,86 @@
+import asyncio
+import logging
+import time
+from typing import Any, Awaitable, Callable, Optional
+
+from open_webui.env import SRC_LOG_LEVELS
+
+log = logging.getLogger(__name__)
+log.setLevel(SRC_LOG_LEVELS["MAIN"])
+
+
+class StageScheduler:
+    """
+    Runs named async stages concurrently. A stage starts as soon as the stages
+    it depends on have finished (successfully or not). Stages can only depend
+    on stages added before them; dependencies on stages that were never added
+    are ignored.
+
+    Finished stages store their return value in `results`, where dependent
+    stages can read it. A stage that exceeds its timeout is cancelled and its
+    result is `None`.
+    Any other exception is re-raised from `run` once every stage has settled,
+    so stages should handle the errors they want to swallow themselves.
+    """
+
+    def __init__(self, timeouts: Optional[dict] = None):
+        self.timeouts = timeouts or {}
+        self.stages: dict[str, tuple[Callable[[], Awaitable[Any]], list[str]]] = {}
+        self.tasks: dict[str, asyncio.Task] = {}
+        self.results: dict[str, Any] = {}
+        self.timings: dict[str, float] = {}
+
+    def add(
+        self,
+        name: str,
+        fn: Callable[[], Awaitable[Any]],
+        after: Optional[list[str]] = None,
+    ):
+        self.stages[name] = (fn, [dep for dep in after or [] if dep in self.stages])
+
+    def get_timeout(self, name: str) -> Optional[float]:
+        timeout = self.timeouts.get(name, self.timeouts.get("default"))
+        return timeout if timeout and timeout > 0 else None
+
+    async def wait(self, name: str, timeout: Optional[float] = None) -> Any:
+        # Wait for a running stage; unlike a dependency it keeps running after the timeout
+        task = self.tasks.get(name)
+        if task is None:
+            return None
+
+        done, _ = await asyncio.wait([task], timeout=timeout)
+        return self.results.get(name) if done else None
+
+    async def run(self) -> dict[str, Any]:
+        tasks = self.tasks
+
+        async def run_stage(name, fn, after):
+            if after:
+                await asyncio.gather(
+                    *[tasks[dep] for dep in after], return_exceptions=True
+                )
+
+            start = time.perf_counter()
+            try:
+                self.results[name] = await asyncio.wait_for(
+                    fn(), timeout=self.get_timeout(name)
+                )
+            except asyncio.TimeoutError:
+                log.warning(f"Stage {name} timed out after {self.get_timeout(name)}s")
+                self.results[name] = None
+            finally:
+                self.timings[name] = round((time.perf_counter() - start) * 1000, 2)
+
+        start = time.perf_counter()
+        for name, (fn, after) in self.stages.items():
+            tasks[name] = asyncio.create_task(run_stage(name, fn, after))
+
+        results = await asyncio.gather(*tasks.values(), return_exceptions=True)
+        if self.stages:
+            self.timings["total"] = round((time.perf_counter() - start) * 1000, 2)
+
+        for result in results:
+            if isinstance(result, BaseException):
+                raise result
+
+        return self.results
@@ -243,6 +243,53 @@ def tags_generation_template(
     return template
 
 
+CHAT_TASKS = {
+    "title": (
+        "a concise, 3-5 word title with an emoji summarizing the chat history",
+        '"your concise title here"',
+    ),
+    "tags": (
+        "1-3 broad tags categorizing the main themes of the chat, along with 1-3 more specific subtopic tags",
+        '["tag1", "tag2", "tag3"]',
+    ),
+    "follow_ups": (
+        "3-5 relevant follow-up questions the user might naturally ask next, written from the user's point of view",
+        '["Question 1?", "Question 2?", "Question 3?"]',
+    ),
+}
+
+
+def chat_tasks_generation_template(
+    template: str,
+    messages: list[dict],
+    tasks: list[str],
+    user: Optional[dict] = None,
+) -> str:
+    tasks = [task for task in tasks if task in CHAT_TASKS]
+    template = template.replace(
+        "{{TASKS}}",
+        "\n".join(f'- "{task}": {CHAT_TASKS[task][0]}' for task in tasks),
+    )
+    template = template.replace(
+        "{{OUTPUT_FORMAT}}",
+        "{ " + ", ".join(f'"{task}": {CHAT_TASKS[task][1]}' for task in tasks) + " }",
+    )
+
+    prompt = get_last_user_message(messages)
+    template = replace_prompt_variable(template, prompt)
+    template = replace_messages_variable(template, messages)
+
+    template = prompt_template(
+        template,
+        **(
+            {"user_name": user.get("name"), "user_location": user.get("location")}
+            if user
+            else {}
+        ),
+    )
+    return template
+
+
 def image_prompt_generation_template(
     template: str, messages: list[dict], user: Optional[dict] = None
 ) -> str:
@@ -0,0 +1,209 @@
+import asyncio
+import copy
+import hashlib
+import json
+import logging
+import time
+from collections import OrderedDict
+from typing import Any, Awaitable, Callable, Optional
+
+from open_webui.env import SRC_LOG_LEVELS, REDIS_KEY_PREFIX
+
+log = logging.getLogger(__name__)
+log.setLevel(SRC_LOG_LEVELS["MODELS"])
+
+
+def normalize_task_content(content: Any) -> str:
+    if isinstance(content, list):
+        content = " ".join(
+            item.get("text", "")
+            for item in content
+            if isinstance(item, dict) and item.get("type") == "text"
+        )
+    return " ".join(str(content or "").split())
+
+
+def get_task_cache_key(task: str, model_id: str, template: str, content: Any) -> str:
+    template_hash = hashlib.sha256(template.encode()).hexdigest()
+    if isinstance(content, list) and all(isinstance(m, dict) for m in content):
+        content = "\n".join(
+            f"{message.get('role', '')}:{normalize_task_content(message.get('content'))}"
+            for message in content
+        )
+    else:
+        content = normalize_task_content(content)
+
+    return hashlib.sha256(
+        json.dumps([task, model_id, template_hash, content]).encode()
+    ).hexdigest()
+
+
+class TaskResultCache:
+    """
+    TTL + LRU cache for task model results.
+
+    Entries are kept in process memory and, when a Redis connection is given,
+    mirrored to Redis so other nodes can reuse them. Concurrent misses for the
+    same key share a single generation.
+
+    Callers get their own copy of a cached value, so mutating a response does
+    not change the cached one.
+
+    Autocompletion results are additionally indexed by prompt prefix: when the
+    user keeps typing along a completion that was already suggested, the rest
+    of that completion is reused instead of asking the task model again.
+    """
+
+    def __init__(
+        self,
+        ttl: int = 600,
+        max_size: int = 1000,
+        redis_key_prefix: str = f"{REDIS_KEY_PREFIX}:task_cache",
+        max_prefixes_per_group: int = 8,
+    ):
+        self.ttl = ttl
+        self.max_size = max_size
+        self.redis_key_prefix = redis_key_prefix
+        self.max_prefixes_per_group = max_prefixes_per_group
+
+        self._entries: OrderedDict[str, tuple[float, Any]] = OrderedDict()
+        self._prefixes: OrderedDict[str, list[tuple[float, str, str]]] = OrderedDict()
+        self._inflight: dict[str, asyncio.Task] = {}
+
+        self.hits = 0
+        self.misses = 0
+        self.coalesced = 0
+        self.prefix_hits = 0
+
+    def _is_fresh(self, stored_at: float) -> bool:
+        return not self.ttl or time.monotonic() - stored_at < self.ttl
+
+    async def get(self, key: str, redis=None) -> Optional[Any]:
+        entry = self._entries.get(key)
+        if entry is not None:
+            if self._is_fresh(entry[0]):
+                self._entries.move_to_end(key)
+                return copy.deepcopy(entry[1])
+            del self._entries[key]
+
+        if redis is not None:
+            try:
+                value = await redis.get(f"{self.redis_key_prefix}:{key}")
+                if value is not None:
+                    value = json.loads(value)
+                    self._set_local(key, copy.deepcopy(value))
+                    return value
+            except Exception as e:
+                log.debug(f"Task result cache Redis lookup failed: {e}")
+
+        return None
+
+    def _set_local(self, key: str, value: Any):
+        self._entries[key] = (time.monotonic(), value)
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.max_size:
+            self._entries.popitem(last=False)
+
+    async def set(self, key: str, value: Any, redis=None):
+        self._set_local(key, copy.deepcopy(value))
+
+        if redis is not None:
+            try:
+                await redis.set(
+                    f"{self.redis_key_prefix}:{key}",
+                    json.dumps(value),
+                    ex=self.ttl or None,
+                )
+            except Exception as e:
+                log.debug(f"Task result cache Redis write failed: {e}")
+
+    async def get_or_generate(
+        self,
+        key: str,
+        generate: Callable[[], Awaitable[Any]],
+        redis=None,
+    ) -> Any:
+        value = await self.get(key, redis=redis)
+        if value is not None:
+            self.hits += 1
+            return value
+
+        task = self._inflight.get(key)
+        if task is not None:
+            self.coalesced += 1
+            return copy.deepcopy(await asyncio.shield(task))
+
+        self.misses += 1
+        # The generation runs in its own task, so cancelling the caller that
+        # started it does not cancel it for the callers waiting on it
+        task = asyncio.create_task(self._generate(key, generate, redis))
+        self._inflight[key] = task
+        task.add_done_callback(lambda task: self._generated(key, task))
+        return await asyncio.shield(task)
+
+    async def _generate(
+        self, key: str, generate: Callable[[], Awaitable[Any]], redis=None
+    ) -> Any:
+        value = await generate()
+        # Only plain completion payloads are cached; error responses are not
+        if isinstance(value, dict) and value.get("choices"):
+            await self.set(key, value, redis=redis)
+        return value
+
+    def _generated(self, key: str, task: asyncio.Task):
+        if self._inflight.get(key) is task:
+            del self._inflight[key]
+        # Retrieve the exception so a generation nobody waits for does not log it
+        if not task.cancelled():
+            task.exception()
+
+    def get_prefix_completion(self, group: str, prompt: str) -> Optional[str]:
+        entries = self._prefixes.get(group)
+        if not entries:
+            return None
+
+        for stored_at, cached_prompt, completion in reversed(entries):
+            if not self._is_fresh(stored_at) or not prompt.startswith(cached_prompt):
+                continue
+
+            typed = prompt[len(cached_prompt) :].lstrip()
+            suggestion = completion.lstrip()
+            if suggestion.startswith(typed):
+                remaining = suggestion[len(typed) :]
+                if remaining.strip():
+                    self._prefixes.move_to_end(group)
+                    self.prefix_hits += 1
+                    return remaining
+        return None
+
+    def set_prefix_completion(self, group: str, prompt: str, completion: str):
+        if not completion.strip():
+            return
+
+        entries = [
+            entry
+            for entry in self._prefixes.get(group, [])
+            if self._is_fresh(entry[0]) and entry[1] != prompt
+        ]
+        entries.append((time.monotonic(), prompt, completion))
+        self._prefixes[group] = entries[-self.max_prefixes_per_group :]
+        self._prefixes.move_to_end(group)
+        while len(self._prefixes) > self.max_size:
+            self._prefixes.popitem(last=False)
+
+    def stats(self) -> dict:
+        return {
+            "size": len(self._entries),
+            "prefix_groups": len(self._prefixes),
+            "inflight": len(self._inflight),
+            "hits": self.hits,
+            "misses": self.misses,
+            "coalesced": self.coalesced,
+            "prefix_hits": self.prefix_hits,
+            "ttl": self.ttl,
+            "max_size": self.max_size,
+        }
+
+    def clear(self):
+        self._entries.clear()
+        self._prefixes.clear()
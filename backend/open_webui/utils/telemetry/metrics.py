@@ -8,6 +8,14 @@ Metrics collected:
 
 * http.server.requests (counter)
 * http.server.duration (histogram, milliseconds)
+* webui.retrieval.pending / webui.retrieval.running (gauges, requests)
+* webui.retrieval.rejected (counter, requests rejected by backpressure)
+* webui.tools.inflight (gauge, tool server requests in flight)
+* webui.tools.latency.avg (gauge, milliseconds, average tool server latency)
+* webui.audio.transcriptions.queued / webui.audio.transcriptions.busy (gauges, jobs)
+* webui.audio.transcriptions.realtime_factor (gauge, audio seconds per worker second)
+* webui.audio.speech_cache.hits / webui.audio.speech_cache.misses (counters, sentences)
+* webui.audio.speech_cache.size (gauge, bytes)
 
 Attributes used: http.method, http.route, http.status_code
 
@@ -47,6 +55,8 @@ from open_webui.env import (
 )
 from open_webui.socket.main import get_active_user_ids
 from open_webui.models.users import Users
+from open_webui.retrieval.executor import RETRIEVAL_EXECUTOR
+from open_webui.utils.tools import TOOL_SERVER_CLIENT_POOL
 
 _EXPORT_INTERVAL_MILLIS = 10_000  # 10 seconds
 
@@ -99,6 +109,41 @@ def _build_meter_provider(resource: Resource) -> MeterProvider:
         View(
             instrument_name="webui.users.active",
         ),
+        View(
+            instrument_name="webui.retrieval.pending",
+        ),
+        View(
+            instrument_name="webui.retrieval.running",
+        ),
+        View(
+            instrument_name="webui.retrieval.rejected",
+        ),
+        View(
+            instrument_name="webui.tools.inflight",
+            attribute_keys=["server"],
+        ),
+        View(
+            instrument_name="webui.tools.latency.avg",
+            attribute_keys=["server"],
+        ),
+        View(
+            instrument_name="webui.audio.transcriptions.queued",
+        ),
+        View(
+            instrument_name="webui.audio.transcriptions.busy",
+        ),
+        View(
+            instrument_name="webui.audio.transcriptions.realtime_factor",
+        ),
+        View(
+            instrument_name="webui.audio.speech_cache.hits",
+        ),
+        View(
+            instrument_name="webui.audio.speech_cache.misses",
+        ),
+        View(
+            instrument_name="webui.audio.speech_cache.size",
+        ),
     ]
 
     provider = MeterProvider(
@@ -159,6 +204,125 @@ def setup_metrics(app: FastAPI, resource: Resource) -> None:
         callbacks=[observe_active_users],
     )
 
+    def observe_retrieval(key: str):
+        def callback(
+            options: metrics.CallbackOptions,
+        ) -> Sequence[metrics.Observation]:
+            return [metrics.Observation(value=RETRIEVAL_EXECUTOR.stats()[key])]
+
+        return callback
+
+    meter.create_observable_gauge(
+        name="webui.retrieval.pending",
+        description="Retrieval requests waiting for the shared executor",
+        unit="requests",
+        callbacks=[observe_retrieval("pending")],
+    )
+
+    meter.create_observable_gauge(
+        name="webui.retrieval.running",
+        description="Retrieval requests running on the shared executor",
+        unit="requests",
+        callbacks=[observe_retrieval("running")],
+    )
+
+    # Cumulative since startup, so it is exported as a monotonic counter
+    meter.create_observable_counter(
+        name="webui.retrieval.rejected",
+        description="Retrieval requests rejected because the queue was full",
+        unit="requests",
+        callbacks=[observe_retrieval("rejected")],
+    )
+
+    def observe_tool_servers(key: str):
+        def callback(
+            options: metrics.CallbackOptions,
+        ) -> Sequence[metrics.Observation]:
+            return [
+                metrics.Observation(value=stats[key], attributes={"server": server})
+                for server, stats in TOOL_SERVER_CLIENT_POOL.stats().items()
+            ]
+
+        return callback
+
+    meter.create_observable_gauge(
+        name="webui.tools.inflight",
+        description="Tool server requests in flight",
+        unit="requests",
+        callbacks=[observe_tool_servers("inflight")],
+    )
+
+    meter.create_observable_gauge(
+        name="webui.tools.latency.avg",
+        description="Average tool server request latency",
+        unit="ms",
+        callbacks=[observe_tool_servers("avg_ms")],
+    )
+
+    def observe_transcriptions(key: str):
+        def callback(
+            options: metrics.CallbackOptions,
+        ) -> Sequence[metrics.Observation]:
+            pool = getattr(app.state, "WHISPER_WORKER_POOL", None)
+            if pool is None:
+                return []
+            return [metrics.Observation(value=pool.stats()[key])]
+
+        return callback
+
+    meter.create_observable_gauge(
+        name="webui.audio.transcriptions.queued",
+        description="Transcription jobs waiting for a whisper worker",
+        unit="jobs",
+        callbacks=[observe_transcriptions("queued")],
+    )
+
+    meter.create_observable_gauge(
+        name="webui.audio.transcriptions.busy",
+        description="Whisper workers transcribing a job",
+        unit="jobs",
+        callbacks=[observe_transcriptions("busy")],
+    )
+
+    meter.create_observable_gauge(
+        name="webui.audio.transcriptions.realtime_factor",
+        description="Seconds of audio transcribed per second of whisper worker time",
+        unit="1",
+        callbacks=[observe_transcriptions("realtime_factor")],
+    )
+
+    def observe_speech_cache(key: str):
+        def callback(
+            options: metrics.CallbackOptions,
+        ) -> Sequence[metrics.Observation]:
+            from open_webui.routers.audio import SPEECH_CACHE
+
+            return [metrics.Observation(value=SPEECH_CACHE.stats()[key])]
+
+        return callback
+
+    # Cumulative since startup, so they are exported as monotonic counters
+    meter.create_observable_counter(
+        name="webui.audio.speech_cache.hits",
+        description="Sentences served from the text-to-speech cache",
+        unit="sentences",
+        callbacks=[observe_speech_cache("hits")],
+    )
+
+    meter.create_observable_counter(
+        name="webui.audio.speech_cache.misses",
+        description="Sentences synthesized because they were not cached",
+        unit="sentences",
+        callbacks=[observe_speech_cache("misses")],
+    )
+
+    meter.create_observable_gauge(
+        name="webui.audio.speech_cache.size",
+        description="Total size of the text-to-speech cache",
+        unit="By",
+        callbacks=[observe_speech_cache("size")],
+    )
+
     # FastAPI middleware
     @app.middleware("http")
     async def _metrics_middleware(request: Request, call_next):
@@ -1,7 +1,10 @@
 import inspect
+import hashlib
+import json
 import logging
 import re
 import inspect
+import time
 import aiohttp
 import asyncio
 import yaml
@@ -22,7 +25,10 @@ from typing import (
     Optional,
     Type,
 )
+from collections import OrderedDict
+from contextlib import asynccontextmanager
 from functools import update_wrapper, partial
+from urllib.parse import urlparse
 
 
 from fastapi import Request
@@ -35,11 +41,19 @@ from langchain_core.utils.function_calling import (
 
 from open_webui.models.tools import Tools
 from open_webui.models.users import UserModel
-from open_webui.utils.plugin import load_tool_module_by_id
+from open_webui.utils.plugin import (
+    get_tool_module_from_cache,
+    apply_tool_valves,
+    get_user_valves_from_cache,
+)
+from open_webui.utils.singleflight import singleflight, get_data_flight_key
 from open_webui.env import (
     SRC_LOG_LEVELS,
     AIOHTTP_CLIENT_TIMEOUT_TOOL_SERVER_DATA,
     AIOHTTP_CLIENT_SESSION_TOOL_SERVER_SSL,
+    TOOL_SERVER_SPEC_CACHE_TTL,
+    AIOHTTP_CLIENT_TIMEOUT_TOOL_SERVER,
+    TOOL_SERVER_MAX_CONCURRENCY,
 )
 
 import copy
@@ -137,20 +151,15 @@ def get_tools(
             else:
                 continue
         else:
-            module = request.app.state.TOOLS.get(tool_id, None)
-            if module is None:
-                module, _ = load_tool_module_by_id(tool_id)
-                request.app.state.TOOLS[tool_id] = module
+            module = get_tool_module_from_cache(request, tool)
 
             extra_params["__id__"] = tool_id
 
             # Set valves for the tool
-            if hasattr(module, "valves") and hasattr(module, "Valves"):
-                valves = Tools.get_tool_valves_by_id(tool_id) or {}
-                module.valves = module.Valves(**valves)
+            apply_tool_valves(request, tool, module)
             if hasattr(module, "UserValves"):
-                extra_params["__user__"]["valves"] = module.UserValves(  # type: ignore
-                    **Tools.get_user_valves_by_id_and_user_id(tool_id, user.id)
+                extra_params["__user__"]["valves"] = get_user_valves_from_cache(  # type: ignore
+                    request, "tools", tool_id, module, extra_params["__user__"]
                 )
 
             for spec in tool.specs:
@@ -442,51 +451,209 @@ def convert_openapi_to_tool_payload(openapi_spec):
     return tool_payload
 
 
-async def get_tool_server_data(token: str, url: str) -> Dict[str, Any]:
-    headers = {
-        "Accept": "application/json",
-        "Content-Type": "application/json",
-    }
-    if token:
-        headers["Authorization"] = f"Bearer {token}"
-
-    error = None
-    try:
-        timeout = aiohttp.ClientTimeout(total=AIOHTTP_CLIENT_TIMEOUT_TOOL_SERVER_DATA)
-        async with aiohttp.ClientSession(timeout=timeout, trust_env=True) as session:
-            async with session.get(
-                url, headers=headers, ssl=AIOHTTP_CLIENT_SESSION_TOOL_SERVER_SSL
-            ) as response:
-                if response.status != 200:
-                    error_body = await response.json()
-                    raise Exception(error_body)
-
-                # Check if URL ends with .yaml or .yml to determine format
-                if url.lower().endswith((".yaml", ".yml")):
-                    text_content = await response.text()
-                    res = yaml.safe_load(text_content)
-                else:
-                    res = await response.json()
-    except Exception as err:
-        log.exception(f"Could not fetch tool server spec from {url}")
-        if isinstance(err, dict) and "detail" in err:
-            error = err["detail"]
-        else:
-            error = str(err)
-        raise Exception(error)
-
-    data = {
-        "openapi": res,
-        "info": res.get("info", {}),
-        "specs": convert_openapi_to_tool_payload(res),
-    }
-
-    log.info(f"Fetched data: {data}")
-    return data
-
+class ToolServerSpecCache:
+    """
+    Cache of tool server OpenAPI specs keyed by spec URL and credentials.
+
+    Fresh entries (younger than `ttl` seconds) are served without any request.
+    Stale entries are served immediately as well while a background refresh
+    revalidates them with If-None-Match / If-Modified-Since, so only the very
+    first load of a server waits on the network. Converted tool payloads are
+    memoized by spec content hash, so an unchanged spec is never resolved twice.
+    A server that could not be reached is not retried for `failure_backoff`
+    seconds, whether or not caching is enabled.
+    """
 
+    def __init__(
+        self,
+        ttl: int = 300,
+        max_size: int = 256,
+        max_converted: int = 64,
+        failure_backoff: int = 30,
+    ):
+        self.ttl = ttl
+        self.max_size = max_size
+        self.max_converted = max_converted
+        self.failure_backoff = failure_backoff
+
+        self._entries: OrderedDict[str, dict] = OrderedDict()
+        self._converted: OrderedDict[str, list] = OrderedDict()
+        self._refreshing: dict[str, asyncio.Task] = {}
+        self._failures: dict[str, tuple[float, str]] = {}
+
+        self.hits = 0
+        self.stale_hits = 0
+        self.misses = 0
+        self.revalidated = 0
+
+    @staticmethod
+    def get_key(token: Optional[str], url: str) -> str:
+        return hashlib.sha256(f"{url}\n{token or ''}".encode()).hexdigest()
+
+    def convert(self, spec_hash: str, openapi: dict) -> list:
+        specs = self._converted.get(spec_hash)
+        if specs is None:
+            specs = convert_openapi_to_tool_payload(openapi)
+            self._converted[spec_hash] = specs
+            while len(self._converted) > self.max_converted:
+                self._converted.popitem(last=False)
+        self._converted.move_to_end(spec_hash)
+        return specs
+
+    async def get(
+        self, token: Optional[str], url: str, refresh: bool = False
+    ) -> Dict[str, Any]:
+        key = self.get_key(token, url)
+        entry = self._entries.get(key)
+
+        if entry is not None and self.ttl and not refresh:
+            self._entries.move_to_end(key)
+            if time.monotonic() - entry["fetched_at"] < self.ttl:
+                self.hits += 1
+            else:
+                self.stale_hits += 1
+                self.schedule_refresh(key, token, url)
+            return entry["data"]
+
+        # Do not retry unreachable servers on every call
+        failure = self._failures.get(key)
+        if (
+            failure is not None
+            and not refresh
+            and time.monotonic() - failure[0] < self.failure_backoff
+        ):
+            raise Exception(failure[1])
+
+        self.misses += 1
+        try:
+            data = await self.fetch(key, token, url)
+        except Exception as e:
+            self._failures[key] = (time.monotonic(), str(e))
+            raise
+        self._failures.pop(key, None)
+        return data
+
+    def schedule_refresh(self, key: str, token: Optional[str], url: str):
+        if key in self._refreshing:
+            return
+
+        async def refresh():
+            try:
+                await self.fetch(key, token, url)
+            except Exception as e:
+                log.warning(f"Keeping cached tool server spec for {url}: {e}")
+
+        task = asyncio.create_task(refresh())
+        self._refreshing[key] = task
+        task.add_done_callback(lambda _: self._refreshing.pop(key, None))
+
+    async def fetch(self, key: str, token: Optional[str], url: str) -> Dict[str, Any]:
+        entry = self._entries.get(key)
+
+        headers = {
+            "Accept": "application/json",
+            "Content-Type": "application/json",
+        }
+        if token:
+            headers["Authorization"] = f"Bearer {token}"
+        if entry is not None:
+            if entry.get("etag"):
+                headers["If-None-Match"] = entry["etag"]
+            if entry.get("last_modified"):
+                headers["If-Modified-Since"] = entry["last_modified"]
+
+        error = None
+        try:
+            timeout = aiohttp.ClientTimeout(
+                total=AIOHTTP_CLIENT_TIMEOUT_TOOL_SERVER_DATA
+            )
+            async with aiohttp.ClientSession(
+                timeout=timeout, trust_env=True
+            ) as session:
+                async with session.get(
+                    url, headers=headers, ssl=AIOHTTP_CLIENT_SESSION_TOOL_SERVER_SSL
+                ) as response:
+                    if response.status == 304 and entry is not None:
+                        entry["fetched_at"] = time.monotonic()
+                        self.revalidated += 1
+                        return entry["data"]
+
+                    if response.status != 200:
+                        error_body = await response.json()
+                        raise Exception(error_body)
+
+                    body = await response.read()
+                    etag = response.headers.get("ETag")
+                    last_modified = response.headers.get("Last-Modified")
+
+                    # Check if URL ends with .yaml or .yml to determine format
+                    if url.lower().endswith((".yaml", ".yml")):
+                        res = yaml.safe_load(body.decode(response.charset or "utf-8"))
+                    else:
+                        res = json.loads(body)
+        except Exception as err:
+            log.exception(f"Could not fetch tool server spec from {url}")
+            if isinstance(err, dict) and "detail" in err:
+                error = err["detail"]
+            else:
+                error = str(err)
+            raise Exception(error)
+
+        data = {
+            "openapi": res,
+            "info": res.get("info", {}),
+            "specs": self.convert(hashlib.sha256(body).hexdigest(), res),
+        }
+
+        self._entries[key] = {
+            "etag": etag,
+            "last_modified": last_modified,
+            "fetched_at": time.monotonic(),
+            "data": data,
+        }
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.max_size:
+            self._entries.popitem(last=False)
+
+        log.info(f"Fetched data: {data}")
+        return data
+
+    def stats(self) -> dict:
+        return {
+            "size": len(self._entries),
+            "converted": len(self._converted),
+            "refreshing": len(self._refreshing),
+            "hits": self.hits,
+            "stale_hits": self.stale_hits,
+            "misses": self.misses,
+            "revalidated": self.revalidated,
+            "ttl": self.ttl,
+        }
+
+    def clear(self):
+        self._entries.clear()
+        self._converted.clear()
+        self._failures.clear()
+
+
+TOOL_SERVER_SPEC_CACHE = ToolServerSpecCache(ttl=TOOL_SERVER_SPEC_CACHE_TTL)
+
+
+async def get_tool_server_data(
+    token: str, url: str, refresh: bool = False
+) -> Dict[str, Any]:
+    return await TOOL_SERVER_SPEC_CACHE.get(token, url, refresh=refresh)
+
+
+@singleflight(
+    key=lambda servers, session_token=None, refresh=False: get_data_flight_key(
+        servers, session_token, refresh
+    )
+)
 async def get_tool_servers_data(
-    servers: List[Dict[str, Any]], session_token: Optional[str] = None
+    servers: List[Dict[str, Any]],
+    session_token: Optional[str] = None,
+    refresh: bool = False,
 ) -> List[Dict[str, Any]]:
     # Prepare list of enabled servers along with their original index
     server_entries = []
@@ -509,7 +676,8 @@ async def get_tool_servers_data(
 
     # Create async tasks to fetch data
     tasks = [
-        get_tool_server_data(token, url) for (_, _, url, _, token) in server_entries
+        get_tool_server_data(token, url, refresh=refresh)
+        for (_, _, url, _, token) in server_entries
     ]
 
     # Execute tasks concurrently
@@ -525,7 +693,8 @@ async def get_tool_servers_data(
         openapi_data = response.get("openapi", {})
 
         if info and isinstance(openapi_data, dict):
-            openapi_data["info"] = openapi_data.get("info", {})
+            # Copy before overriding the info, the spec is shared with the cache
+            openapi_data = {**openapi_data, "info": {**openapi_data.get("info", {})}}
 
             if "name" in info:
                 openapi_data["info"]["title"] = info.get("name", "Tool Server")
@@ -546,6 +715,97 @@ async def get_tool_servers_data(
     return results
 
 
+class ToolServerClientPool:
+    """
+    Pooled HTTP clients for tool server calls.
+
+    Each tool server (scheme, host and port) gets one keep-alive
+    `aiohttp.ClientSession` that is reused across tool calls, a cap on
+    concurrent requests and per-server latency counters.
+    """
+
+    def __init__(self, max_concurrency: int = 10, timeout: Optional[int] = 300):
+        self.max_concurrency = max_concurrency
+        self.timeout = timeout
+
+        self._sessions: dict[str, aiohttp.ClientSession] = {}
+        self._semaphores: dict[str, asyncio.Semaphore] = {}
+        self._stats: dict[str, dict] = {}
+
+    @staticmethod
+    def get_server_key(url: str) -> str:
+        parsed = urlparse(url)
+        return f"{parsed.scheme}://{parsed.netloc}"
+
+    def get_session(self, server: str) -> aiohttp.ClientSession:
+        session = self._sessions.get(server)
+        if session is None or session.closed:
+            session = aiohttp.ClientSession(
+                trust_env=True,
+                timeout=aiohttp.ClientTimeout(total=self.timeout),
+                connector=aiohttp.TCPConnector(limit_per_host=self.max_concurrency),
+            )
+            self._sessions[server] = session
+            self._semaphores.setdefault(server, asyncio.Semaphore(self.max_concurrency))
+        return session
+
+    @asynccontextmanager
+    async def request(self, method: str, url: str, **kwargs):
+        server = self.get_server_key(url)
+        session = self.get_session(server)
+        stats = self._stats.setdefault(
+            server,
+            {"calls": 0, "errors": 0, "inflight": 0, "total_ms": 0.0, "max_ms": 0.0},
+        )
+
+        async with self._semaphores[server]:
+            stats["inflight"] += 1
+            start = time.perf_counter()
+            failed = True
+            try:
+                async with session.request(
+                    method, url, ssl=AIOHTTP_CLIENT_SESSION_TOOL_SERVER_SSL, **kwargs
+                ) as response:
+                    yield response
+                    failed = response.status >= 400
+            finally:
+                elapsed = (time.perf_counter() - start) * 1000
+                stats["inflight"] -= 1
+                stats["calls"] += 1
+                stats["errors"] += int(failed)
+                stats["total_ms"] += elapsed
+                stats["max_ms"] = max(stats["max_ms"], elapsed)
+
+    def stats(self) -> dict:
+        return {
+            server: {
+                "calls": stats["calls"],
+                "errors": stats["errors"],
+                "inflight": stats["inflight"],
+                "avg_ms": (
+                    round(stats["total_ms"] / stats["calls"], 2)
+                    if stats["calls"]
+                    else 0.0
+                ),
+                "max_ms": round(stats["max_ms"], 2),
+            }
+            for server, stats in self._stats.items()
+        }
+
+    async def close(self):
+        sessions = list(self._sessions.values())
+        self._sessions.clear()
+        for session in sessions:
+            if not session.closed:
+                await session.close()
+
+
+TOOL_SERVER_CLIENT_POOL = ToolServerClientPool(
+    max_concurrency=TOOL_SERVER_MAX_CONCURRENCY,
+    timeout=AIOHTTP_CLIENT_TIMEOUT_TOOL_SERVER,
+)
+
+
 async def execute_tool_server(
     token: str, url: str, name: str, params: Dict[str, Any], server_data: Dict[str, Any]
 ) -> Any:
@@ -613,30 +873,18 @@ async def execute_tool_server(
         if token:
             headers["Authorization"] = f"Bearer {token}"
 
-        async with aiohttp.ClientSession(trust_env=True) as session:
-            request_method = getattr(session, http_method.lower())
-
-            if http_method in ["post", "put", "patch"]:
-                async with request_method(
-                    final_url,
-                    json=body_params,
-                    headers=headers,
-                    ssl=AIOHTTP_CLIENT_SESSION_TOOL_SERVER_SSL,
-                ) as response:
-                    if response.status >= 400:
-                        text = await response.text()
-                        raise Exception(f"HTTP error {response.status}: {text}")
-                    return await response.json()
-            else:
-                async with request_method(
-                    final_url,
-                    headers=headers,
-                    ssl=AIOHTTP_CLIENT_SESSION_TOOL_SERVER_SSL,
-                ) as response:
-                    if response.status >= 400:
-                        text = await response.text()
-                        raise Exception(f"HTTP error {response.status}: {text}")
-                    return await response.json()
+        async with TOOL_SERVER_CLIENT_POOL.request(
+            http_method.upper(),
+            final_url,
+            headers=headers,
+            **(
+                {"json": body_params} if http_method in ["post", "put", "patch"] else {}
+            ),
+        ) as response:
+            if response.status >= 400:
+                text = await response.text()
+                raise Exception(f"HTTP error {response.status}: {text}")
+            return await response.json()
 
     except Exception as err:
         error = str(err)
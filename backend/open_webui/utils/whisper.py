@@ -0,0 +1,346 @@
+import logging
+import multiprocessing
+import os
+import threading
+import time
+from collections import OrderedDict, deque
+from typing import Callable, Optional
+
+from open_webui.env import SRC_LOG_LEVELS
+
+log = logging.getLogger(__name__)
+log.setLevel(SRC_LOG_LEVELS["AUDIO"])
+
+
+class WhisperWorkerPoolBusyError(Exception):
+    pass
+
+
+def load_whisper_model(faster_whisper_kwargs: dict):
+    from faster_whisper import WhisperModel
+
+    try:
+        return WhisperModel(**faster_whisper_kwargs)
+    except Exception:
+        log.warning(
+            "WhisperModel initialization failed, attempting download with local_files_only=False"
+        )
+        return WhisperModel(**{**faster_whisper_kwargs, "local_files_only": False})
+
+
+def get_segment_data(segment) -> dict:
+    return {
+        "start": round(segment.start, 2),
+        "end": round(segment.end, 2),
+        "text": segment.text,
+    }
+
+
+def get_transcription_info_data(info) -> dict:
+    return {
+        "language": info.language,
+        "language_probability": info.language_probability,
+        "duration": info.duration,
+    }
+
+
+def whisper_worker(conn, faster_whisper_kwargs: dict):
+    # Runs in a spawned process that keeps its own model for its whole lifetime
+    try:
+        model = load_whisper_model(faster_whisper_kwargs)
+    except Exception as e:
+        conn.send(("error", f"Failed to load whisper model: {e}"))
+        return
+    conn.send(("ready", None))
+
+    while True:
+        try:
+            job = conn.recv()
+        except EOFError:
+            break
+        if job is None:
+            break
+
+        file_path, options = job
+        try:
+            segments, info = model.transcribe(file_path, **options)
+            conn.send(("info", get_transcription_info_data(info)))
+            # Segments are decoded lazily, send each one as soon as it is ready
+            for segment in segments:
+                conn.send(("segment", get_segment_data(segment)))
+            conn.send(("done", None))
+        except Exception as e:
+            conn.send(("error", str(e)))
+
+
+class WhisperJob:
+    def __init__(
+        self,
+        file_path: str,
+        options: dict,
+        on_segment: Optional[Callable[[dict], None]] = None,
+    ):
+        self.file_path = file_path
+        self.options = options
+        self.on_segment = on_segment
+
+        self.queued_at = time.perf_counter()
+        self.done = threading.Event()
+        self.segments: list[dict] = []
+        self.info: dict = {}
+        self.error: Optional[Exception] = None
+
+
+class WhisperWorkerPool:
+    """
+    Pool of worker processes that each load their own faster-whisper model,
+    so concurrent transcriptions don't serialize on one shared model.
+
+    Jobs wait in per-user queues that are served round-robin, so a user
+    uploading many recordings can't starve everyone else, and every segment is
+    passed to the job's `on_segment` callback as soon as a worker decodes it.
+    A worker that crashes is restarted for the next job.
+    """
+
+    def __init__(
+        self,
+        faster_whisper_kwargs: dict,
+        size: int,
+        cpu_threads: int = 0,
+        max_queue_size: int = 64,
+    ):
+        self.size = size
+        self.max_queue_size = max_queue_size
+        self.faster_whisper_kwargs = {
+            **faster_whisper_kwargs,
+            # Pin each worker to its share of the cores instead of oversubscribing them
+            "cpu_threads": cpu_threads or max(1, (os.cpu_count() or 1) // size),
+        }
+
+        self._context = multiprocessing.get_context("spawn")
+        self._condition = threading.Condition()
+        # user_id -> queued jobs, rotated to the end every time one is taken
+        self._queues: OrderedDict[str, deque] = OrderedDict()
+        self._processes: list = [None] * size
+        self._closed = False
+
+        self.queued = 0
+        self.busy = 0
+        self.completed = 0
+        self.failed = 0
+        self.rejected = 0
+        self.restarts = 0
+        self.wait_time_total = 0.0
+        self.audio_seconds = 0.0
+        self.processing_seconds = 0.0
+
+        for index in range(size):
+            threading.Thread(
+                target=self._run_worker,
+                args=(index,),
+                name=f"whisper-worker-{index}",
+                daemon=True,
+            ).start()
+
+    @property
+    def model(self) -> str:
+        return self.faster_whisper_kwargs.get("model_size_or_path")
+
+    def transcribe(
+        self,
+        file_path: str,
+        options: dict,
+        user_id: str = "",
+        on_segment: Optional[Callable[[dict], None]] = None,
+    ) -> tuple[list[dict], dict]:
+        """
+        Queues `file_path` for transcription and blocks until a worker has
+        finished it. Returns the segments and the transcription info.
+        """
+        job = WhisperJob(file_path, options, on_segment)
+
+        with self._condition:
+            if self._closed:
+                raise RuntimeError("Whisper worker pool is shut down")
+            if self.queued >= self.max_queue_size:
+                self.rejected += 1
+                raise WhisperWorkerPoolBusyError(
+                    "Transcription is at capacity, please try again shortly."
+                )
+
+            self._queues.setdefault(user_id, deque()).append(job)
+            self.queued += 1
+            self._condition.notify()
+
+        job.done.wait()
+        if job.error is not None:
+            raise job.error
+        return job.segments, job.info
+
+    def _next_job(self) -> Optional[WhisperJob]:
+        with self._condition:
+            while not self._queues and not self._closed:
+                self._condition.wait()
+            if self._closed:
+                return None
+
+            user_id, jobs = next(iter(self._queues.items()))
+            job = jobs.popleft()
+            del self._queues[user_id]
+            if jobs:
+                self._queues[user_id] = jobs
+
+            self.queued -= 1
+            self.busy += 1
+            self.wait_time_total += time.perf_counter() - job.queued_at
+            return job
+
+    def _start_process(self, index: int):
+        parent_conn, child_conn = self._context.Pipe()
+        process = self._context.Process(
+            target=whisper_worker,
+            args=(child_conn, self.faster_whisper_kwargs),
+            name=f"whisper-worker-{index}",
+            daemon=True,
+        )
+        process.start()
+        child_conn.close()
+
+        try:
+            status, detail = parent_conn.recv()
+        except EOFError:
+            # e.g. killed for running out of memory while loading the model
+            process.join(timeout=5)
+            parent_conn.close()
+            raise RuntimeError(
+                f"Whisper worker {index} exited while loading the model "
+                f"(exit code {process.exitcode})"
+            )
+        if status != "ready":
+            process.join(timeout=5)
+            raise RuntimeError(detail)
+
+        self._processes[index] = process
+        return process, parent_conn
+
+    def _stop_process(self, index: int, conn):
+        process = self._processes[index]
+        self._processes[index] = None
+        if process is None:
+            return
+
+        try:
+            conn.send(None)
+        except Exception:
+            pass
+        process.join(timeout=5)
+        if process.is_alive():
+            process.terminate()
+
+    def _run_job(self, job: WhisperJob, conn):
+        conn.send((job.file_path, job.options))
+        while True:
+            kind, data = conn.recv()
+            if kind == "info":
+                job.info = data
+            elif kind == "segment":
+                job.segments.append(data)
+                if job.on_segment is not None:
+                    try:
+                        job.on_segment(data)
+                    except Exception as e:
+                        log.debug(f"Error in transcription segment callback: {e}")
+            elif kind == "done":
+                return
+            else:
+                raise RuntimeError(data)
+
+    def _run_worker(self, index: int):
+        process, conn = None, None
+        try:
+            while True:
+                job = self._next_job()
+                if job is None:
+                    break
+
+                started_at = time.perf_counter()
+                finished = False
+                try:
+                    if process is None or not process.is_alive():
+                        process, conn = self._start_process(index)
+                    self._run_job(job, conn)
+                    finished = True
+                except (EOFError, OSError):
+                    try:
+                        self._stop_process(index, conn)
+                    except Exception as e:
+                        log.debug(f"Error stopping whisper worker {index}: {e}")
+                    exitcode = process.exitcode if process is not None else None
+                    message = f"Whisper worker {index} exited unexpectedly (exit code {exitcode})"
+                    log.warning(message)
+                    job.error = RuntimeError(message)
+                    self.restarts += 1
+                    process = None
+                except Exception as e:
+                    log.warning(f"Whisper worker {index} failed a job: {e}")
+                    job.error = e
+                finally:
+                    # Never report an unfinished job as an empty transcript
+                    if not finished and job.error is None:
+                        job.error = RuntimeError("Transcription did not complete")
+                    with self._condition:
+                        self.busy -= 1
+                        if job.error is None:
+                            self.completed += 1
+                            self.audio_seconds += job.info.get("duration") or 0
+                            self.processing_seconds += time.perf_counter() - started_at
+                        else:
+                            self.failed += 1
+                    job.done.set()
+        finally:
+            if process is not None:
+                self._stop_process(index, conn)
+
+    def stats(self) -> dict:
+        return {
+            "workers": self.size,
+            "alive": sum(
+                1
+                for process in self._processes
+                if process is not None and process.is_alive()
+            ),
+            "busy": self.busy,
+            "queued": self.queued,
+            "users": len(self._queues),
+            "completed": self.completed,
+            "failed": self.failed,
+            "rejected": self.rejected,
+            "restarts": self.restarts,
+            "avg_wait_ms": (
+                round(self.wait_time_total * 1000 / (self.completed + self.failed), 2)
+                if self.completed + self.failed
+                else 0.0
+            ),
+            "audio_seconds": round(self.audio_seconds, 2),
+            "processing_seconds": round(self.processing_seconds, 2),
+            # Seconds of audio transcribed per second of worker time
+            "realtime_factor": (
+                round(self.audio_seconds / self.processing_seconds, 2)
+                if self.processing_seconds
+                else 0.0
+            ),
+            "max_queue_size": self.max_queue_size,
+        }
+
+    def shutdown(self):
+        """Stops the workers once their current jobs finish and fails queued jobs."""
+        with self._condition:
+            self._closed = True
+            pending = [job for jobs in self._queues.values() for job in jobs]
+            self._queues.clear()
+            self.queued = 0
+            self._condition.notify_all()
+
+        for job in pending:
+            job.error = RuntimeError("Whisper worker pool was shut down")
+            job.done.set()